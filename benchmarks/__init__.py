@@ -0,0 +1,13 @@
+# --
+# Copyright (c) 2014-2026 Net-ng.
+# All rights reserved.
+#
+# This software is licensed under the BSD License, as described in
+# the file LICENSE.txt, which you should have received as part of
+# this distribution.
+# --
+
+"""Performance benchmarks of the configuration parser.
+
+Run them with ``python -m benchmarks`` from the root of the repository.
+"""
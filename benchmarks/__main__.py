@@ -0,0 +1,106 @@
+# --
+# Copyright (c) 2014-2026 Net-ng.
+# All rights reserved.
+#
+# This software is licensed under the BSD License, as described in
+# the file LICENSE.txt, which you should have received as part of
+# this distribution.
+# --
+
+"""Command line entry point of the benchmarks.
+
+Example:
+    python -m benchmarks --width 20 --depth 3 --many 100 --repeat 10
+
+    python -m benchmarks --repeat 20 --save baseline.json
+    python -m benchmarks --compare baseline.json --threshold 0.1
+"""
+
+import sys
+import argparse
+
+from . import suite, generator, regression
+
+# Command line options forwarded to the configuration generator
+GENERATOR_OPTIONS = ('width', 'sections', 'depth', 'list_length', 'lists', 'interpolations', 'many', 'seed')
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='Configuration parser benchmarks')
+
+    group = parser.add_argument_group('generated configuration')
+    group.add_argument('--width', type=int, default=10, help='parameters per section')
+    group.add_argument('--sections', type=int, default=4, help='sub-sections per section')
+    group.add_argument('--depth', type=int, default=3, help='nested sections levels')
+    group.add_argument('--list-length', type=int, default=3, help='elements of the list values')
+    group.add_argument('--lists', type=float, default=0.2, help='ratio of list values')
+    group.add_argument('--interpolations', type=float, default=0.1, help='ratio of values with a variable reference')
+    group.add_argument('--many', type=int, default=10, help='sections validated by a `__many__` specification')
+    group.add_argument('--seed', type=int, default=0)
+
+    group = parser.add_argument_group('regression gate')
+    group.add_argument('--save', metavar='FILE', help='save the results as JSON')
+    group.add_argument(
+        '--compare',
+        metavar='FILE',
+        help='compare the results against a saved baseline, generating the same configuration as the baseline',
+    )
+    group.add_argument(
+        '--threshold', type=float, default=0.1, help='relative slowdown allowed before failing (default: 0.1)'
+    )
+
+    parser.add_argument('-r', '--repeat', type=int, default=5, help='runs of each benchmark')
+    parser.add_argument(
+        'benchmarks', nargs='*', help='benchmarks to run, among {} (all by default)'.format(', '.join(suite.BENCHMARKS))
+    )
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = create_parser()
+    args = parser.parse_args(argv)
+
+    unknown = set(args.benchmarks) - set(suite.BENCHMARKS)
+    if unknown:
+        parser.error('unknown benchmarks: {}'.format(', '.join(sorted(unknown))))
+
+    baseline = regression.load(args.compare) if args.compare else None
+    options = baseline['generator'] if baseline else {name: getattr(args, name) for name in GENERATOR_OPTIONS}
+
+    synthetic = generator.generate(**options)
+    print(synthetic)
+    print()
+
+    print(
+        '{:<16} {:>12} {:>12} {:>16} {:>16}'.format('benchmark', 'best (ms)', 'median (ms)', 'lines/s', 'parameters/s')
+    )
+    results = suite.run(synthetic, args.repeat, args.benchmarks)
+    for result in results:
+        print(
+            '{:<16} {:>12.3f} {:>12.3f} {:>16,.0f} {:>16,.0f}'.format(
+                result.name,
+                result.best * 1000,
+                result.median * 1000,
+                result.lines_per_second,
+                result.parameters_per_second,
+            )
+        )
+
+    if args.save:
+        regression.save(args.save, results, options)
+
+    status = 0
+    if baseline:
+        print()
+        print('Compared to {} ({}):'.format(args.compare, baseline['environment']['date']))
+
+        for name, change, regressed in regression.compare(baseline, results, args.threshold):
+            print('{:<16} {:>+8.1%}{}'.format(name, change, '  REGRESSION' if regressed else ''))
+            status |= regressed
+
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,66 @@
+# --
+# Copyright (c) 2014-2026 Net-ng.
+# All rights reserved.
+#
+# This software is licensed under the BSD License, as described in
+# the file LICENSE.txt, which you should have received as part of
+# this distribution.
+# --
+
+"""Benchmark of the batch validation.
+
+Validates copies of a synthetic configuration against its specification with
+``validate_many()`` and reports the wall time and the throughput for each number
+of worker processes, ``0`` being the validation in the current process.
+
+Example:
+    python -m benchmarks.batch --configs 200 --workers 0 1 2 4 8
+"""
+
+import time
+import argparse
+
+from nagare.config import config_from_string
+from nagare.config_batch import validate_many
+
+from .generator import generate
+
+
+def measure(nb_configs: int, workers: int, chunksize: int) -> float:
+    """Time the validation of a batch of configurations.
+
+    Args:
+        nb_configs: Number of configurations
+        workers: Number of worker processes
+        chunksize: Number of configurations sent at once to a worker
+
+    Returns:
+        The wall time, in seconds
+    """
+    synthetic = generate()
+    spec = config_from_string(synthetic.spec)
+    configs = [(i, config_from_string(synthetic.config).interpolate()) for i in range(nb_configs)]
+
+    t0 = time.perf_counter()
+    for _ in validate_many(configs, spec, workers, chunksize):
+        pass
+
+    return time.perf_counter() - t0
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.batch', description='Batch validation')
+    parser.add_argument('-n', '--configs', type=int, default=200, help='number of configurations')
+    parser.add_argument('-w', '--workers', type=int, nargs='+', default=[0, 1, 2, 4], help='numbers of workers')
+    parser.add_argument('-c', '--chunksize', type=int, default=4, help='configurations sent at once to a worker')
+    args = parser.parse_args(argv)
+
+    print('{:>8} {:>12} {:>12}'.format('workers', 'time (ms)', 'configs/s'))
+
+    for workers in args.workers:
+        timing = measure(args.configs, workers, args.chunksize)
+        print('{:>8} {:>12.1f} {:>12.1f}'.format(workers, timing * 1000, args.configs / timing))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+# --
+# Copyright (c) 2014-2026 Net-ng.
+# All rights reserved.
+#
+# This software is licensed under the BSD License, as described in
+# the file LICENSE.txt, which you should have received as part of
+# this distribution.
+# --
+
+"""Benchmark of the big multi-line values.
+
+Parses configurations embedding a multi-line value of growing size (like a
+certificate bundle, a SQL script or a template) and reports the best time of
+``config_from_string()``, ``config_from_file()`` and of the memory mapped
+``config_from_file(..., mapped=True)``, whose value is only decoded on its first
+read, also reported.
+
+Example:
+    python -m benchmarks.blobs --sizes 1 4 16 --repeat 5
+"""
+
+import os
+import time
+import argparse
+import tempfile
+from typing import Any, Callable
+
+from nagare.config import config_from_file, config_from_string
+
+# A line of the multi-line value
+LINE = 'SELECT id, name, "value" FROM parameters WHERE section = 42;  -- 64 bytes\n'
+
+
+def best(operation: Callable[[], Any], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        operation()
+        timings.append(time.perf_counter() - t0)
+
+    return min(timings)
+
+
+def measure(size: int, repeat: int) -> tuple[float, float, float, float]:
+    """Time the parsing of a configuration embedding a multi-line value.
+
+    Args:
+        size: Size of the multi-line value, in MiB
+        repeat: Number of runs of each operation
+
+    Returns:
+        Tuple of (string, file, mapped file, first read of the mapped value) best times, in seconds
+    """
+    blob = LINE * (size * 1024 * 1024 // len(LINE))
+    config = '[database]\nhost = localhost\nscript = """\n{}"""\nport = 5432\n'.format(blob)
+
+    with tempfile.NamedTemporaryFile('w', suffix='.cfg', delete=False) as f:
+        f.write(config)
+
+    try:
+        from_string = best(lambda: config_from_string(config), repeat)
+        from_file = best(lambda: config_from_file(f.name), repeat)
+        mapped = best(lambda: config_from_file(f.name, mapped=True), repeat)
+
+        sections = [config_from_file(f.name, mapped=True)['database'] for _ in range(repeat)]
+        read = best(lambda: sections.pop()['script'], repeat)
+    finally:
+        os.remove(f.name)
+
+    return from_string, from_file, mapped, read
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.blobs', description='Big multi-line values parsing')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1, 4, 16], help='sizes of the value, in MiB')
+    parser.add_argument('-r', '--repeat', type=int, default=5, help='runs of each operation')
+    args = parser.parse_args(argv)
+
+    print('{:>10} {:>12} {:>12} {:>12} {:>12}'.format('size (MiB)', 'string (ms)', 'file', 'mapped', 'first read'))
+
+    for size in args.sizes:
+        timings = measure(size, args.repeat)
+        print('{:>10} {:>12.1f} {:>12.1f} {:>12.1f} {:>12.1f}'.format(size, *(timing * 1000 for timing in timings)))
+
+
+if __name__ == '__main__':
+    main()
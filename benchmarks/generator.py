@@ -0,0 +1,227 @@
+# --
+# Copyright (c) 2014-2026 Net-ng.
+# All rights reserved.
+#
+# This software is licensed under the BSD License, as described in
+# the file LICENSE.txt, which you should have received as part of
+# this distribution.
+# --
+
+"""Deterministic generator of synthetic configurations and their specifications.
+
+Example:
+    from benchmarks.generator import generate
+
+    synthetic = generate(width=20, depth=2, many=100)
+    config = config_from_string(synthetic.config)
+    spec = config_from_string(synthetic.spec)
+"""
+
+import random
+
+WORDS = (
+    'alpha',
+    'bravo',
+    'charlie',
+    'delta',
+    'echo',
+    'foxtrot',
+    'golf',
+    'hotel',
+    'india',
+    'juliett',
+    'kilo',
+    'lima',
+    'mike',
+    'november',
+    'oscar',
+    'papa',
+)
+
+
+class Synthetic:
+    """A generated configuration with its specification.
+
+    Attributes:
+        config: Text of the configuration
+        spec: Text of the specification
+        nb_lines: Number of lines of the configuration
+        nb_parameters: Number of parameters of the configuration
+        nb_sections: Number of sections of the configuration
+        filename: Path of the configuration once written into a file
+    """
+
+    def __init__(self, config: list[str], spec: list[str], nb_parameters: int, nb_sections: int) -> None:
+        """Initialize a generated configuration.
+
+        Args:
+            config: Lines of the configuration
+            spec: Lines of the specification
+            nb_parameters: Number of parameters of the configuration
+            nb_sections: Number of sections of the configuration
+        """
+        self.config = '\n'.join(config) + '\n'
+        self.spec = '\n'.join(spec) + '\n'
+        self.nb_lines = len(config)
+        self.nb_parameters = nb_parameters
+        self.nb_sections = nb_sections
+        self.filename = ''
+
+    def __repr__(self) -> str:
+        return '<Synthetic {} lines, {} parameters, {} sections>'.format(
+            self.nb_lines, self.nb_parameters, self.nb_sections
+        )
+
+
+class Generator:
+    """Configuration generator.
+
+    Args:
+        width: Number of parameters per section
+        sections: Number of sub-sections per section
+        depth: Number of nested sections levels
+        list_length: Number of elements of the list values
+        lists: Ratio of the parameters with a list value
+        interpolations: Ratio of the parameters with a variable reference
+        many: Number of sections validated by a ``__many__`` specification
+        seed: Seed of the random values
+    """
+
+    def __init__(
+        self,
+        width: int = 10,
+        sections: int = 4,
+        depth: int = 3,
+        list_length: int = 3,
+        lists: float = 0.2,
+        interpolations: float = 0.1,
+        many: int = 10,
+        seed: int = 0,
+    ) -> None:
+        """Initialize the generator parameters."""
+        self.width = width
+        self.sections = sections
+        self.depth = depth
+        self.list_length = list_length
+        self.lists = lists
+        self.interpolations = interpolations
+        self.many = many
+        self.random = random.Random(seed)  # noqa: S311
+
+        # Kind of value of each parameter, the same for all the sections
+        self.kinds = [self.random.random() for _ in range(width)]
+
+        self.config: list[str] = []
+        self.spec: list[str] = []
+        self.nb_parameters = self.nb_sections = 0
+
+    def word(self) -> str:
+        return self.random.choice(WORDS)
+
+    def parameters(self, with_spec: bool = True) -> None:
+        """Generate the parameters of a section.
+
+        Args:
+            with_spec: Generate the specification of the parameters too
+        """
+        for i in range(self.width):
+            name = 'param{}'.format(i)
+            kind = self.kinds[i]
+
+            if kind < self.lists:
+                value = ', '.join('"{} {}"'.format(self.word(), n) for n in range(self.list_length))
+                spec = 'string_list(min=1)'
+            elif kind < self.lists + self.interpolations:
+                value = '${{root}}-{}'.format(self.word()) if i % 2 else '$root/{}'.format(self.word())
+                spec = 'string'
+            elif i % 2:
+                value = str(self.random.randrange(1000000))
+                spec = 'integer(min=0, max=1000000)'
+            else:
+                value = self.word()
+                spec = 'string(min_len=1)'
+
+            self.config.append('{} = {}'.format(name, value))
+            if with_spec:
+                self.spec.append('{} = {}'.format(name, spec))
+
+        self.nb_parameters += self.width
+
+        if with_spec:
+            # Missing parameter with a default value, to be added by ``merge_defaults()``
+            self.spec.append('extra = integer(default=42)')
+
+    def section(self, level: int, name: str) -> None:
+        """Generate a section and, recursively, its sub-sections.
+
+        Args:
+            level: Nesting level of the section
+            name: Name of the section
+        """
+        header = ('[' * level) + name + (']' * level)
+        self.config.extend(('', header))
+        self.spec.append(header)
+        self.nb_sections += 1
+
+        self.parameters()
+
+        if level < self.depth:
+            for i in range(self.sections):
+                self.section(level + 1, '{}_{}'.format(name, i))
+
+    def generate(self) -> Synthetic:
+        """Generate the configuration and its specification.
+
+        Returns:
+            The generated configuration
+        """
+        self.config.append('root = {}'.format(self.word()))
+        self.spec.append('root = string')
+        self.nb_parameters += 1
+
+        self.parameters()
+
+        for i in range(self.sections):
+            self.section(1, 'section{}'.format(i))
+
+        if self.many:
+            self.config.extend(('', '[tenants]'))
+            self.spec.extend(('[tenants]', '[[__many__]]'))
+            self.nb_sections += 1
+
+            for i in range(self.many):
+                self.config.extend(('', '[[tenant{}]]'.format(i)))
+                self.nb_sections += 1
+                self.parameters(with_spec=(i == 0))
+
+        return Synthetic(self.config, self.spec, self.nb_parameters, self.nb_sections)
+
+
+def generate(
+    width: int = 10,
+    sections: int = 4,
+    depth: int = 3,
+    list_length: int = 3,
+    lists: float = 0.2,
+    interpolations: float = 0.1,
+    many: int = 10,
+    seed: int = 0,
+) -> Synthetic:
+    """Generate a synthetic configuration and its specification.
+
+    The same parameters always generate the same configuration.
+
+    Args:
+        width: Number of parameters per section
+        sections: Number of sub-sections per section
+        depth: Number of nested sections levels
+        list_length: Number of elements of the list values
+        lists: Ratio of the parameters with a list value
+        interpolations: Ratio of the parameters with a variable reference
+        many: Number of sections validated by a ``__many__`` specification
+        seed: Seed of the random values
+
+    Returns:
+        The generated configuration
+    """
+    return Generator(width, sections, depth, list_length, lists, interpolations, many, seed).generate()
@@ -0,0 +1,109 @@
+# --
+# Copyright (c) 2014-2026 Net-ng.
+# All rights reserved.
+#
+# This software is licensed under the BSD License, as described in
+# the file LICENSE.txt, which you should have received as part of
+# this distribution.
+# --
+
+"""Memory footprint benchmark of the configuration loading.
+
+Loads generated configurations of growing size (``config_from_file()`` +
+``interpolate()`` + ``merge_defaults()`` + ``validate()``) under ``tracemalloc``
+and reports the peak allocation, the memory retained by the loaded configuration,
+its deep size as computed by ``Section.memory_report()`` and the size of its
+source map.
+
+Example:
+    python -m benchmarks.memory --sizes 10 100 1000 10000
+"""
+
+import gc
+import os
+import argparse
+import tempfile
+import tracemalloc
+
+from nagare.config import Section, SourceMap, MemoryReport, config_from_file, config_from_string
+
+from .generator import Synthetic, generate
+
+
+def load(filename: str, spec: Section) -> Section:
+    return config_from_file(filename).interpolate().merge_defaults(spec).validate(spec)
+
+
+def measure(synthetic: Synthetic) -> tuple[int, int, MemoryReport, int]:
+    """Measure the memory used to load a generated configuration.
+
+    Args:
+        synthetic: The generated configuration
+
+    Returns:
+        Tuple of (peak allocation, retained size, deep size report, source map size), in bytes
+    """
+    spec = config_from_string(synthetic.spec)
+
+    with tempfile.NamedTemporaryFile('w', suffix='.cfg', delete=False) as f:
+        f.write(synthetic.config)
+
+    try:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            start, _ = tracemalloc.get_traced_memory()
+
+            config = load(f.name, spec)
+            gc.collect()
+
+            retained, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        source_map = SourceMap()
+        config_from_file(f.name, source_map=source_map)
+    finally:
+        os.remove(f.name)
+
+    return peak - start, retained - start, config.memory_report(), source_map.nbytes
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.memory', description='Configuration memory footprint')
+    parser.add_argument(
+        '--sizes',
+        type=int,
+        nargs='+',
+        default=[10, 100, 1000, 10000],
+        help='numbers of sections validated by a `__many__` specification',
+    )
+    parser.add_argument('--width', type=int, default=10, help='parameters per section')
+    args = parser.parse_args(argv)
+
+    print(
+        '{:>8} {:>8} {:>10} {:>12} {:>12} {:>12} {:>12} {:>12}'.format(
+            'sections', 'lines', 'parameters', 'peak (KiB)', 'retained', 'deep size', 'bytes/param', 'source map'
+        )
+    )
+
+    for size in args.sizes:
+        synthetic = generate(width=args.width, depth=1, many=size)
+        peak, retained, report, source_map = measure(synthetic)
+
+        print(
+            '{:>8} {:>8} {:>10} {:>12.1f} {:>12.1f} {:>12.1f} {:>12.0f} {:>12.1f}'.format(
+                synthetic.nb_sections,
+                synthetic.nb_lines,
+                synthetic.nb_parameters,
+                peak / 1024,
+                retained / 1024,
+                report['total'] / 1024,
+                retained / synthetic.nb_parameters,
+                source_map / 1024,
+            )
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,138 @@
+# --
+# Copyright (c) 2014-2026 Net-ng.
+# All rights reserved.
+#
+# This software is licensed under the BSD License, as described in
+# the file LICENSE.txt, which you should have received as part of
+# this distribution.
+# --
+
+"""Benchmark results storage and comparison against a baseline.
+
+The results are saved as JSON, with the metadata of the environment they were
+measured in. A comparison is noise-aware: the medians of the runs are compared
+and a slowdown is only reported when it's both above the threshold and larger
+than the spread of the runs, measured by their median absolute deviation (MAD).
+
+Example:
+    python -m benchmarks --repeat 20 --save baseline.json
+    # ... change the code ...
+    python -m benchmarks --compare baseline.json --threshold 0.1
+"""
+
+import os
+import sys
+import json
+import time
+import platform
+import subprocess  # noqa: S404
+from typing import Any
+from importlib import metadata
+
+from .suite import Result
+
+# Number of MADs the medians difference must exceed to not be considered as noise
+NOISE_FACTOR = 3
+
+
+def environment() -> dict[str, Any]:
+    """Collect the metadata of the environment the benchmarks run in.
+
+    Returns:
+        Dictionary of the metadata
+    """
+    try:
+        version = metadata.version('nagare-config')
+    except metadata.PackageNotFoundError:
+        version = None
+
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'],  # noqa: S607
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(__file__),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        'date': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'python': sys.version,
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+        'nagare-config': version,
+        'commit': commit,
+    }
+
+
+def save(filename: str, results: list[Result], generator: dict[str, Any]) -> None:
+    """Save benchmark results as JSON.
+
+    Args:
+        filename: Path of the JSON file
+        results: The benchmark results
+        generator: Parameters of the generated configuration
+    """
+    data = {
+        'environment': environment(),
+        'generator': generator,
+        'results': {
+            result.name: {
+                'timings': result.timings,
+                'median': result.median,
+                'mad': result.mad,
+                'nb_lines': result.nb_lines,
+                'nb_parameters': result.nb_parameters,
+            }
+            for result in results
+        },
+    }
+
+    with open(filename, 'w') as f:
+        json.dump(data, f, indent=2)
+
+
+def load(filename: str) -> dict[str, Any]:
+    """Load benchmark results saved by ``save()``.
+
+    Args:
+        filename: Path of the JSON file
+
+    Returns:
+        The saved data
+    """
+    with open(filename) as f:
+        return json.load(f)
+
+
+def compare(baseline: dict[str, Any], results: list[Result], threshold: float) -> list[tuple[str, float, bool]]:
+    """Compare benchmark results against a baseline.
+
+    Args:
+        baseline: Data loaded from the baseline file
+        results: The new benchmark results
+        threshold: Relative slowdown allowed (``0.1`` for 10%)
+
+    Returns:
+        List of ``(benchmark name, relative change of the median, regression)`` tuples.
+        Benchmarks absent from the baseline are ignored
+    """
+    comparisons = []
+
+    for result in results:
+        reference = baseline['results'].get(result.name)
+        if reference is None:
+            continue
+
+        change = result.median / reference['median'] - 1
+        noise = NOISE_FACTOR * (result.mad + reference['mad'])
+        regression = (change > threshold) and ((result.median - reference['median']) > noise)
+
+        comparisons.append((result.name, change, regression))
+
+    return comparisons
@@ -0,0 +1,84 @@
+# --
+# Copyright (c) 2014-2026 Net-ng.
+# All rights reserved.
+#
+# This software is licensed under the BSD License, as described in
+# the file LICENSE.txt, which you should have received as part of
+# this distribution.
+# --
+
+"""Startup time benchmark.
+
+Runs short-lived Python processes and reports the median wall time of each
+scenario, minus the time of an empty interpreter, and the cumulative import time
+of ``nagare.config`` as reported by ``python -X importtime``.
+
+Example:
+    python -m benchmarks.startup --repeat 20
+"""
+
+import sys
+import time
+import argparse
+import statistics
+import subprocess  # noqa: S404
+
+SCENARIOS = {
+    'import': 'import nagare.config',
+    'parse': "from nagare.config import config_from_string; config_from_string('a = 1')",
+    'validate': (
+        'from nagare.config import config_from_string;'
+        "config_from_string('a = 1').validate(config_from_string('a = integer'))"
+    ),
+}
+
+
+def run(code: str, importtime: bool = False) -> tuple[float, int]:
+    """Run a Python process.
+
+    Args:
+        code: Python code to execute
+        importtime: Collect the ``nagare.config`` import time
+
+    Returns:
+        Tuple of (wall time in seconds, cumulative import time of ``nagare.config`` in microseconds)
+    """
+    t0 = time.perf_counter()
+    process = subprocess.run(  # noqa: S603
+        [sys.executable] + (['-X', 'importtime'] if importtime else []) + ['-c', code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    elapsed = time.perf_counter() - t0
+
+    cumulative = 0
+    for line in process.stderr.splitlines():
+        if line.endswith('| nagare.config'):
+            cumulative = int(line.split('|')[1])
+
+    return elapsed, cumulative
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.startup', description='Startup time')
+    parser.add_argument('-r', '--repeat', type=int, default=10, help='runs of each scenario')
+    args = parser.parse_args(argv)
+
+    # Warm up the bytecode cache
+    run(SCENARIOS['validate'])
+
+    empty = statistics.median(run('pass')[0] for _ in range(args.repeat))
+    importtime = statistics.median(run(SCENARIOS['import'], True)[1] for _ in range(args.repeat))
+
+    print('Python startup: {:.1f}ms'.format(empty * 1000))
+    print('nagare.config cumulative import time: {:.1f}ms'.format(importtime / 1000))
+    print()
+
+    for name, code in SCENARIOS.items():
+        elapsed = statistics.median(run(code)[0] for _ in range(args.repeat))
+        print('{:<10} {:>8.1f}ms'.format(name, (elapsed - empty) * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,234 @@
+# --
+# Copyright (c) 2014-2026 Net-ng.
+# All rights reserved.
+#
+# This software is licensed under the BSD License, as described in
+# the file LICENSE.txt, which you should have received as part of
+# this distribution.
+# --
+
+"""Benchmarks of the configuration loading operations.
+
+Each benchmark is a function receiving the generated configuration and returning
+the operation to time. The preparation done by the function itself (parsing,
+interpolation ...) is not timed.
+"""
+
+import os
+import json
+import time
+import tempfile
+import statistics
+from typing import Any, Callable, Optional
+
+from nagare.config import (
+    Section,
+    diff,
+    dumps,
+    loads,
+    config_load,
+    config_from_file,
+    config_from_json,
+    config_from_string,
+)
+
+from .generator import Synthetic
+
+Operation = Callable[[], Any]
+Benchmark = Callable[[Synthetic], Operation]
+
+BENCHMARKS: dict[str, Benchmark] = {}
+
+
+def benchmark(f: Benchmark) -> Benchmark:
+    """Register a benchmark under the name of the function."""
+    BENCHMARKS[f.__name__] = f
+    return f
+
+
+def interpolated(synthetic: Synthetic) -> Section:
+    return config_from_string(synthetic.config).interpolate()
+
+
+@benchmark
+def from_string(synthetic: Synthetic) -> Operation:
+    return lambda: config_from_string(synthetic.config)
+
+
+@benchmark
+def from_file(synthetic: Synthetic) -> Operation:
+    return lambda: config_from_file(synthetic.filename)
+
+
+@benchmark
+def from_file_mapped(synthetic: Synthetic) -> Operation:
+    return lambda: config_from_file(synthetic.filename, mapped=True)
+
+
+@benchmark
+def from_file_only(synthetic: Synthetic) -> Operation:
+    # Only the first top-level section
+    only = list(config_from_string(synthetic.config).sections)[:1]
+    return lambda: config_from_file(synthetic.filename, only=only)
+
+
+@benchmark
+def interpolate(synthetic: Synthetic) -> Operation:
+    return config_from_string(synthetic.config).interpolate
+
+
+@benchmark
+def merge(synthetic: Synthetic) -> Operation:
+    config1 = config_from_string(synthetic.config)
+    config2 = config_from_string(synthetic.config)
+
+    return lambda: config1.merge(config2)
+
+
+@benchmark
+def merge_defaults(synthetic: Synthetic) -> Operation:
+    config = interpolated(synthetic)
+    spec = config_from_string(synthetic.spec)
+
+    return lambda: config.merge_defaults(spec)
+
+
+@benchmark
+def validate(synthetic: Synthetic) -> Operation:
+    spec = config_from_string(synthetic.spec)
+    config = interpolated(synthetic).merge_defaults(spec)
+
+    return lambda: config.validate(spec)
+
+
+@benchmark
+def load_four_passes(synthetic: Synthetic) -> Operation:
+    spec = config_from_string(synthetic.spec)
+    return lambda: config_from_file(synthetic.filename).interpolate().merge_defaults(spec).validate(spec)
+
+
+@benchmark
+def load(synthetic: Synthetic) -> Operation:
+    spec = config_from_string(synthetic.spec)
+    return lambda: config_load(synthetic.filename, spec)
+
+
+@benchmark
+def to_dict(synthetic: Synthetic) -> Operation:
+    return interpolated(synthetic).dict
+
+
+@benchmark
+def binary_dumps(synthetic: Synthetic) -> Operation:
+    config = interpolated(synthetic)
+
+    return lambda: dumps(config)
+
+
+@benchmark
+def binary_loads(synthetic: Synthetic) -> Operation:
+    data = dumps(interpolated(synthetic))
+
+    return lambda: loads(data)
+
+
+@benchmark
+def fingerprint(synthetic: Synthetic) -> Operation:
+    return interpolated(synthetic).fingerprint
+
+
+@benchmark
+def diff_one_value(synthetic: Synthetic) -> Operation:
+    old = interpolated(synthetic)
+    new = loads(dumps(old))
+    old.fingerprint()
+    new.fingerprint()
+
+    # Modify one value of the deepest section
+    section = max(new.walk(), key=lambda names_section: len(names_section[0]))[1]
+    section['modified'] = True
+
+    return lambda: diff(old, new)
+
+
+@benchmark
+def from_json(synthetic: Synthetic) -> Operation:
+    document = json.dumps(interpolated(synthetic).dict())
+
+    return lambda: config_from_json(document)
+
+
+class Result:
+    """Timings of a benchmark.
+
+    Attributes:
+        name: Name of the benchmark
+        timings: Duration, in seconds, of each run
+        nb_lines: Number of lines of the benchmarked configuration
+        nb_parameters: Number of parameters of the benchmarked configuration
+    """
+
+    def __init__(self, name: str, timings: list[float], nb_lines: int, nb_parameters: int) -> None:
+        self.name = name
+        self.timings = timings
+        self.nb_lines = nb_lines
+        self.nb_parameters = nb_parameters
+
+    @property
+    def best(self) -> float:
+        return min(self.timings)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.timings)
+
+    @property
+    def mad(self) -> float:
+        """Median absolute deviation of the timings."""
+        median = self.median
+        return statistics.median(abs(timing - median) for timing in self.timings)
+
+    @property
+    def lines_per_second(self) -> float:
+        return self.nb_lines / self.best
+
+    @property
+    def parameters_per_second(self) -> float:
+        return self.nb_parameters / self.best
+
+
+def run(synthetic: Synthetic, repeat: int = 5, names: Optional[list[str]] = None) -> list[Result]:
+    """Run the benchmarks against a generated configuration.
+
+    Args:
+        synthetic: The generated configuration
+        repeat: Number of runs of each benchmark
+        names: Names of the benchmarks to run (all by default)
+
+    Returns:
+        The results of the benchmarks
+    """
+    results = []
+
+    with tempfile.NamedTemporaryFile('w', suffix='.cfg', delete=False) as f:
+        f.write(synthetic.config)
+
+    try:
+        synthetic.filename = f.name
+
+        for name in names or BENCHMARKS:
+            bench = BENCHMARKS[name]
+
+            timings = []
+            for _ in range(repeat):
+                operation = bench(synthetic)
+
+                t0 = time.perf_counter()
+                operation()
+                timings.append(time.perf_counter() - t0)
+
+            results.append(Result(name, timings, synthetic.nb_lines, synthetic.nb_parameters))
+    finally:
+        os.remove(f.name)
+
+    return results
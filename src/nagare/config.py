@@ -41,31 +41,105 @@ Example:
     db_host = config['database']['host']  # 'localhost'
 """
 
+import io
+import os
 import re
-from typing import Any, Callable, Iterator, Optional, Sequence
+import sys
+import time
+import marshal
+import functools
+from typing import IO, TYPE_CHECKING, Any, TypeVar, Callable, Iterable, Iterator, Optional, Sequence, ContextManager
+from contextlib import nullcontext, contextmanager
 
-from .validate import NO_DEFAULT, Validator
 from .config_exceptions import (  # noqa: F401
     ParseError,
     ConfigError,
     SectionError,
     DirectiveError,
     ParameterError,
+    AggregatedError,
     InterpolationError,
+    SerializationError,
     SpecificationError,
+    ContextualParseError,
 )
+from .config_instrumentation import Timings, Counters, Instrumentation  # noqa: F401
+
+if TYPE_CHECKING:
+    # The validation module is only imported when a validation is done
+    from .validate import Validator
+
+    # The source map module is only imported when the positions are recorded
+    from .config_source import SourceMap
+
+    # The inclusion module is only imported when a fragment is included
+    from .config_include import Inclusion
 
 # Type aliases for better code readability
 ConfigDict = dict[str, Any]
 AncestorNames = tuple[str, ...]
 Ancestors = tuple['Section', ...]
 LineIterator = Iterator[str]
+MemoryReport = dict[str, int]
+Entry = tuple[int, str, ConfigDict]
+Method = TypeVar('Method', bound=Callable[..., Any])
+# Configurations of the files referenced by the interpolated variables, by path
+ReferencedFiles = dict[str, 'Section']
+# Section to complete, its specification, its names and if its sub-sections are to complete too
+Completion = tuple['Section', 'Section', AncestorNames, bool]
 
 # Quote characters used in configuration files
 QUOTES = ('"', "'")
+QUOTES3 = ('"""', "'''")
+
+
+class LazyPattern:
+    """Regular expression compiled on its first use.
+
+    Compiling the regular expressions below takes most of the import time of this
+    module, which is often imported by short-lived processes that don't parse anything.
+
+    Attributes:
+        pattern: Source of the regular expression
+        flags: Compilation flags
+    """
+
+    METHODS = ('match', 'fullmatch', 'search', 'sub', 'subn', 'split', 'findall', 'finditer')
+
+    def __init__(self, pattern: str, flags: int = 0) -> None:
+        """Initialize a not yet compiled regular expression.
+
+        Args:
+            pattern: Source of the regular expression
+            flags: Compilation flags
+        """
+        self.pattern = pattern
+        self.flags = flags
+
+    def __getattr__(self, name: str) -> Any:
+        """Compile the regular expression on the first access to one of its attributes.
+
+        The methods of the compiled regular expression are then stored on this object,
+        so that the next accesses are plain attribute lookups.
+
+        Args:
+            name: Name of the attribute
+
+        Returns:
+            The attribute of the compiled regular expression
+        """
+        if name.startswith('__'):
+            raise AttributeError(name)
+
+        compiled = re.compile(self.pattern, self.flags)
+        for method in self.METHODS:
+            setattr(self, method, getattr(compiled, method))
+
+        return getattr(compiled, name)
+
 
 # Regular expression for parsing list tails (comma-separated values)
-TAIL = re.compile(
+TAIL = LazyPattern(
     r"""
     \s*,\s*                    # Optional whitespace, comma, optional whitespace
     (
@@ -80,7 +154,7 @@ TAIL = re.compile(
 )
 
 # Regular expression for parsing a value or a list of values
-VALUE = re.compile(
+VALUE = LazyPattern(
     r"""
     (?P<value>
         (?P<head>("[^"]*")|('[^']*')|([^'"]*?))  # First value (quoted or unquoted)
@@ -91,10 +165,10 @@ VALUE = re.compile(
 )
 
 # Match complete value patterns
-FULL_VALUE = re.compile('^{}$'.format(VALUE.pattern), re.VERBOSE)
+FULL_VALUE = LazyPattern('^{}$'.format(VALUE.pattern), re.VERBOSE)
 
 # Comprehensive regular expression for parsing configuration file lines
-LINE = re.compile(
+LINE = LazyPattern(
     r'''^
     \s*                                          # Optional leading whitespace
     (
@@ -134,8 +208,25 @@ LINE = re.compile(
     re.VERBOSE,
 )
 
+# Same as ``LINE``, to be matched between two positions of a bytes buffer
+BUFFER_LINE = LazyPattern(LINE.pattern.encode('ascii'), re.VERBOSE | re.MULTILINE)  # type: ignore[arg-type]
+
+# Lines of a multi-line value, with the value part before the optional closing delimiter, by delimiter
+MULTILINE_END = {
+    delimiter: LazyPattern(r'^(?P<value>.*?)(?P<delimiter>{}\s*(#.*)?)?$'.format(delimiter)) for delimiter in QUOTES3
+}
+
+# End of the line of a closing multi-line delimiter, to be matched between two positions of a bytes buffer
+BUFFER_MULTILINE_TRAILER = LazyPattern(rb'\s*(#.*)?$', re.MULTILINE)  # type: ignore[arg-type]
+
+# Line breaks of a bytes buffer
+BUFFER_LINE_BREAK = LazyPattern(rb'\n')  # type: ignore[arg-type]
+
+# Next line of a bytes buffer that can be a section or the start of a multi-line value
+BUFFER_SKIPPED_LINE = LazyPattern(rb'^[^\n]*?(\[|"""|\'\'\')', re.MULTILINE)  # type: ignore[arg-type]
+
 # Regular expression for variable interpolation
-INTERPOLATION = re.compile(
+INTERPOLATION = LazyPattern(
     r"""
     \$                                           # Dollar sign prefix
     (
@@ -145,6 +236,7 @@ INTERPOLATION = re.compile(
         |
         (
             {                                    # Opening brace
+                ((?P<file>[^:}]+)::)?           # Optional file of the variable
                 (?P<braced>[^:}]+)              # Variable name within braces
                 (:                               # Optional default value separator
                     (?P<default>                 # Default value
@@ -163,7 +255,160 @@ INTERPOLATION = re.compile(
 )
 
 # Match complete interpolation patterns
-FULL_INTERPOLATION = re.compile('^{}$'.format(INTERPOLATION.pattern), re.VERBOSE)
+FULL_INTERPOLATION = LazyPattern('^{}$'.format(INTERPOLATION.pattern), re.VERBOSE)
+
+# Names or values that can be written without quotes
+UNQUOTED = LazyPattern(r"""[^\s'"\#=,\[\]]([^'"\#=,\[\]\n\r\x0b\x0c\x1c-\x1e\x85\u2028\u2029]*[^\s'"\#=,\[\]])?""")
+
+# Characters splitting the lines of a configuration read from a string
+LINE_BREAKS = '\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029'
+
+# Context manager used when no instrumentation is given
+NO_TRACKING = nullcontext()
+
+
+def __getattr__(name: str) -> Any:
+    """Import on demand the names of the validation and source map modules this module exports."""
+    if name in ('NO_DEFAULT', 'Validator'):
+        from . import validate
+
+        return getattr(validate, name)
+
+    if name in ('Position', 'SourceMap'):
+        from . import config_source
+
+        return getattr(config_source, name)
+
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+
+class Sections(dict):
+    """Sub-sections of a section, notifying the section of their modifications.
+
+    Attributes:
+        owner: The section these sub-sections belong to
+    """
+
+    __slots__ = ('owner',)
+
+    owner: 'Section'
+
+    @classmethod
+    def of(cls, owner: 'Section', *args: Any) -> 'Sections':
+        """Create the sub-sections of a section.
+
+        Args:
+            owner: The section these sub-sections belong to
+            *args: Arguments passed to dict constructor
+
+        Returns:
+            The sub-sections
+        """
+        sections = cls(*args)
+        sections.owner = owner
+
+        return sections
+
+    def __setitem__(self, k: str, v: 'Section') -> None:
+        owner = self.owner
+        if (owner._hash is not None) or owner._indexes:
+            owner._modified()
+
+            previous = dict.get(self, k)
+            if (previous is not None) and (previous is not v):
+                previous._detach(owner)
+
+        dict.__setitem__(self, k, v)
+
+    def __delitem__(self, k: str) -> None:
+        self.owner._modified()
+        self[k]._detach(self.owner)
+        dict.__delitem__(self, k)
+
+    def __ior__(self, other: Any) -> 'Sections':  # type: ignore[misc]
+        self.owner._modified()
+        return dict.__ior__(self, other)
+
+    def pop(self, k: str, *default: Any) -> Any:
+        if k not in self:
+            return dict.pop(self, k, *default)
+
+        section = self[k]
+        del self[k]
+
+        return section
+
+    def popitem(self) -> tuple[str, 'Section']:
+        self.owner._modified()
+        k, section = dict.popitem(self)
+        section._detach(self.owner)
+
+        return k, section
+
+    def setdefault(self, k: str, default: Any = None) -> Any:
+        self.owner._modified()
+        return dict.setdefault(self, k, default)
+
+    def update(self, *args: Any, **kw: Any) -> None:
+        self.owner._modified()
+        dict.update(self, *args, **kw)
+
+    def clear(self) -> None:
+        self.owner._modified()
+        for section in self.values():
+            section._detach(self.owner)
+
+        dict.clear(self)
+
+
+def located(method: Method) -> Method:
+    """Set the source position of the errors raised or collected by a method of a section parsed with a source map."""
+
+    @functools.wraps(method)
+    def locate(self: 'Section', *args: Any, **kw: Any) -> Any:
+        if self.source_map is None:
+            return method(self, *args, **kw)
+
+        errors = kw.get('errors')
+        nb_errors = len(errors) if errors is not None else 0
+
+        try:
+            return method(self, *args, **kw)
+        except ContextualParseError as e:
+            self.source_map.locate(e)
+            raise
+        finally:
+            for error in errors[nb_errors:] if errors is not None else ():
+                if isinstance(error, ContextualParseError):
+                    self.source_map.locate(error)
+
+    return locate  # type: ignore[return-value]
+
+
+@contextmanager
+def collecting_errors() -> Iterator[list[ConfigError]]:
+    """Collect the errors of the parsing, interpolation and validation steps instead of stopping on the first one.
+
+    The list yielded is given as the ``errors`` argument of the steps. Each step
+    recovers from the errors at the line, parameter or section level and keeps
+    going. All the errors are then raised at once.
+
+    Yields:
+        The list receiving the errors
+
+    Raises:
+        AggregatedError: If errors were collected
+
+    Example:
+        with collecting_errors() as errors:
+            config = config_from_file('app.cfg', errors=errors)
+            config.interpolate(errors=errors).merge_defaults(spec, errors=errors).validate(spec, errors=errors)
+    """
+    errors: list[ConfigError] = []
+    yield errors
+
+    if errors:
+        raise AggregatedError(errors)
 
 
 class Section(dict):
@@ -187,8 +432,52 @@ class Section(dict):
             **kw: Keyword arguments passed to dict constructor
         """
         super().__init__(*args, **kw)
+
         # Dictionary to store nested sections
-        self.sections: dict[str, 'Section'] = {}
+        sections = Sections()
+        sections.owner = self
+        self.__dict__['sections'] = sections
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == 'sections':
+            self._modified()
+            if not isinstance(value, Sections) or (value.owner is not self):
+                value = Sections.of(self, value)
+
+        super().__setattr__(name, value)
+
+    def __reduce__(self) -> tuple[Callable[..., 'Section'], tuple[Any, ...]]:
+        """Pickle or deep copy the section with its compact binary encoding.
+
+        The section is rebuilt from its parameters and its sub-sections instead when
+        a value can't be encoded. The file, the source map and the type of the section
+        are kept.
+
+        Returns:
+            The function and the arguments rebuilding the section
+        """
+        attributes = self._attributes()
+
+        try:
+            return restore, (dumps(self), attributes, type(self))
+        except SerializationError:
+            return rebuild, (dict(self.items()), dict(self.sections), attributes, type(self))
+
+    def _attributes(self) -> ConfigDict:
+        """The file, the source map and the dependencies of the section, if set, kept by its copies."""
+        return {
+            name: self.__dict__[name] for name in ('filename', 'source_map', 'dependencies') if name in self.__dict__
+        }
+
+    def __copy__(self) -> 'Section':
+        """Shallow copy, sharing the values and the sub-sections.
+
+        Returns:
+            The copy
+        """
+        attributes = self._attributes()
+
+        return rebuild(dict(self.items()), dict(self.sections), attributes, type(self))
 
     def __bool__(self) -> bool:
         """Return True if the section contains any parameters or subsections (aka is not empty).
@@ -198,6 +487,204 @@ class Section(dict):
         """
         return bool(super()) or bool(self.sections)
 
+    # Modifications tracking
+    # ----------------------
+    #
+    # The fingerprint of a section is computed from the fingerprints of its sub-sections
+    # (Merkle tree): when it's up to date, the fingerprints of all its descendants are up
+    # to date too. So a modification only invalidates the fingerprints along the paths
+    # up to the first sections without fingerprint, following all the parents of a
+    # section attached to several ones.
+    #
+    # Each section of a paths index (see ``lookup()``) records the index: setting a
+    # parameter patches the index, any other modification drops it.
+
+    # Nested sections, by name
+    sections: Sections
+
+    # Fingerprint of the subtree, when computed
+    _hash: Optional[bytes] = None
+    # Weak references to the parent sections, recorded when their fingerprints are computed
+    _parents: tuple[Any, ...] = ()
+    # Paths indexes the section is part of, as ``(weak reference to the indexed section, index, path prefix)``
+    _indexes: tuple[tuple[Any, ConfigDict, str], ...] = ()
+
+    # Positions of the sections and parameters, on the root section parsed with a source map
+    source_map: Optional['SourceMap'] = None
+    # File of the configuration, on the root section parsed from a file
+    filename: Optional[str] = None
+    # Absolute paths of the included fragments and of the referenced files, on the root section loaded with them
+    dependencies: frozenset[str] = frozenset()
+    # Paths index of the descendants: the values by path and the sorted paths
+    _paths: Optional[tuple[ConfigDict, list[str]]] = None
+
+    def _depends_on(self, paths: Iterable[str]) -> None:
+        """Record the files the configuration was loaded from, other than its own file.
+
+        Args:
+            paths: Absolute paths of the files
+        """
+        filename = os.path.abspath(self.filename) if self.filename else None
+        self.dependencies = self.dependencies.union(path for path in paths if path != filename)
+
+    def _detach(self, parent: 'Section') -> None:
+        self._parents = tuple(ref for ref in self._parents if ref() not in (parent, None))
+
+    def _modified(self, indexes: bool = True) -> None:
+        """Invalidate the fingerprints of this section and its ancestors.
+
+        Args:
+            indexes: Drop the paths indexes this section is part of too
+        """
+        if indexes:
+            for section, _, _ in self._current_indexes():
+                section._paths = None
+
+            self._indexes = ()
+
+        stack = [self]
+        while stack:
+            section = stack.pop()
+            if section._hash is not None:
+                section._hash = None
+                stack.extend(parent for parent in (ref() for ref in section._parents) if parent is not None)
+
+    def _reindexed(self, k: str) -> None:
+        """Patch the paths indexes this section is part of with a parameter set.
+
+        Args:
+            k: Name of the parameter
+        """
+        import bisect
+        import weakref
+
+        indexes = self._current_indexes()
+        for section, index, prefix in indexes:
+            path = prefix + k
+            if path not in index:
+                bisect.insort(section._paths[1], path)  # type: ignore[index]
+
+            index[path] = dict.__getitem__(self, k)
+
+        self._indexes = tuple((weakref.ref(section), index, prefix) for section, index, prefix in indexes)
+
+    def _current_indexes(self) -> list[tuple['Section', ConfigDict, str]]:
+        """The paths indexes this section is part of, not dropped since.
+
+        Returns:
+            List of ``(indexed section, index, path prefix)``
+        """
+        indexes = []
+        for ref, index, prefix in self._indexes:
+            section = ref()
+            if (section is not None) and (section._paths is not None) and (section._paths[0] is index):
+                indexes.append((section, index, prefix))
+
+        return indexes
+
+    def __setitem__(self, k: str, v: Any) -> None:
+        if self._hash is not None:
+            self._modified(indexes=False)
+
+        dict.__setitem__(self, k, v)
+
+        if self._indexes:
+            self._reindexed(k)
+
+    def __delitem__(self, k: str) -> None:
+        self._modified()
+        dict.__delitem__(self, k)
+
+    def __ior__(self, other: Any) -> 'Section':  # type: ignore[misc]
+        self._modified()
+        return super().__ior__(other)
+
+    def popitem(self) -> tuple[str, Any]:
+        self._modified()
+        return super().popitem()
+
+    def setdefault(self, k: str, default: Any = None) -> Any:
+        self._modified()
+        return super().setdefault(k, default)
+
+    def update(self, *args: Any, **kw: Any) -> None:
+        self._modified()
+        super().update(*args, **kw)
+
+    def clear(self) -> None:
+        self._modified()
+        super().clear()
+
+    def fingerprint(self) -> str:
+        """Stable content fingerprint of this section and its descendants.
+
+        The fingerprint of a section is a BLAKE2b digest of its parameters, sorted
+        by name, and of the fingerprints of its sub-sections: it's the same for equal
+        sections, whatever their parameters order or the process, and can be used as
+        a cache key. The name of the section itself is not part of its fingerprint.
+
+        The fingerprints are kept until a section is modified. The in-place
+        modifications of the list values are not detected.
+
+        Returns:
+            The hexadecimal digest
+        """
+        import hashlib
+        import weakref
+
+        stack = [(self, False)]
+        while stack:
+            section, expanded = stack.pop()
+            if section._hash is not None:
+                continue
+
+            if not expanded:
+                stack.append((section, True))
+                stack.extend((sub, False) for sub in section.sections.values())
+                continue
+
+            h = hashlib.blake2b(digest_size=16)
+
+            parameters = repr(sorted((name, repr(value)) for name, value in section.items())).encode('utf-8')
+            h.update(b'%d\0' % len(parameters))
+            h.update(parameters)
+
+            for name, sub in sorted(section.sections.items()):
+                h.update(repr(name).encode('utf-8'))
+                h.update(sub._hash)  # type: ignore
+
+                parents = tuple(ref for ref in sub._parents if ref() is not None)
+                if not any(ref() is section for ref in parents):
+                    parents += (weakref.ref(section),)
+                sub._parents = parents
+
+            section._hash = h.digest()
+
+        return self._hash.hex()  # type: ignore
+
+    def freeze(self) -> 'FrozenSection':
+        """Make this section and its descendants read-only, in place.
+
+        The parameters and the sub-sections can't be added, modified or removed
+        anymore, a ``TypeError`` is raised instead. The list values, nested ones
+        included, are replaced by tuples.
+
+        Returns:
+            This section
+        """
+        for _, section in self.walk():
+            if isinstance(section, MappedSection):
+                section.resolve()
+
+            for k, v in list(section.items()):
+                if isinstance(v, list):
+                    section[k] = frozen_value(v)
+
+            section.__class__ = FrozenSection
+            section.sections.__class__ = FrozenSections
+
+        return self  # type: ignore
+
     def __getitem__(self, k: str) -> Any:
         """Get a parameter or section by key.
 
@@ -237,7 +724,11 @@ class Section(dict):
         Returns:
             The removed value or the default value
         """
-        return super().pop(k) if k in self else self.sections.pop(k, default)
+        if k not in self:
+            return self.sections.pop(k, default)
+
+        self._modified()
+        return super().pop(k)
 
     def dict(self) -> ConfigDict:
         """Convert the section to a plain dictionary.
@@ -249,6 +740,231 @@ class Section(dict):
         """
         return dict(self) | {k: v.dict() for k, v in self.sections.items()}
 
+    def walk(self, ancestors_names: AncestorNames = ()) -> Iterator[tuple[AncestorNames, 'Section']]:
+        """Iterate over this section and all its descendant sections, depth first.
+
+        Args:
+            ancestors_names: Names of the ancestor sections of this section
+
+        Yields:
+            Tuples of (section_names, section) where ``section_names`` is the path of the section
+        """
+        stack = [(ancestors_names, self)]
+        while stack:
+            names, section = stack.pop()
+            yield names, section
+
+            stack.extend((names + (name,), sub) for name, sub in reversed(section.sections.items()))
+
+    def _paths_index(self) -> tuple[ConfigDict, list[str]]:
+        """The index of the sections and parameters by path.
+
+        Each indexed section records the index: a parameter set is patched into the
+        index, any other modification of a descendant drops it, to be built again.
+
+        Returns:
+            Tuple of (values by path, sorted paths)
+        """
+        import weakref
+
+        paths = self._paths
+        if paths is None:
+            index: ConfigDict = {}
+            ref = weakref.ref(self)
+
+            # The index is current while built, for the sections attached at several paths
+            self._paths = (index, [])
+
+            for names, section in self.walk():
+                path = '/'.join(names)
+                if names:
+                    # A parameter of the parent has precedence, as with ``__getitem__()``
+                    index.setdefault(path, section)
+                    path += '/'
+
+                index.update((path + name, value) for name, value in section.items())
+
+                # The indexes dropped since are forgotten
+                indexes = tuple((weakref.ref(s), i, prefix) for s, i, prefix in section._current_indexes())
+                section._indexes = indexes + ((ref, index, path),)
+
+            paths = self._paths = (index, sorted(index))
+
+        return paths
+
+    def lookup(self, path: str, default: Any = None) -> Any:
+        """Get a parameter or a section of a descendant by its path, in constant time.
+
+        The paths of all the descendants are indexed on the first lookup. A parameter
+        set through the ``Section`` API is patched into the index, any other modification
+        through the ``Section`` API drops it, to be built again on the next lookup.
+        The in-place modifications of the list values are not detected.
+
+        Args:
+            path: The names of the ancestor sections and the name of the parameter or section, separated by ``/``
+            default: Default value if the path is not found
+
+        Returns:
+            The parameter value, the section or the default value
+
+        Example:
+            config.lookup('apps/shop/db/pool/size')
+        """
+        return self._paths_index()[0].get(path.strip('/'), default)
+
+    def paths(self, prefix: str = '') -> Iterator[tuple[str, Any]]:
+        """Iterate over the parameters and sections of a descendant, by path.
+
+        Args:
+            prefix: Path of the descendant, all the paths if empty
+
+        Yields:
+            Tuples of (path, value), sorted by path, from the descendant itself
+        """
+        import bisect
+
+        index, paths = self._paths_index()
+
+        prefix = prefix.strip('/')
+        if not prefix:
+            yield from ((path, index[path]) for path in paths)
+            return
+
+        if prefix in index:
+            yield prefix, index[prefix]
+
+        # The paths starting with ``prefix/`` are sorted before the ones starting with ``prefix0``
+        start = bisect.bisect_left(paths, prefix + '/')
+        end = bisect.bisect_left(paths, prefix + '0', start)
+        yield from ((path, index[path]) for path in paths[start:end])
+
+    def entries(self) -> list[Entry]:
+        """Flatten this section and its descendants, depth first.
+
+        Returns:
+            List of ``(parent index, name, parameters)`` entries, the first one being
+            this section with a ``-1`` parent index
+        """
+        entries: list[Entry] = []
+
+        # Index of each section in the entries, by path
+        indexes: dict[AncestorNames, int] = {}
+
+        for names, section in self.walk():
+            indexes[names] = len(entries)
+            entries.append((indexes[names[:-1]], names[-1], dict(section)) if names else (-1, '', dict(section)))
+
+        return entries
+
+    def memory_report(self) -> MemoryReport:
+        """Compute the deep size, in bytes, of this section and its descendants.
+
+        Each object is only counted once. A string referenced several times in the tree
+        (like a parameter name used by several sections) is reported in ``shared``
+        instead of in ``keys`` or ``values``.
+
+        Returns:
+            The sizes of the ``sections`` (dictionaries and attributes), the ``keys``
+            (parameter and section names), the scalar ``values``, the ``lists`` (and tuples) containers,
+            the ``shared`` strings and the ``total``
+        """
+        # Category of the first occurrence of each object, and the objects referenced more than once
+        objects: dict[int, tuple[str, Any]] = {}
+        repeated = set()
+
+        def add(category: str, o: Any) -> None:
+            if id(o) in objects:
+                repeated.add(id(o))
+            else:
+                objects[id(o)] = category, o
+
+        for _, section in self.walk():
+            add('sections', section)
+            add('sections', section.__dict__)
+            add('sections', section.sections)
+
+            for name in section.sections:
+                add('keys', name)
+
+            for name, value in section.items():
+                add('keys', name)
+
+                if isinstance(value, (list, tuple)):
+                    add('lists', value)
+                    for e in value:
+                        add('values', e)
+                else:
+                    add('values', value)
+
+        report = dict.fromkeys(('sections', 'keys', 'values', 'lists', 'shared'), 0)
+        for i, (category, o) in objects.items():
+            if isinstance(o, str) and (i in repeated):
+                category = 'shared'
+
+            report[category] += sys.getsizeof(o)
+
+        report['total'] = sum(report.values())
+
+        return report
+
+    def _counters(
+        self, validator: Optional['Validator'] = None, references: bool = False, content: bool = True
+    ) -> Counters:
+        """Count the content of this section and its descendants, for the instrumentation.
+
+        Args:
+            validator: Validator whose specification cache hits are reported
+            references: Count the variable references
+            content: Count the sections and the parameters
+
+        Returns:
+            The number of ``sections``, ``parameters``, variable ``references`` and ``cache_hits``
+        """
+        nb_sections = nb_parameters = nb_references = 0
+
+        for _, section in self.walk() if (references or content) else ():
+            nb_sections += 1
+            nb_parameters += len(section)
+
+            for value in section.values() if references else ():
+                for e in value if isinstance(value, list) else [value]:
+                    if isinstance(e, str) and ('$' in e):
+                        nb_references += sum(1 for m in INTERPOLATION.finditer(e) if not m.group('escaped'))
+
+        return {
+            'sections': max(nb_sections - 1, 0),
+            'parameters': nb_parameters,
+            'references': nb_references,
+            'cache_hits': validator.cache_hits if validator is not None else 0,
+        }
+
+    def _track(
+        self,
+        instrumentation: Optional[Instrumentation],
+        phase: str,
+        name: Optional[str],
+        validator: Optional['Validator'] = None,
+    ) -> ContextManager[None]:
+        """Context manager sending the instrumentation events of a phase applied to this section.
+
+        Args:
+            instrumentation: The instrumentation or ``None``
+            phase: Name of the phase
+            name: Name of this section if it's a top-level section or ``None`` for the whole phase
+            validator: Validator whose specification cache hits are reported
+
+        Returns:
+            The context manager
+        """
+        if instrumentation is None:
+            return NO_TRACKING
+
+        return instrumentation.track(
+            phase,
+            name,
+            lambda before: self._counters(validator, before and (phase == 'interpolate'), not before),
+        )
+
     def merge(self, config: 'Section') -> 'Section':
         """Merge another configuration section into this one.
 
@@ -262,7 +978,10 @@ class Section(dict):
             This section (for method chaining)
         """
         # Update parameters from the other config
-        self.update(config)
+        if (self._hash is not None) or self._indexes:
+            self._modified()
+
+        dict.update(self, config)
 
         # Recursively merge nested sections
         for name, section in config.sections.items():
@@ -298,42 +1017,229 @@ class Section(dict):
                 print(spaces + ('[' * (level + 1)) + k + (']' * (level + 1)))
                 v.display(indent, level + 1, filter_parameter)
 
-    # Parsing Methods
-    # ---------------
+    # Serialization Methods
+    # ---------------------
 
-    def from_dict(self, d: ConfigDict) -> 'Section':
-        """Populate the section from a dictionary.
+    @staticmethod
+    def quote(v: str, ancestors_names: AncestorNames = (), name: Optional[str] = None, force: bool = False) -> str:
+        """Quote a name or a value, if needed, so that it's read back identically.
 
-        Recursively converts nested dictionaries to Section instances.
+        Inverse of ``strip_quotes()``.
 
         Args:
-            d: Dictionary to convert
+            v: The name or the value to quote
+            ancestors_names: Names of the ancestor sections for error reporting
+            name: Name of the parameter or the section for error reporting
+            force: Always quote the string
 
         Returns:
-            This section (for method chaining)
+            The string, quoted if needed
+
+        Raises:
+            SerializationError: If the string can't be quoted
         """
-        for k, v in d.items():
-            if isinstance(v, dict):
-                # Convert nested dictionaries to Section instances
-                self.sections[k] = Section().from_dict(v)
-            else:
-                # Store regular values as parameters
-                self[k] = v
+        if not force and UNQUOTED.fullmatch(v) and not v.startswith('$('):
+            return v
 
-        return self
+        if any(c in v for c in LINE_BREAKS):
+            raise SerializationError('line break in {}'.format(repr(v)), sections=ancestors_names, name=name)
 
-    @staticmethod
-    def strip_quotes(v: str) -> str:
-        """Remove surrounding quotes from a string value.
+        if '"' not in v:
+            return '"' + v + '"'
 
-        Handles both single and double quotes.
+        if "'" not in v:
+            return "'" + v + "'"
+
+        raise SerializationError('both quote characters in {}'.format(repr(v)), sections=ancestors_names, name=name)
+
+    @classmethod
+    def quote_name(cls, v: str, ancestors_names: AncestorNames = ()) -> str:
+        """Quote a section or a parameter name, if needed, so that it's read back identically.
 
         Args:
-            v: String that may have surrounding quotes
+            v: The name to quote
+            ancestors_names: Names of the ancestor sections for error reporting
 
         Returns:
-            String with quotes removed
-        """
+            The name, quoted if needed
+
+        Raises:
+            SerializationError: If the name is empty or can't be quoted
+        """
+        if not v:
+            raise SerializationError('empty name', sections=ancestors_names, name=v)
+
+        return cls.quote(v, ancestors_names, v)
+
+    @classmethod
+    def serialize_value(cls, value: Any, ancestors_names: AncestorNames = (), name: Optional[str] = None) -> str:
+        """Serialize a parameter value so that it's read back identically.
+
+        Inverse of ``parse_value()``. Lists (and tuples) are written as quoted and
+        comma-separated elements. Strings with newlines or with both quote characters
+        are written as multi-line values. Other values are converted to strings.
+
+        Args:
+            value: The value to serialize
+            ancestors_names: Names of the ancestor sections for error reporting
+            name: Name of the parameter for error reporting
+
+        Returns:
+            The serialized value
+
+        Raises:
+            SerializationError: If the value can't be serialized
+        """
+        if isinstance(value, (list, tuple)):
+            # A list is only read back as a list if it has several elements
+            if len(value) < 2:
+                raise SerializationError(
+                    'list of less than 2 elements {}'.format(repr(value)), sections=ancestors_names, name=name
+                )
+
+            return ', '.join(cls.quote(str(e), ancestors_names, name, force=True) for e in value)
+
+        value = str(value)
+        if ('\n' not in value) and (('"' not in value) or ("'" not in value)):
+            return cls.quote(value, ancestors_names, name)
+
+        # Multi-line value. On its first line, a `#` starts a comment and the trailing spaces are stripped
+        delimiter = next((d for d in ('"""', "'''") if d not in value), None)
+        first_line = value.split('\n', 1)[0]
+        if (
+            (delimiter is None)
+            or ('#' in first_line)
+            or (first_line != first_line.rstrip())
+            or any(c in value for c in LINE_BREAKS[1:])
+        ):
+            raise SerializationError('multi-line value {}'.format(repr(value)), sections=ancestors_names, name=name)
+
+        return delimiter + value + delimiter
+
+    def write(self, fileobj: IO[str], indent: int = 0, buffer_size: int = 65536) -> None:
+        """Write the configuration in the configuration syntax.
+
+        The parameters and the sections are written in their order, without recursion,
+        and sent to the file object by chunks of about ``buffer_size`` characters.
+        The configuration read back from the output is equal to this configuration
+        (except the non-string values, read back as strings).
+
+        Args:
+            fileobj: File object to write to
+            indent: Number of spaces per indentation level
+            buffer_size: Number of characters to buffer before a write
+
+        Raises:
+            SerializationError: If a name or a value can't be serialized
+        """
+        buffer: list[str] = []
+        size = 0
+
+        for names, section in self.walk():
+            level = len(names)
+            spaces = ' ' * (indent * max(level - 1, 0))
+
+            chunk = []
+            if level:
+                name = self.quote_name(names[-1], names[:-1])
+                chunk.append('\n' + spaces + ('[' * level) + name + (']' * level) + '\n')
+
+            spaces = ' ' * (indent * level)
+            for name, value in section.items():
+                chunk.append(
+                    spaces + self.quote_name(name, names) + ' = ' + self.serialize_value(value, names, name) + '\n'
+                )
+
+            buffer.extend(chunk)
+            size += sum(map(len, chunk))
+            if size >= buffer_size:
+                fileobj.write(''.join(buffer))
+                buffer.clear()
+                size = 0
+
+        fileobj.write(''.join(buffer))
+
+    def to_string(self, indent: int = 0) -> str:
+        """Serialize the configuration in the configuration syntax.
+
+        ``config_from_string(config.to_string())`` is equal to ``config``, sections included
+        (except the non-string values, read back as strings).
+
+        Args:
+            indent: Number of spaces per indentation level
+
+        Returns:
+            The configuration text
+
+        Raises:
+            SerializationError: If a name or a value can't be serialized
+        """
+        out = io.StringIO()
+        self.write(out, indent)
+
+        return out.getvalue()
+
+    # Parsing Methods
+    # ---------------
+
+    def from_dict(self, d: ConfigDict) -> 'Section':
+        """Populate the section from a dictionary.
+
+        Recursively converts nested dictionaries to Section instances.
+
+        Args:
+            d: Dictionary to convert
+
+        Returns:
+            This section (for method chaining)
+        """
+        parameters = {}
+
+        for k, v in d.items():
+            if isinstance(v, dict):
+                # Convert nested dictionaries to Section instances
+                self.sections[k] = Section().from_dict(v)
+            else:
+                # Store regular values as parameters
+                parameters[k] = v
+
+        self.update(parameters)
+
+        return self
+
+    @classmethod
+    def from_pairs(cls, pairs: Sequence[tuple[str, Any]]) -> 'Section':
+        """Create a section from a sequence of ``(name, value)`` pairs.
+
+        The Section values become sub-sections, the other values parameters.
+
+        Args:
+            pairs: The names and values
+
+        Returns:
+            The new section
+        """
+        section = cls()
+        for k, v in pairs:
+            if isinstance(v, Section):
+                section.sections[k] = v
+            else:
+                section[k] = v
+
+        return section
+
+    @staticmethod
+    def strip_quotes(v: str) -> str:
+        """Remove surrounding quotes from a string value.
+
+        Handles both single and double quotes.
+
+        Args:
+            v: String that may have surrounding quotes
+
+        Returns:
+            String with quotes removed
+        """
         if v.startswith(QUOTES):
             v = v[1:]
 
@@ -389,6 +1295,31 @@ class Section(dict):
             return value
         return cls._parse_value(**match.groupdict())
 
+    @staticmethod
+    def skip_multilines(lines: LineIterator, nb_lines: int, end: str) -> int:
+        """Skip the lines of a multi-line value.
+
+        Args:
+            lines: Iterator of configuration file lines
+            nb_lines: Current line number
+            end: Closing delimiter to look for
+
+        Returns:
+            The final line number
+
+        Raises:
+            ParseError: If the closing delimiter is not found
+        """
+        start_line = nb_lines
+        match = MULTILINE_END[end].match
+
+        for line in lines:
+            nb_lines += 1
+            if (end in line) and (match(line)['delimiter'] is not None):  # type: ignore[index]
+                return nb_lines
+
+        raise ParseError('no multiline value end found', start_line)
+
     @staticmethod
     def parse_multilines(lines: LineIterator, nb_lines: int, value: str, end: str) -> tuple[int, str]:
         """Parse multi-line string values.
@@ -408,22 +1339,28 @@ class Section(dict):
             ParseError: If the closing delimiter is not found
         """
         start_line = nb_lines
-        # Pattern to match lines with optional closing delimiter
-        line_pattern = re.compile(r'^(?P<value>.*?)(?P<delimiter>{}\s*(#.*)?)?$'.format(end))
+        match = MULTILINE_END[end].match
 
+        # Joined once at the end, for a linear time on big values
+        parts = [value]
         for line in lines:
             nb_lines += 1
-            m = line_pattern.match(line[:-1])  # Remove newline
+            if end not in line:
+                parts.append(line.rstrip('\n'))
+                continue
+
+            # `$` also matches before the final newline, which is not part of the value
+            m = match(line)
             if m:
-                value += '\n' + m.group('value')
-                if m.group('delimiter'):
+                parts.append(m['value'])
+                if m['delimiter'] is not None:
                     # Found closing delimiter
                     break
         else:
             # Iterator exhausted without finding delimiter
             raise ParseError('no multiline value end found', start_line)
 
-        return nb_lines, value
+        return nb_lines, '\n'.join(parts)
 
     def from_iter(
         self,
@@ -433,6 +1370,14 @@ class Section(dict):
         ancestors: Ancestors = (),
         ancestors_names: AncestorNames = (),
         nb_lines: int = 0,
+        instrumentation: Optional[Instrumentation] = None,
+        source_map: Optional['SourceMap'] = None,
+        filename: Optional[str] = None,
+        *,
+        errors: Optional[list[ConfigError]] = None,
+        inclusion: Optional['Inclusion'] = None,
+        only: Optional[Iterable[str]] = None,
+        encoding: str = 'utf-8',
     ) -> 'Section':
         """Parse configuration from an iterator of lines.
 
@@ -442,10 +1387,21 @@ class Section(dict):
         Args:
             lines: Iterator of configuration file lines
             global_config: Global configuration for interpolation
-            max_depth: Maximum nesting depth (0 = unlimited)
+            max_depth: Maximum nesting depth (0 = unlimited). The sections too nested are skipped, with their
+              parameters and sub-sections
             ancestors: Tuple of parent sections
             ancestors_names: Tuple of parent section names
             nb_lines: Starting line number
+            instrumentation: Optional instrumentation receiving the ``parse`` events
+            source_map: Optional map receiving the positions of the sections and parameters
+            filename: File the lines are read from, for the source map
+            errors: Optional list collecting the errors instead of raising them. An invalid line or a
+              duplicate parameter is skipped and the parameters of an invalid section are parsed into
+              a detached section
+            inclusion: Files being included, when parsing a fragment (see ``config_include``)
+            only: Names of the top-level sections to parse, the others being skipped without being
+              checked, only looking for their multi-line values and for the next section
+            encoding: Encoding of the included fragments, when not parsing a fragment
 
         Returns:
             This section (for method chaining)
@@ -453,14 +1409,62 @@ class Section(dict):
         Raises:
             ParseError: If a line cannot be parsed
             SectionError: If section structure is invalid
-            DirectiveError: If an unsupported directive is used
+            DirectiveError: If an unsupported directive is used or a fragment can't be included
             ParameterError: If parameter names are duplicated
         """
+        if instrumentation:
+            instrumentation.start('parse')
+
+        start = time.perf_counter()
+
+        # Sections from the root to the current section, and names of the sections below the root
+        path = list(ancestors) + [self]
+        names = list(ancestors_names)
+        section = self
+
+        # The other sections are new ones, so their parameters are directly set
+        self._modified()
+
+        # Current top-level section with the counts when it started, its first line and its start time,
+        # and the numbers of sections and parameters parsed, for the instrumentation
+        first_line = nb_lines
+        top: Optional[tuple[str, int, int]] = None
+        counts = [0, 0]
+        top_line, top_start = 0, 0.0
+
+        # Rows of the sections of ``path`` in the source map
+        rows, file = self._source_rows(source_map, filename, names)
+        nb_errors = len(errors) if errors is not None else 0
+
+        # In a top-level section not selected by ``only`` or in a section too nested
+        selected = None if only is None else set(only)
+        skipping = False
+        # Level of the sections ending the skipping
+        resume = 1
+
         for line in lines:
             nb_lines += 1
+            if skipping and ('[' not in line) and ('"""' not in line) and ("'''" not in line):
+                # Neither a section nor a multi-line value
+                continue
+
             x = LINE.match(line.rstrip())
+            if skipping:
+                if x and x['multi_delimiter_start'] and not x['multi_delimiter_end']:
+                    try:
+                        nb_lines = self.skip_multilines(lines, nb_lines, x['multi_delimiter_start'])
+                    except ParseError as e:
+                        self._failed(errors, e)
+                        break
+
+                if not (x and x['section'] and (len(x['section_in']) <= resume)):
+                    continue
+
+                skipping = False
+
             if not x:
-                raise ParseError("invalid line '{}'".format(line.strip()), nb_lines)
+                self._failed(errors, ParseError("invalid line '{}'".format(line.strip()), nb_lines))
+                continue
 
             m = x.groupdict()
 
@@ -473,47 +1477,66 @@ class Section(dict):
                 # Calculate section nesting level, which is the number of leading `[`
                 level = len(m['section_in'])
                 if len(m['section_out']) != level:  # Must have the same number of trailing `]`
-                    raise SectionError('cannot compute the section depth', nb_lines, ancestors_names, name)
+                    self._failed(errors, SectionError('cannot compute the section depth', nb_lines, tuple(names), name))
+                    section = Section()
+                    continue
 
                 # Check maximum depth limit of nested sections
                 if max_depth and (level >= max_depth):
-                    return self
-
-                # Determine parent section
-                if level == (len(ancestors) + 1):
-                    # Direct child section
-                    parent = self
-                    section_ancestors = ancestors
-                    section_ancestors_names = ancestors_names
-                elif level <= len(ancestors):
-                    # Sibling or uncle section - trim ancestors
-                    ancestors = ancestors[:level]
-                    parent = ancestors[-1]
-                    section_ancestors = ancestors[:-1]
-                    section_ancestors_names = ancestors_names[: level - 1]
-                else:
-                    # Section is too deeply nested
-                    raise SectionError('section too nested', nb_lines, ancestors_names, name)
-
-                # Handle section directives (currently not supported)
-                directive = m.get('section_directive')
-                if not directive:
-                    # Check for duplicate section names
-                    if (name in parent) or (name in parent.sections):
-                        raise SectionError('duplicate section name', nb_lines, section_ancestors_names, name)
-
-                    # Create and parse the new section
-                    parent.sections[name] = Section()
-                    parent.sections[name].from_iter(
-                        lines,
-                        global_config,
-                        max_depth,
-                        section_ancestors + (parent,),
-                        section_ancestors_names + (name,),
+                    # Skip the section with its parameters and its sub-sections
+                    skipping, resume = True, max_depth - 1
+                    continue
+
+                # Include a fragment into the parent section, which becomes the current one
+                if m['section_directive'] == 'include':
+                    if instrumentation and (level == 1) and (top is not None):
+                        # The following parameters are the ones of the root
+                        self._parsed(instrumentation, top, top_start, nb_lines - top_line, counts)
+                        top = None
+
+                    args = m['section_directive_args']
+                    section = self._include(
+                        path,
+                        names,
+                        rows,
+                        level,
+                        args,
                         nb_lines,
+                        filename,
+                        inclusion,
+                        errors,
+                        source_map,
+                        encoding,
+                        counts,
                     )
-                else:
-                    raise DirectiveError('invalid directive', nb_lines, ancestors_names, directive)
+                    if (selected is not None) and (level == 1):
+                        skipping, resume = self._select(path[0], selected), 1
+                    continue
+
+                if (selected is not None) and (level == 1):
+                    skipping, resume = name not in selected, 1
+                    if skipping:
+                        if instrumentation and (top is not None):
+                            self._parsed(instrumentation, top, top_start, nb_lines - top_line, counts)
+                            top = None
+                        continue
+
+                # Create the new section, which becomes the current one
+                section = self._open_section(
+                    path, names, name, level, m['section_directive'], nb_lines, Section(), errors
+                )
+                if path[-1] is section:
+                    counts[0] += 1
+                    if source_map is not None:
+                        del rows[level:]
+                        rows.append(source_map.add(rows[-1], name, file, nb_lines, x.start('section_in') + 1))
+
+                if instrumentation and (level == 1):
+                    if top is not None:
+                        self._parsed(instrumentation, top, top_start, nb_lines - top_line, counts)
+
+                    instrumentation.start('parse', name)
+                    top, top_line, top_start = (name, counts[0], counts[1]), nb_lines, time.perf_counter()
 
             # Handle parameter definitions
             # ----------------------------
@@ -521,9 +1544,12 @@ class Section(dict):
             if m['name']:
                 name = self.strip_quotes(m['name'])
 
-                # Check for duplicate parameter names
-                if (name in self) or (name in self.sections):
-                    raise ParameterError('duplicate parameter name', nb_lines, ancestors_names, name)
+                # Check for duplicate parameter names, the value of a duplicate being parsed then skipped
+                duplicate = (name in section) or (name in section.sections)
+                if duplicate:
+                    self._failed(errors, ParameterError('duplicate parameter name', nb_lines, tuple(names), name))
+                elif (source_map is not None) and (path[-1] is section):
+                    source_map.add(rows[-1], name, file, nb_lines, x.start('name') + 1)
 
                 # Handle multi-line values
                 if m['multi_delimiter_start']:
@@ -532,15 +1558,276 @@ class Section(dict):
                         value = m['multi']
                     else:
                         # Multi-line value on several lines
-                        nb_lines, value = self.parse_multilines(lines, nb_lines, m['multi'], m['multi_delimiter_start'])
+                        try:
+                            nb_lines, value = self.parse_multilines(
+                                lines, nb_lines, m['multi'], m['multi_delimiter_start']
+                            )
+                        except ParseError as e:
+                            # All the remaining lines were consumed
+                            self._failed(errors, e)
+                            break
                 else:
                     # Single-line value
                     value = self._parse_value(**m)
 
-                self[name] = value
+                if not duplicate:
+                    dict.__setitem__(section, name, value)
+                    counts[1] += 1
+
+        if instrumentation:
+            if top is not None:
+                self._parsed(instrumentation, top, top_start, nb_lines - top_line + 1, counts)
+
+            self._parsed(instrumentation, None, start, nb_lines - first_line, counts)
+
+        if source_map is not None:
+            self.source_map = source_map
+
+        if filename is not None:
+            self.filename = filename
+
+        self._collected(errors, nb_errors, filename)
 
         return self
 
+    @staticmethod
+    def _source_rows(
+        source_map: Optional['SourceMap'], filename: Optional[str], names: list[str]
+    ) -> tuple[list[int], int]:
+        """Register a parsed file into a source map.
+
+        Args:
+            source_map: The source map
+            filename: The file
+            names: Names of the sections below the root, down to the parsed section
+
+        Returns:
+            Tuple of (rows of the sections from the root to the parsed section, index of the file)
+        """
+        if source_map is None:
+            return [], 0
+
+        rows = [source_map.row(tuple(names[:i]), create=True) or 0 for i in range(len(names) + 1)]
+
+        return rows, source_map.add_file(filename)
+
+    @staticmethod
+    def _open_section(
+        path: list['Section'],
+        names: list[str],
+        name: str,
+        level: int,
+        directive: Optional[str],
+        nb_lines: int,
+        section: 'Section',
+        errors: Optional[list[ConfigError]] = None,
+    ) -> 'Section':
+        """Attach a new section at its level in the sections being parsed.
+
+        Args:
+            path: Sections from the root to the current section, updated
+            names: Names of the sections below the root, updated
+            name: Name of the new section
+            level: Nesting level of the new section
+            directive: Directive found instead of the section name
+            nb_lines: Line number of the section
+            section: The new section
+            errors: Optional list collecting the errors. The invalid section is then
+              returned detached, and only put in ``path`` if not too nested
+
+        Returns:
+            The new section
+
+        Raises:
+            SectionError: If the section is too nested or its name is duplicated
+            DirectiveError: If a directive is used
+        """
+        # The parent is the ancestor (or the current section) at the previous level
+        if level > len(path):
+            # Section is too deeply nested
+            Section._failed(errors, SectionError('section too nested', nb_lines, tuple(names), name))
+            return section
+
+        error: Optional[ConfigError] = None
+
+        # Handle section directives (only `include` is supported, see `_include()`)
+        if directive:
+            error = DirectiveError('invalid directive', nb_lines, tuple(names), directive)
+
+        # Sibling or uncle section - trim ancestors
+        del path[level:]
+        del names[level - 1 :]
+        parent = path[-1]
+
+        # Check for duplicate section names
+        if (error is None) and ((name in parent) or (name in parent.sections)):
+            error = SectionError('duplicate section name', nb_lines, tuple(names), name)
+
+        if error is None:
+            parent.sections[name] = section
+        else:
+            Section._failed(errors, error)
+
+        path.append(section)
+        names.append(name)
+
+        return section
+
+    @staticmethod
+    def _include(
+        path: list['Section'],
+        names: list[str],
+        rows: list[int],
+        level: int,
+        args: Optional[str],
+        nb_lines: int,
+        filename: Optional[str],
+        inclusion: Optional['Inclusion'],
+        errors: Optional[list[ConfigError]],
+        source_map: Optional['SourceMap'],
+        encoding: str = 'utf-8',
+        counts: Optional[list[int]] = None,
+    ) -> 'Section':
+        """Include a fragment into the parent of the sections of a level.
+
+        Args:
+            path: Sections from the root to the current section, updated
+            names: Names of the sections below the root, updated
+            rows: Rows of the sections of ``path`` in the source map, updated
+            level: Nesting level of the ``include`` directive
+            args: Path of the fragment
+            nb_lines: Line number of the directive
+            filename: File of the directive
+            inclusion: Files being included, when parsing a fragment
+            errors: Optional list collecting the errors
+            source_map: Optional map receiving the positions of the fragment sections and parameters
+            encoding: Encoding of the fragment, when not parsing a fragment
+            counts: Optional numbers of sections and parameters parsed, incremented with the included ones
+
+        Returns:
+            The parent section, which becomes the current one
+        """
+        from .config_include import Inclusion, include
+
+        if level > len(path):
+            Section._failed(errors, SectionError('section too nested', nb_lines, tuple(names), 'include'))
+            return Section()
+
+        del path[level:]
+        del names[level - 1 :]
+        del rows[level:]
+
+        inclusion = inclusion or Inclusion.of(filename, encoding)
+        include(path[-1], names, args or '', nb_lines, inclusion, errors, source_map, rows[-1] if rows else 0, counts)
+        path[0]._depends_on(inclusion.dependencies)
+
+        return path[-1]
+
+    @staticmethod
+    def _select(root: 'Section', selected: set[str]) -> bool:
+        """Remove the top-level sections not selected, as the ones of a fragment included into the root.
+
+        Args:
+            root: The root section
+            selected: Names of the top-level sections to keep
+
+        Returns:
+            ``False``, the root being the current section
+        """
+        for name in set(root.sections) - selected:
+            del root.sections[name]
+
+        return False
+
+    @staticmethod
+    def _failed(errors: Optional[list[ConfigError]], error: ConfigError) -> None:
+        """Raise an error or, when the errors are collected, record it.
+
+        Args:
+            errors: Optional list collecting the errors
+            error: The error
+
+        Raises:
+            ConfigError: The error, if the errors are not collected
+        """
+        if errors is None:
+            raise error
+
+        errors.append(error)
+
+    @staticmethod
+    def _collected(errors: Optional[list[ConfigError]], nb_errors: int, filename: Optional[str]) -> None:
+        """Set the file of the errors collected while parsing it, to order them by position.
+
+        Args:
+            errors: Optional list collecting the errors
+            nb_errors: Number of errors collected before the parsing
+            filename: The parsed file
+        """
+        for error in errors[nb_errors:] if errors is not None else ():
+            error.filename = error.filename or filename
+
+    @staticmethod
+    def _values(
+        errors: Optional[list[ConfigError]], parameters: Iterable[tuple[str, Any]], convert: Callable[[str, Any], Any]
+    ) -> ConfigDict:
+        """Convert parameter values, collecting the conversion errors.
+
+        Args:
+            errors: Optional list collecting the errors
+            parameters: The ``(name, value)`` of the parameters
+            convert: Function receiving the name and the value of a parameter and returning the new value
+
+        Returns:
+            The converted values, without the values that failed when the errors are collected
+
+        Raises:
+            ContextualParseError: The first conversion error, if the errors are not collected
+        """
+        if errors is None:
+            return {name: convert(name, value) for name, value in parameters}
+
+        values = {}
+        for name, value in parameters:
+            try:
+                values[name] = convert(name, value)
+            except ContextualParseError as e:
+                errors.append(e)
+
+        return values
+
+    @staticmethod
+    def _parsed(
+        instrumentation: Instrumentation,
+        top: Optional[tuple[str, int, int]],
+        start: float,
+        nb_lines: int,
+        counts: list[int],
+    ) -> None:
+        """Send the ``end`` event of the ``parse`` phase or of a parsed top-level section.
+
+        Args:
+            instrumentation: The instrumentation
+            top: Name of the top-level section with the numbers of sections and parameters parsed
+              when it started, or ``None`` for the whole phase
+            start: Clock value when the parsing started
+            nb_lines: Number of lines parsed
+            counts: Numbers of sections and parameters parsed
+        """
+        elapsed = time.perf_counter() - start
+        name, nb_sections, nb_parameters = top or (None, 0, 0)
+
+        instrumentation.end(
+            'parse',
+            name,
+            elapsed,
+            lines=nb_lines,
+            sections=counts[0] - nb_sections,
+            parameters=counts[1] - nb_parameters,
+            interpolations=0,
+            cache_hits=0,
+        )
+
     # Variable Interpolation Methods
     # ------------------------------
 
@@ -556,20 +1843,17 @@ class Section(dict):
         Returns:
             Tuple of (ancestors_list, containing_section, parameter_value)
         """
-        ancestors: Ancestors
+        ancestors = [self]
 
-        name = names.pop(0)
-        if names:
-            # More names in path - recurse into subsection
-            ancestors, section, value = (), None, self.sections.get(name)
-            if value:
-                ancestors, section, value = value.get_parameter(names)
-                ancestors = (self,) + ancestors
-        else:
-            # Last name in path - get parameter value
-            ancestors, section, value = (self,), self, self.get(name)
+        # Descend into the sub-sections, then get the parameter value of the last one
+        for name in names[:-1]:
+            sub = ancestors[-1].sections.get(name)
+            if not sub:
+                return tuple(ancestors[:-1]), None, sub
 
-        return ancestors, section, value
+            ancestors.append(sub)
+
+        return tuple(ancestors), ancestors[-1], ancestors[-1].get(names[-1])
 
     def find_parameter(
         self, name: str, ancestors: Sequence['Section'], global_config: ConfigDict
@@ -600,6 +1884,37 @@ class Section(dict):
 
         return section, value
 
+    def load_referenced(
+        self, file: str, files: ReferencedFiles, ancestors_names: AncestorNames = (), name: Optional[str] = None
+    ) -> 'Section':
+        """Load the file of a file-qualified variable, once per interpolation.
+
+        Args:
+            file: The file, relative to the directory of this configuration file or to the current directory
+            files: Configurations of the files already loaded, by path, updated
+            ancestors_names: Names of the sections of the variable, for error reporting
+            name: Name of the parameter with the variable, for error reporting
+
+        Returns:
+            The parsed, not interpolated, configuration of the file
+
+        Raises:
+            InterpolationError: If the file can't be loaded
+        """
+        directory = os.path.dirname(os.path.abspath(self.filename)) if self.filename else os.getcwd()
+        path = os.path.normpath(os.path.join(directory, file))
+
+        config = files.get(path)
+        if config is None:
+            try:
+                config = files[path] = config_from_file(path)
+            except OSError as e:
+                raise InterpolationError(
+                    'cannot load {}: {}'.format(repr(file), e.strerror), sections=ancestors_names, name=name
+                ) from None
+
+        return config
+
     def _interpolate(
         self,
         ancestors: Ancestors,
@@ -611,12 +1926,14 @@ class Section(dict):
         named: Optional[str],
         braced: Optional[str],
         default: Optional[str],
+        file: Optional[str] = None,
+        files: Optional[ReferencedFiles] = None,
     ) -> tuple[Optional[str], Any]:
         """Internal method for variable interpolation.
 
         Handles the core logic of resolving variable references like
-        $variable or ${variable:default}. Internal method directly called
-        with the ``INTERPOLATION`` regexp matching parameters
+        $variable, ${variable:default} or ${file::path/to/variable}. Internal
+        method directly called with the ``INTERPOLATION`` regexp matching parameters
 
         Args:
             ancestors: List of ancestor sections for scoping
@@ -628,12 +1945,14 @@ class Section(dict):
             named: Simple variable name ($variable)
             braced: Braced variable name (${variable})
             default: Default value if variable not found
+            file: File of the variable (${file::variable}), relative to the file of the configuration
+            files: Configurations of the files already loaded, by path
 
         Returns:
             Tuple of (parameter_name, resolved_value)
 
         Raises:
-            InterpolationError: If variable not found or circular reference detected
+            InterpolationError: If variable not found, its file can't be loaded or circular reference detected
         """
         if escaped:
             # Handle escaped dollar sign
@@ -642,7 +1961,20 @@ class Section(dict):
         # Get the variable name (either simple or braced form)
         parameter_name = named or braced or ''
 
-        if parameter_name.count('/') == 0:
+        # Section and ancestors the variable value is interpolated from
+        context, context_ancestors = self, ancestors
+
+        if file:
+            # Path from the root of another file
+            files = {} if files is None else files
+            config = (ancestors[0] if ancestors else self).load_referenced(file, files, ancestors_names, name)
+
+            found_ancestors, section, value = config.get_parameter(parameter_name.strip('/').split('/'))
+            if section is not None:
+                context, context_ancestors = section, found_ancestors[:-1]
+
+            parameter_name = '{}::{}'.format(file, parameter_name)
+        elif parameter_name.count('/') == 0:
             # Simple variable name - search from current scope
             section, value = self.find_parameter(parameter_name, ancestors, global_config)
         else:
@@ -672,7 +2004,9 @@ class Section(dict):
             )
 
         # Recursively interpolate the resolved value
-        value = self.interpolate_parameter(value, ancestors, ancestors_names, name, global_config, refs + [ref])
+        value = context.interpolate_parameter(
+            value, context_ancestors, ancestors_names, name, global_config, refs + [ref], files
+        )
 
         # Lists cannot be interpolated into strings
         if isinstance(value, list):
@@ -689,6 +2023,7 @@ class Section(dict):
         name: str,
         global_config: ConfigDict,
         refs: list[tuple[int, str]],
+        files: Optional[ReferencedFiles] = None,
         **match: Any,
     ) -> str:
         """Helper method for parameter interpolation.
@@ -702,6 +2037,7 @@ class Section(dict):
             name: Parameter name being interpolated
             global_config: Global configuration
             refs: Reference chain for circular dependency detection
+            files: Configurations of the files already loaded, by path
             **match: Regex match groups
 
         Returns:
@@ -710,7 +2046,7 @@ class Section(dict):
         Raises:
             InterpolationError: If the resolved value is a list
         """
-        var_name, value = self._interpolate(ancestors, ancestors_names, name, global_config, refs, **match)
+        var_name, value = self._interpolate(ancestors, ancestors_names, name, global_config, refs, files=files, **match)
         if isinstance(value, list):
             raise InterpolationError(
                 'variable {} is list {}'.format(repr(var_name), repr(value)), sections=ancestors_names, name=name
@@ -726,6 +2062,7 @@ class Section(dict):
         name: str,
         global_config: ConfigDict,
         refs: list[tuple[int, str]],
+        files: Optional[ReferencedFiles] = None,
     ) -> str | list[str]:
         """Interpolate variables in a parameter value.
 
@@ -738,6 +2075,7 @@ class Section(dict):
             name: Parameter name
             global_config: Global configuration
             refs: Reference chain for circular dependency detection
+            files: Configurations of the files already loaded, by path
 
         Returns:
             The value with all variables interpolated
@@ -747,12 +2085,12 @@ class Section(dict):
         def interpolate(match: re.Match) -> str:
             """Interpolation function for regex substitution."""
             return self._interpolate_parameter(
-                ancestors, ancestors_names, name, global_config, refs, **match.groupdict()
+                ancestors, ancestors_names, name, global_config, refs, files, **match.groupdict()
             )
 
         # Process each element (or the single value)
         value = [
-            INTERPOLATION.sub(interpolate, e) if isinstance(e, str) else e  # type: ignore
+            INTERPOLATION.sub(interpolate, e) if isinstance(e, str) and ('$' in e) else e  # type: ignore
             for e in (value if is_list else [value])
         ]
 
@@ -765,6 +2103,7 @@ class Section(dict):
         ancestors_names: AncestorNames,
         global_config: ConfigDict,
         refs: list[tuple[int, str]],
+        files: Optional[ReferencedFiles] = None,
     ) -> tuple[str, 'Section']:
         """Interpolate variables in section names.
 
@@ -777,6 +2116,7 @@ class Section(dict):
             ancestors_names: Names of ancestor sections
             global_config: Global configuration
             refs: Reference chain for circular dependency detection
+            files: Configurations of the files already loaded, by path
 
         Returns:
             Tuple of (resolved_section_name, section_object)
@@ -785,68 +2125,177 @@ class Section(dict):
         if match:
             # Section name is entirely a variable reference
             new_name, value = self._interpolate(
-                ancestors, ancestors_names, name, global_config, refs, **match.groupdict()
+                ancestors, ancestors_names, name, global_config, refs, files=files, **match.groupdict()
             )
             if isinstance(value, Section):
                 # Variable resolves to a section - interpolate it too
-                value.interpolate(global_config, ancestors, ancestors_names)
+                value.interpolate(global_config, ancestors, ancestors_names, files=files)
                 new_name = (new_name or '').split('/')[-1]
             else:
                 # Variable resolves to a value - create empty section
                 new_name, value = value, config_from_dict({})
         else:
             # Section name contains embedded variables
-            new_name = str(self.interpolate_parameter(name, ancestors, ancestors_names, name, global_config, []))
+            new_name = str(self.interpolate_parameter(name, ancestors, ancestors_names, name, global_config, [], files))
             value = self
 
         return new_name, value
 
+    @located
     def interpolate(
-        self, global_config: Optional[ConfigDict] = None, ancestors: Ancestors = (), ancestors_names: AncestorNames = ()
+        self,
+        global_config: Optional[ConfigDict] = None,
+        ancestors: Ancestors = (),
+        ancestors_names: AncestorNames = (),
+        instrumentation: Optional[Instrumentation] = None,
+        *,
+        errors: Optional[list[ConfigError]] = None,
+        files: Optional[ReferencedFiles] = None,
     ) -> 'Section':
         """Perform variable interpolation on the entire section.
 
         Recursively interpolates all parameters and section names,
         resolving variable references.
 
+        The files of the ``${file::path/to/variable}`` references are loaded on
+        their first reference and kept for the whole interpolation.
+
         Args:
             global_config: Global configuration for variable lookup
             ancestors: Tuple of ancestor sections
             ancestors_names: Tuple of ancestor section names
+            instrumentation: Optional instrumentation receiving the ``interpolate`` events
+            errors: Optional list collecting the errors instead of raising them. A parameter or
+              a section name that can't be interpolated is kept as is
+            files: Configurations of the referenced files already loaded, by path
 
         Returns:
             This section (for method chaining)
         """
         global_config = global_config or {}
 
+        if files is None:
+            # A reference back to this configuration file uses this configuration
+            files = {os.path.abspath(self.filename): self} if self.filename else {}
+
+        with self._track(instrumentation, 'interpolate', None):
+            self._interpolate_tree(global_config, ancestors, ancestors_names, instrumentation, errors, files)
+
+        self._depends_on(files)
+
+        return self
+
+    def _interpolate_tree(
+        self,
+        global_config: ConfigDict,
+        ancestors: Ancestors,
+        ancestors_names: AncestorNames,
+        instrumentation: Optional[Instrumentation],
+        errors: Optional[list[ConfigError]],
+        files: ReferencedFiles,
+        spec: Optional['Section'] = None,
+        completions: Optional[list[Completion]] = None,
+    ) -> None:
+        """Interpolate the parameters and the sub-sections of this section.
+
+        Args:
+            global_config: Global configuration for variable lookup
+            ancestors: Tuple of ancestor sections
+            ancestors_names: Tuple of ancestor section names
+            instrumentation: Optional instrumentation receiving the ``interpolate`` events of the sub-sections
+            errors: Optional list collecting the errors instead of raising them
+            files: Configurations of the referenced files already loaded, by path
+            spec: Specification of this section, when the interpolated sections are then completed
+            completions: List receiving the interpolated sections to complete with their specification
+        """
         # Interpolate all parameters in this section
-        for name, parameter in list(self.items()):
-            self[name] = self.interpolate_parameter(parameter, ancestors, ancestors_names, name, global_config, [])
+        self.update(
+            self._values(
+                errors,
+                self.items(),
+                lambda name, parameter: self.interpolate_parameter(
+                    parameter, ancestors, ancestors_names, name, global_config, [], files
+                ),
+            )
+        )
+
+        if (completions is not None) and (spec is not None):
+            completions.append((self, spec, ancestors_names, False))
 
         # Interpolate nested sections
-        sections = {}
+        sections = Sections.of(self)
         for name, section in self.sections.items():
             if not name.startswith('_'):  # Don't interpolate special sections (like __many__)
                 new_ancestors = ancestors + (self,)
                 new_ancestors_names = ancestors_names + (name,)
 
-                # Interpolate section name and get resolved section
-                name, value = section.interpolate_section(name, new_ancestors, new_ancestors_names, global_config, [])
-
-                # Merge resolved section with original and interpolate recursively
-                section = config_from_dict(value).merge(section)
-                section = section.interpolate(global_config, new_ancestors, new_ancestors_names)
+                # The interpolated section is a new one, so the counters are taken on the ``section`` variable
+                tracking = (
+                    instrumentation.track(
+                        'interpolate', name, lambda before: section._counters(references=before, content=not before)
+                    )
+                    if instrumentation
+                    else NO_TRACKING
+                )
+                with tracking:
+                    # Interpolate section name and get resolved section
+                    try:
+                        name, value = section.interpolate_section(
+                            name, new_ancestors, new_ancestors_names, global_config, [], files
+                        )
+                    except InterpolationError as e:
+                        self._failed(errors, e)
+                        value = {}
+
+                    # Merge resolved section with original and interpolate recursively
+                    section = config_from_dict(value).merge(section)
+                    if completions is None:
+                        section = section.interpolate(
+                            global_config, new_ancestors, new_ancestors_names, errors=errors, files=files
+                        )
+                    else:
+                        section._interpolate_tree(
+                            global_config,
+                            new_ancestors,
+                            new_ancestors_names,
+                            None,
+                            errors,
+                            files,
+                            self._sub_spec(spec, name),
+                            completions,
+                        )
+            elif completions is not None:
+                # Not interpolated, but completed and validated as a whole
+                sub_spec = self._sub_spec(spec, name)
+                if sub_spec is not None:
+                    completions.append((section, sub_spec, ancestors_names + (name,), True))
 
             sections[name] = section
 
         self.sections = sections
-        return self
+
+    @staticmethod
+    def _sub_spec(spec: Optional['Section'], name: str) -> Optional['Section']:
+        """Specification of a sub-section, ``None`` if the sub-section isn't specified."""
+        if spec is None:
+            return None
+
+        sub_spec = spec.sections.get(name)
+
+        return spec.sections.get('__many__') if sub_spec is None else sub_spec
 
     # Validation Methods
     # ------------------
 
+    @located
     def merge_defaults(
-        self, spec: 'Section', validator: Optional[Validator] = None, ancestors: AncestorNames = ()
+        self,
+        spec: 'Section',
+        validator: Optional['Validator'] = None,
+        ancestors: AncestorNames = (),
+        instrumentation: Optional[Instrumentation] = None,
+        *,
+        errors: Optional[list[ConfigError]] = None,
     ) -> 'Section':
         """Merge default values from a specification.
 
@@ -857,6 +2306,9 @@ class Section(dict):
             spec: Specification section containing default values
             validator: Validator instance to use
             ancestors: Ancestor section names for error reporting
+            instrumentation: Optional instrumentation receiving the ``merge_defaults`` events
+            errors: Optional list collecting the errors instead of raising them. A required
+              parameter then stays missing
 
         Returns:
             This section (for method chaining)
@@ -864,33 +2316,39 @@ class Section(dict):
         Raises:
             ParameterError: If a required parameter is missing
         """
-        validator = validator or Validator()
+        from .validate import Validator
 
-        # Add defaults for missing parameters
-        for k in set(spec) - set(self):
-            if k != '___many___':  # Skip special validation keys
-                default = validator.get_default_value(spec[k], ancestors, k)
-                if default is NO_DEFAULT:
-                    raise ParameterError('required', sections=ancestors, name=k)
+        validator = validator or Validator()
 
-                self[k] = default
+        with self._track(instrumentation, 'merge_defaults', None, validator):
+            # Add defaults for missing parameters
+            self.update(self._default_values(spec, validator, ancestors, errors))
 
-        # Recursively merge defaults for nested sections
-        for name, section in spec.sections.items():
-            if name != '__many__':  # Skip special validation sections
-                section = self.sections.get(name, Section()).merge_defaults(section, validator, ancestors + (name,))
-                self.sections[name] = section
+            # Recursively merge defaults for nested sections
+            for name, section in spec.sections.items():
+                if name != '__many__':  # Skip special validation sections
+                    self.sections[name] = self.sections.get(name, Section())
+                    with self.sections[name]._track(instrumentation, 'merge_defaults', name, validator):
+                        self.sections[name].merge_defaults(section, validator, ancestors + (name,), errors=errors)
 
-        # Handle __many__ specification for dynamic sections
-        many_sections = spec.sections.get('__many__')
-        if many_sections is not None:
-            for name in set(self.sections) - set(spec.sections):
-                self.sections[name].merge_defaults(many_sections, validator, ancestors + (name,))
+            # Handle __many__ specification for dynamic sections
+            many_sections = spec.sections.get('__many__')
+            if many_sections is not None:
+                for name in set(self.sections) - set(spec.sections):
+                    with self.sections[name]._track(instrumentation, 'merge_defaults', name, validator):
+                        self.sections[name].merge_defaults(many_sections, validator, ancestors + (name,), errors=errors)
 
         return self
 
+    @located
     def validate(
-        self, spec: 'Section', validator: Optional[Validator] = None, ancestors_names: AncestorNames = ()
+        self,
+        spec: 'Section',
+        validator: Optional['Validator'] = None,
+        ancestors_names: AncestorNames = (),
+        instrumentation: Optional[Instrumentation] = None,
+        *,
+        errors: Optional[list[ConfigError]] = None,
     ) -> 'Section':
         """Validate the section against a specification.
 
@@ -901,38 +2359,652 @@ class Section(dict):
             spec: Specification section defining validation rules
             validator: Validator instance to use
             ancestors_names: Ancestor section names for error reporting
+            instrumentation: Optional instrumentation receiving the ``validate`` events
+            errors: Optional list collecting the errors instead of raising them. An invalid
+              value is then kept unconverted
 
         Returns:
             This section (for method chaining)
         """
+        from .validate import Validator
+
         validator = validator or Validator()
 
+        with self._track(instrumentation, 'validate', None, validator):
+            self.update(self._validated_values(spec, validator, ancestors_names, errors))
+
+            # Validate nested sections that exist in both spec and config
+            for k in set(self.sections) & set(spec.sections):
+                with self.sections[k]._track(instrumentation, 'validate', k, validator):
+                    self.sections[k].validate(spec.sections[k], validator, ancestors_names + (k,), errors=errors)
+
+            # Handle __many__ specification for dynamic sections
+            many_sections = spec.sections.get('__many__')
+            if many_sections is not None:
+                for k in set(self.sections) - set(spec.sections):
+                    with self.sections[k]._track(instrumentation, 'validate', k, validator):
+                        self.sections[k].validate(many_sections, validator, ancestors_names + (k,), errors=errors)
+
+        return self
+
+    def _default_values(
+        self,
+        spec: 'Section',
+        validator: 'Validator',
+        ancestors_names: AncestorNames,
+        errors: Optional[list[ConfigError]],
+    ) -> ConfigDict:
+        """Default values of the parameters of a specification missing from this section.
+
+        Args:
+            spec: Specification of this section
+            validator: Validator instance to use
+            ancestors_names: Names of this section and its ancestors, for error reporting
+            errors: Optional list collecting the errors instead of raising them
+
+        Returns:
+            The default values, by parameter name
+
+        Raises:
+            ParameterError: If a required parameter is missing
+        """
+        from .validate import NO_DEFAULT
+
+        defaults = {}
+        for k in set(spec) - set(self):
+            if k != '___many___':  # Skip special validation keys
+                try:
+                    default = validator.get_default_value(spec[k], ancestors_names, k)
+                except SpecificationError as e:
+                    self._failed(errors, e)
+                    continue
+
+                if default is NO_DEFAULT:
+                    self._failed(errors, ParameterError('required', sections=ancestors_names, name=k))
+                else:
+                    defaults[k] = default
+
+        return defaults
+
+    def _validated_values(
+        self,
+        spec: 'Section',
+        validator: 'Validator',
+        ancestors_names: AncestorNames,
+        errors: Optional[list[ConfigError]],
+    ) -> ConfigDict:
+        """Validated values of the parameters of this section.
+
+        Args:
+            spec: Specification of this section
+            validator: Validator instance to use
+            ancestors_names: Names of this section and its ancestors, for error reporting
+            errors: Optional list collecting the errors instead of raising them
+
+        Returns:
+            The converted values, by parameter name
+        """
         section_keys = set(self)
         spec_keys = set(spec)
 
         # Validate parameters that exist in both spec and config
-        for k in section_keys & spec_keys:
-            self[k] = validator.validate(spec[k], self[k], ancestors_names, k)
-
-        # Validate nested sections that exist in both spec and config
-        for k in set(self.sections) & set(spec.sections):
-            self.sections[k].validate(spec.sections[k], validator, ancestors_names + (k,))
+        values = self._values(
+            errors,
+            ((k, self[k]) for k in section_keys & spec_keys),
+            lambda k, v: validator.validate(spec[k], v, ancestors_names, k),
+        )
 
         # Handle ___many___ specification for dynamic parameters
         many_parameters = spec.get('___many___')
         if many_parameters is not None:
-            for k in section_keys - spec_keys:
-                self[k] = validator.validate(many_parameters, self[k], ancestors_names, k)
+            values.update(
+                self._values(
+                    errors,
+                    ((k, self[k]) for k in section_keys - spec_keys),
+                    lambda k, v: validator.validate(many_parameters, v, ancestors_names, k),
+                )
+            )
+
+        return values
+
+    @located
+    def complete(
+        self,
+        spec: 'Section',
+        global_config: Optional[ConfigDict] = None,
+        validator: Optional['Validator'] = None,
+        *,
+        errors: Optional[list[ConfigError]] = None,
+        files: Optional[ReferencedFiles] = None,
+    ) -> 'Section':
+        """Interpolate, merge the defaults of a specification and validate, in a single traversal.
 
-        # Handle __many__ specification for dynamic sections
-        many_sections = spec.sections.get('__many__')
-        if many_sections is not None:
-            for k in set(self.sections) - set(spec.sections):
-                self.sections[k].validate(many_sections, validator, ancestors_names + (k,))
+        Same result as ``interpolate(global_config).merge_defaults(spec).validate(spec)``.
+        Each section is completed with its defaults and validated as soon as the interpolation
+        of the whole configuration is done, the interpolation reading the values before
+        their validation.
 
+        Args:
+            spec: Specification section defining validation rules and default values
+            global_config: Global configuration for variable lookup
+            validator: Validator instance to use
+            errors: Optional list collecting the errors instead of raising them
+            files: Configurations of the referenced files already loaded, by path (see ``interpolate()``)
+
+        Returns:
+            This section (for method chaining)
+
+        Raises:
+            ParameterError: If a required parameter is missing
+        """
+        from .validate import Validator
+
+        validator = validator or Validator()
+
+        # Sections to complete, their specification, their names and if their sub-sections are to complete too
+        completions: list[Completion] = []
+
+        if files is None:
+            files = {os.path.abspath(self.filename): self} if self.filename else {}
+
+        self._interpolate_tree(global_config or {}, (), (), None, errors, files, spec, completions)
+        self._depends_on(files)
+
+        for section, section_spec, names, recursive in completions:
+            if recursive:
+                section.merge_defaults(section_spec, validator, names, errors=errors)
+                section.validate(section_spec, validator, names, errors=errors)
+                continue
+
+            section.update(section._default_values(section_spec, validator, names, errors))
+            section.update(section._validated_values(section_spec, validator, names, errors))
+
+            # The specified sections missing from the configuration only have default values
+            for name, sub_spec in section_spec.sections.items():
+                if (name != '__many__') and (name not in section.sections):
+                    sub = section.sections[name] = Section()
+                    sub.merge_defaults(sub_spec, validator, names + (name,), errors=errors)
+                    sub.validate(sub_spec, validator, names + (name,), errors=errors)
+
+        return self
+
+
+def frozen(self: Any, *args: Any, **kw: Any) -> Any:
+    raise TypeError('frozen configuration')
+
+
+def frozen_value(value: Any) -> Any:
+    """Convert the lists of a parameter value into tuples.
+
+    Args:
+        value: The parameter value
+
+    Returns:
+        The value, with its lists converted
+    """
+    return tuple(frozen_value(v) for v in value) if isinstance(value, list) else value
+
+
+class FrozenSections(Sections):
+    """Read-only sub-sections of a frozen section."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __ior__ = pop = popitem = setdefault = update = clear = frozen  # type: ignore
+
+
+class FrozenSection(Section):
+    """Read-only section, created by ``Section.freeze()``."""
+
+    __setitem__ = __delitem__ = __ior__ = popitem = setdefault = update = clear = frozen  # type: ignore
+    _modified = merge = from_dict = frozen  # type: ignore
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == 'sections':
+            frozen(self)
+
+        super().__setattr__(name, value)
+
+    def pop(self, k: str, default: Any = None) -> Any:
+        frozen(self)
+
+    def freeze(self) -> 'FrozenSection':
         return self
 
 
+# Kinds of parameter values referenced in a mapped buffer
+RAW, UNQUOTED_VALUE, LIST, LINES = range(4)
+
+
+class MappedSource:
+    """Buffer the parameter values of mapped sections are decoded from.
+
+    A value is referenced by an integer packing its offset, its length and its kind:
+    ``offset << 34 | length << 2 | kind``.
+    """
+
+    __slots__ = ('buffer', 'encoding')
+
+    def __init__(self, buffer: bytes, encoding: str) -> None:
+        self.buffer = buffer
+        self.encoding = encoding
+
+    @staticmethod
+    def reference(span: tuple[int, int], kind: int) -> int:
+        start, end = span
+        return (start << 34) | ((end - start) << 2) | kind
+
+    def decode(self, reference: int) -> str | list[str]:
+        """Decode a referenced value.
+
+        Args:
+            reference: The reference
+
+        Returns:
+            The value, as ``Section.from_iter()`` would have parsed it
+        """
+        start = reference >> 34
+        value = str(self.buffer[start : start + ((reference >> 2) & 0xFFFFFFFF)], self.encoding)
+
+        kind = reference & 3
+        if kind == UNQUOTED_VALUE:
+            return Section.strip_quotes(value)
+
+        if kind == LIST:
+            return [Section.strip_quotes(e) for e, _, _ in TAIL.findall(',' + value)]
+
+        if kind == LINES:
+            return value.replace('\r\n', '\n')
+
+        return value
+
+
+class BufferLines:
+    """Iterator over the decoded lines of a buffer, from a position.
+
+    Attributes:
+        pos: Position of the next line
+    """
+
+    __slots__ = ('buffer', 'pos', 'encoding')
+
+    def __init__(self, buffer: bytes, pos: int, encoding: str) -> None:
+        self.buffer = buffer
+        self.pos = pos
+        self.encoding = encoding
+
+    def __iter__(self) -> 'BufferLines':
+        return self
+
+    def __next__(self) -> str:
+        if self.pos >= len(self.buffer):
+            raise StopIteration
+
+        end = self.buffer.find(b'\n', self.pos)
+        end = len(self.buffer) if end == -1 else end
+        line = str(self.buffer[self.pos : end], self.encoding)
+        self.pos = end + 1
+
+        return line.removesuffix('\r')
+
+
+class MappedSection(Section):
+    """Section parsed in place from the buffer of a file by ``config_from_file(..., mapped=True)``.
+
+    Its parameter values are kept as references into the file and only decoded, then
+    cached, the first time they are read. Any other operation than reading a
+    parameter, as iterating over the parameters or modifying the section, first
+    decodes all the values and turns the section into a plain ``Section``.
+
+    Attributes:
+        source: Buffer the values are decoded from
+    """
+
+    def __init__(self, source: MappedSource) -> None:
+        super().__init__()
+        self.source = source
+
+    def __reduce__(self) -> tuple[Callable[..., 'Section'], tuple[Any, ...]]:
+        """Pickle or deep copy the section with its buffer, without decoding its values.
+
+        Returns:
+            The function and the arguments rebuilding the section
+        """
+        return rebuild, (dict(dict.items(self)), dict(self.sections), self._attributes(), MappedSection)
+
+    def __copy__(self) -> 'Section':
+        """Shallow copy, sharing the buffer, the decoded values and the sub-sections.
+
+        Returns:
+            The copy
+        """
+        return rebuild(dict(dict.items(self)), dict(self.sections), self._attributes(), MappedSection)
+
+    def _attributes(self) -> ConfigDict:
+        return dict(super()._attributes(), source=self.source)
+
+    def __getitem__(self, k: str) -> Any:
+        if k not in self:
+            return self.sections[k]
+
+        value = dict.__getitem__(self, k)
+        if type(value) is int:
+            value = self.source.decode(value)
+            dict.__setitem__(self, k, value)
+
+        return value
+
+    def resolve(self) -> Section:
+        """Decode all the parameter values and turn this section into a plain ``Section``.
+
+        Returns:
+            This section
+        """
+        decode = self.source.decode
+        for name, value in dict.items(self):
+            if type(value) is int:
+                dict.__setitem__(self, name, decode(value))
+
+        del self.__dict__['source']
+        self.__class__ = Section  # type: ignore[assignment]
+
+        return self
+
+    def from_buffer(
+        self,
+        max_depth: int = 0,
+        instrumentation: Optional[Instrumentation] = None,
+        source_map: Optional['SourceMap'] = None,
+        filename: Optional[str] = None,
+        *,
+        errors: Optional[list[ConfigError]] = None,
+        only: Optional[Iterable[str]] = None,
+    ) -> 'MappedSection':
+        """Parse the configuration from the whole source buffer.
+
+        The lines are matched in place, without being decoded. Only the names are
+        decoded, the values are stored as references into the buffer.
+
+        Args:
+            max_depth: Maximum nesting depth (0 = unlimited). The sections too nested are skipped, with their
+              parameters and sub-sections
+            instrumentation: Optional instrumentation receiving the ``parse`` events
+            source_map: Optional map receiving the positions, the columns being counted in bytes
+            filename: File of the buffer, for the source map
+            errors: Optional list collecting the errors instead of raising them (see ``Section.from_iter()``)
+            only: Names of the top-level sections to parse (see ``Section.from_iter()``)
+
+        Returns:
+            This section (for method chaining)
+
+        Raises:
+            ParseError: If a line cannot be parsed
+            SectionError: If section structure is invalid
+            DirectiveError: If an unsupported directive is used
+            ParameterError: If parameter names are duplicated
+        """
+        if instrumentation:
+            instrumentation.start('parse')
+
+        start = time.perf_counter()
+
+        source = self.source
+        buffer, encoding = source.buffer, source.encoding
+        reference = source.reference
+        match = BUFFER_LINE.match
+        find = buffer.find
+        size = len(buffer)
+
+        path: list[Section] = [self]
+        names: list[str] = []
+        section: Section = self
+
+        top: Optional[tuple[str, int, int]] = None
+        top_line, top_start = 0, 0.0
+        counts = [0, 0]
+
+        rows, file = self._source_rows(source_map, filename, names)
+        nb_errors = len(errors) if errors is not None else 0
+
+        selected = None if only is None else set(only)
+        skipping = False
+        # Level of the sections ending the skipping
+        resume = 1
+
+        nb_lines = pos = 0
+        while pos < size:
+            if skipping:
+                # Jump to the next line that can be a section or the start of a multi-line value
+                candidate = BUFFER_SKIPPED_LINE.search(buffer, pos)
+                skipped_end = size if candidate is None else candidate.start()
+                nb_lines += len(BUFFER_LINE_BREAK.findall(buffer, pos, skipped_end))
+                if candidate is None:
+                    break
+
+                pos = skipped_end
+
+            nb_lines += 1
+
+            end = find(b'\n', pos)
+            end = size if end == -1 else end
+            x = match(buffer, pos, end)
+            line_start, pos = pos, end + 1
+            if skipping:
+                if x and x['multi_delimiter_start'] and not x['multi_delimiter_end']:
+                    try:
+                        nb_lines, pos, _ = self.find_multilines_end(buffer, nb_lines, pos, x['multi_delimiter_start'])
+                    except ParseError as e:
+                        self._failed(errors, e)
+                        break
+
+                if not (x and x['section'] and (len(x['section_in']) <= resume)):
+                    continue
+
+                skipping = False
+
+            if not x:
+                line = str(buffer[line_start:end], encoding).strip()
+                self._failed(errors, ParseError("invalid line '{}'".format(line), nb_lines))
+                continue
+
+            # Handle section definitions
+            # --------------------------
+
+            if x['section']:
+                name = self.strip_quotes(str(x['section'], encoding))
+
+                level = len(x['section_in'])
+                if len(x['section_out']) != level:
+                    self._failed(errors, SectionError('cannot compute the section depth', nb_lines, tuple(names), name))
+                    section = MappedSection(source)
+                    continue
+
+                if max_depth and (level >= max_depth):
+                    # Skip the section with its parameters and its sub-sections
+                    skipping, resume = True, max_depth - 1
+                    continue
+
+                directive = x['section_directive'] and str(x['section_directive'], encoding)
+                if directive == 'include':
+                    if instrumentation and (level == 1) and (top is not None):
+                        self._parsed(instrumentation, top, top_start, nb_lines - top_line, counts)
+                        top = None
+
+                    args = str(x['section_directive_args'] or b'', encoding)
+                    section = self._include(
+                        path, names, rows, level, args, nb_lines, filename, None, errors, source_map, encoding, counts
+                    )
+                    if (selected is not None) and (level == 1):
+                        skipping, resume = self._select(path[0], selected), 1
+                    continue
+
+                if (selected is not None) and (level == 1):
+                    skipping, resume = name not in selected, 1
+                    if skipping:
+                        if instrumentation and (top is not None):
+                            self._parsed(instrumentation, top, top_start, nb_lines - top_line, counts)
+                            top = None
+                        continue
+
+                section = self._open_section(
+                    path, names, name, level, directive, nb_lines, MappedSection(source), errors
+                )
+                if path[-1] is section:
+                    counts[0] += 1
+                    if source_map is not None:
+                        del rows[level:]
+                        rows.append(
+                            source_map.add(rows[-1], name, file, nb_lines, x.start('section_in') - line_start + 1)
+                        )
+
+                if instrumentation and (level == 1):
+                    if top is not None:
+                        self._parsed(instrumentation, top, top_start, nb_lines - top_line, counts)
+
+                    instrumentation.start('parse', name)
+                    top, top_line, top_start = (name, counts[0], counts[1]), nb_lines, time.perf_counter()
+
+            # Handle parameter definitions
+            # ----------------------------
+
+            if x['name']:
+                name = self.strip_quotes(str(x['name'], encoding))
+
+                duplicate = (name in section) or (name in section.sections)
+                if duplicate:
+                    self._failed(errors, ParameterError('duplicate parameter name', nb_lines, tuple(names), name))
+                elif (source_map is not None) and (path[-1] is section):
+                    source_map.add(rows[-1], name, file, nb_lines, x.start('name') - line_start + 1)
+
+                value: Any
+                if x['multi_delimiter_start']:
+                    if x['multi_delimiter_end']:
+                        value = reference(x.span('multi'), RAW)
+                    elif x.end('multi') == (end - 1 if buffer[end - 1 : end] == b'\r' else end):
+                        # The value is the slice up to the closing delimiter, whatever its size
+                        try:
+                            nb_lines, pos, value_end = self.find_multilines_end(
+                                buffer, nb_lines, pos, x['multi_delimiter_start']
+                            )
+                        except ParseError as e:
+                            self._failed(errors, e)
+                            break
+
+                        value = reference((x.start('multi'), value_end), LINES)
+                    else:
+                        # First line followed by spaces or a comment, not part of the value
+                        lines = BufferLines(buffer, pos, encoding)
+                        try:
+                            nb_lines, value = self.parse_multilines(
+                                lines, nb_lines, str(x['multi'], encoding), str(x['multi_delimiter_start'], encoding)
+                            )
+                        except ParseError as e:
+                            self._failed(errors, e)
+                            break
+
+                        pos = lines.pos
+                elif x.start('tail') == -1:
+                    value = reference(x.span('head'), UNQUOTED_VALUE)
+                elif (buffer[x.start('head')] in b'"\'') or (x.start('tail1') != -1) or (x.start('tail2') != -1):
+                    value = reference(x.span('value'), LIST)
+                else:
+                    value = reference(x.span('value'), RAW)
+
+                if not duplicate:
+                    dict.__setitem__(section, name, value)
+                    counts[1] += 1
+
+        if instrumentation:
+            if top is not None:
+                self._parsed(instrumentation, top, top_start, nb_lines - top_line + 1, counts)
+
+            self._parsed(instrumentation, None, start, nb_lines, counts)
+
+        if source_map is not None:
+            self.source_map = source_map
+
+        if filename is not None:
+            self.filename = filename
+
+        self._collected(errors, nb_errors, filename)
+
+        return self
+
+    @staticmethod
+    def find_multilines_end(buffer: bytes, nb_lines: int, pos: int, end: bytes) -> tuple[int, int, int]:
+        """Find the end of a multi-line value.
+
+        Args:
+            buffer: The buffer
+            nb_lines: Current line number
+            pos: Position of the line after the first line of the value
+            end: Closing delimiter to look for
+
+        Returns:
+            Tuple of (final line number, position of the next line, position of the value end)
+
+        Raises:
+            ParseError: If the closing delimiter is not found
+        """
+        found = pos
+        while True:
+            found = buffer.find(end, found)
+            if found == -1:
+                raise ParseError('no multiline value end found', nb_lines)
+
+            line_end = buffer.find(b'\n', found)
+            line_end = len(buffer) if line_end == -1 else line_end
+
+            # Only spaces and a comment can follow the delimiter
+            if BUFFER_MULTILINE_TRAILER.match(buffer, found + len(end), line_end):
+                break
+
+            found += 1
+
+        nb_lines += len(BUFFER_LINE_BREAK.findall(buffer, pos, line_end)) + 1
+
+        return nb_lines, line_end + 1, found
+
+
+def resolving(name: str) -> Callable[..., Any]:
+    method = getattr(Section, name)
+
+    def resolve(self: Section, *args: Any, **kw: Any) -> Any:
+        # The section can have been resolved since the method lookup, while evaluating the arguments
+        if isinstance(self, MappedSection):
+            self.resolve()
+
+        return method(self, *args, **kw)
+
+    return resolve
+
+
+# Operations accessing all the parameter values or modifying a mapped section
+for name in (
+    '__iter__',
+    '__reversed__',
+    '__eq__',
+    '__ne__',
+    '__or__',
+    '__ror__',
+    '__repr__',
+    '__setitem__',
+    '__delitem__',
+    '__ior__',
+    'items',
+    'values',
+    'copy',
+    'pop',
+    'popitem',
+    'setdefault',
+    'update',
+    'clear',
+    'merge',
+    'from_dict',
+):
+    setattr(MappedSection, name, resolving(name))
+
+
 Config = Section
 
 # Configuration Factory Functions
@@ -965,7 +3037,69 @@ def config_from_dict(d: ConfigDict) -> Section:
     return Config().from_dict(d)
 
 
-def config_from_iter(lines: LineIterator, global_config: Optional[ConfigDict] = None, max_depth: int = 0) -> Section:
+def config_from_json(string: str | bytes) -> Section:
+    """Create a configuration section from a JSON document.
+
+    The JSON objects are directly built as Section instances by the JSON
+    decoder: the nested objects become sections, the other values parameters.
+
+    Args:
+        string: JSON document, whose top-level value is an object
+
+    Returns:
+        A Section instance populated with the JSON data
+
+    Raises:
+        ConfigError: If the document isn't valid JSON or its top-level value isn't an object
+
+    Example:
+        config = config_from_json('{"app_name": "MyApp", "database": {"port": 5432}}')
+        print(config['database']['port'])  # 5432
+    """
+    import json
+
+    try:
+        config = json.loads(string, object_pairs_hook=Section.from_pairs)
+    except json.JSONDecodeError as e:
+        raise ConfigError('invalid JSON document: {}'.format(e)) from None
+
+    if not isinstance(config, Section):
+        raise ConfigError('the top-level JSON value is not an object')
+
+    return config
+
+
+def config_from_entries(entries: Iterable[Entry]) -> Section:
+    """Create a configuration section from its flattened form.
+
+    Args:
+        entries: The ``(parent index, name, parameters)`` entries returned by ``Section.entries()``
+
+    Returns:
+        The rebuilt configuration
+    """
+    sections: list[Section] = []
+    for parent, name, parameters in entries:
+        section = Section()
+        section.update(parameters)
+        if sections:
+            sections[parent].sections[name] = section
+
+        sections.append(section)
+
+    return sections[0]
+
+
+def config_from_iter(
+    lines: LineIterator,
+    global_config: Optional[ConfigDict] = None,
+    max_depth: int = 0,
+    instrumentation: Optional[Instrumentation] = None,
+    source_map: Optional['SourceMap'] = None,
+    *,
+    errors: Optional[list[ConfigError]] = None,
+    only: Optional[Iterable[str]] = None,
+) -> Section:
     """Create a configuration section from an iterator of lines.
 
     This is the core parsing function that processes configuration file
@@ -975,6 +3109,10 @@ def config_from_iter(lines: LineIterator, global_config: Optional[ConfigDict] =
         lines: Iterator yielding configuration file lines
         global_config: Global configuration dictionary for interpolation
         max_depth: Maximum section nesting depth (0 = unlimited)
+        instrumentation: Optional instrumentation receiving the ``parse`` events
+        source_map: Optional map receiving the positions of the sections and parameters
+        errors: Optional list collecting the errors instead of raising them (see ``collecting_errors()``)
+        only: Names of the top-level sections to parse, the others being skipped (see ``Section.from_iter()``)
 
     Returns:
         A Section instance populated with the parsed configuration
@@ -993,22 +3131,50 @@ def config_from_iter(lines: LineIterator, global_config: Optional[ConfigDict] =
         ])
         config = config_from_iter(lines)
     """
-    return Config().from_iter(lines, global_config, max_depth)
+    return Config().from_iter(
+        lines,
+        global_config,
+        max_depth,
+        instrumentation=instrumentation,
+        source_map=source_map,
+        errors=errors,
+        only=only,
+    )
 
 
 def config_from_file(
-    filename: str, global_config: Optional[ConfigDict] = None, max_depth: int = 0, encoding: str = 'utf-8'
+    filename: str,
+    global_config: Optional[ConfigDict] = None,
+    max_depth: int = 0,
+    encoding: str = 'utf-8',
+    instrumentation: Optional[Instrumentation] = None,
+    mapped: bool = False,
+    source_map: Optional['SourceMap'] = None,
+    *,
+    errors: Optional[list[ConfigError]] = None,
+    only: Optional[Iterable[str]] = None,
 ) -> Section:
     """Create a configuration section from a file.
 
     Reads and parses a configuration file, handling encoding and
     file operations automatically.
 
+    With ``mapped``, the file is read into a single buffer and parsed in place: the
+    parameter values are only decoded when read (see ``MappedSection``). The buffer
+    is a private copy of the file, so the values stay the ones parsed whatever
+    happens to the file. The encoding must then be ASCII compatible and the lines
+    ended by newlines, optionally preceded by carriage returns.
+
     Args:
         filename: Path to the configuration file to read
         global_config: Global configuration dictionary for interpolation
         max_depth: Maximum section nesting depth (0 = unlimited)
         encoding: File encoding
+        instrumentation: Optional instrumentation receiving the ``parse`` events
+        mapped: Parse the file in place and decode the values on their first read
+        source_map: Optional map receiving the positions of the sections and parameters
+        errors: Optional list collecting the errors instead of raising them (see ``collecting_errors()``)
+        only: Names of the top-level sections to parse, the others being skipped (see ``Section.from_iter()``)
 
     Returns:
         A Section instance populated with the file's configuration
@@ -1023,11 +3189,69 @@ def config_from_file(
         config = config_from_file('app.cfg')
         print(config['app_name'])
     """
-    with open(filename, encoding=encoding) as f:
-        return config_from_iter(f, global_config, max_depth)
+    if not mapped:
+        with open(filename, encoding=encoding) as f:
+            return Config().from_iter(
+                f,
+                global_config,
+                max_depth,
+                instrumentation=instrumentation,
+                source_map=source_map,
+                filename=filename,
+                errors=errors,
+                only=only,
+                encoding=encoding,
+            )
+
+    with open(filename, 'rb') as f:
+        buffer = f.read()
 
+    if not buffer:
+        return Config()
 
-def config_from_string(string: str, global_config: Optional[ConfigDict] = None, max_depth: int = 0) -> Section:
+    # An invalid content is reported now, as when the values are decoded while parsing
+    check_encoding(buffer, encoding)
+
+    return MappedSection(MappedSource(buffer, encoding)).from_buffer(
+        max_depth, instrumentation, source_map, filename, errors=errors, only=only
+    )
+
+
+def check_encoding(buffer: bytes, encoding: str, chunk_size: int = 1 << 20) -> None:
+    """Check that a buffer can be decoded, without keeping the decoded strings.
+
+    Args:
+        buffer: The buffer
+        encoding: The encoding
+        chunk_size: Number of bytes decoded at once
+
+    Raises:
+        UnicodeDecodeError: If the buffer can't be decoded, with the position in the whole buffer
+    """
+    import codecs
+
+    decoder = codecs.getincrementaldecoder(encoding)()
+    data = memoryview(buffer)
+
+    for pos in range(0, len(buffer), chunk_size):
+        pending = len(decoder.getstate()[0])
+        try:
+            decoder.decode(data[pos : pos + chunk_size], pos + chunk_size >= len(buffer))
+        except UnicodeDecodeError as e:
+            start = pos - pending
+            raise UnicodeDecodeError(e.encoding, buffer, start + e.start, start + e.end, e.reason) from None
+
+
+def config_from_string(
+    string: str,
+    global_config: Optional[ConfigDict] = None,
+    max_depth: int = 0,
+    instrumentation: Optional[Instrumentation] = None,
+    source_map: Optional['SourceMap'] = None,
+    *,
+    errors: Optional[list[ConfigError]] = None,
+    only: Optional[Iterable[str]] = None,
+) -> Section:
     """Create a configuration section from a string.
 
     Parses configuration syntax from a string, useful for testing
@@ -1037,6 +3261,10 @@ def config_from_string(string: str, global_config: Optional[ConfigDict] = None,
         string: Configuration content as a string
         global_config: Global configuration dictionary for interpolation
         max_depth: Maximum section nesting depth (0 = unlimited)
+        instrumentation: Optional instrumentation receiving the ``parse`` events
+        source_map: Optional map receiving the positions of the sections and parameters
+        errors: Optional list collecting the errors instead of raising them (see ``collecting_errors()``)
+        only: Names of the top-level sections to parse, the others being skipped (see ``Section.from_iter()``)
 
     Returns:
         A Section instance populated with the parsed configuration
@@ -1058,4 +3286,222 @@ def config_from_string(string: str, global_config: Optional[ConfigDict] = None,
         print(config['app_name'])  # 'MyApp'
         print(config['database']['port'])  # '5432'
     """
-    return config_from_iter(iter(string.splitlines()), global_config, max_depth)
+    return config_from_iter(
+        iter(string.splitlines()), global_config, max_depth, instrumentation, source_map, errors=errors, only=only
+    )
+
+
+def config_load(
+    filename: str,
+    spec: Section,
+    global_config: Optional[ConfigDict] = None,
+    encoding: str = 'utf-8',
+    validator: Optional['Validator'] = None,
+    source_map: Optional['SourceMap'] = None,
+    *,
+    errors: Optional[list[ConfigError]] = None,
+) -> Section:
+    """Load a configuration file: parse, interpolate, merge the defaults of a specification and validate.
+
+    Same result as ``config_from_file(filename).interpolate(global_config).merge_defaults(spec).validate(spec)``,
+    but the interpolation, the defaults merging and the validation are done in a single traversal
+    (see ``Section.complete()``).
+
+    Args:
+        filename: Path to the configuration file to read
+        spec: Specification section defining validation rules and default values
+        global_config: Global configuration dictionary for interpolation
+        encoding: File encoding
+        validator: Validator instance to use
+        source_map: Optional map receiving the positions of the sections and parameters, to locate the errors
+        errors: Optional list collecting the errors instead of raising them (see ``collecting_errors()``)
+
+    Returns:
+        The loaded configuration
+
+    Example:
+        config = config_load('app.cfg', config_from_file('app_spec.cfg'), {'here': os.getcwd()})
+    """
+    config = config_from_file(filename, encoding=encoding, source_map=source_map, errors=errors)
+
+    return config.complete(spec, global_config, validator, errors=errors)
+
+
+# Binary Serialization
+# ====================
+
+# Header of the binary encoding: magic, format version and ``marshal`` version
+BINARY_HEADER = b'NCF\x01' + bytes([marshal.version])
+
+
+def dumps(config: Section) -> bytes:
+    """Encode a configuration into a compact binary format.
+
+    The sections are flattened, in depth-first order, into a list of
+    ``(parent index, name, parameters)`` entries encoded with ``marshal``. The
+    parameter values can be strings, numbers, booleans, ``None``, lists and tuples.
+
+    The format depends on the ``marshal`` version, which is recorded in the header:
+    it's meant to be exchanged between processes of the same Python version.
+
+    Args:
+        config: The configuration to encode
+
+    Returns:
+        The encoded configuration
+
+    Raises:
+        SerializationError: If a parameter value can't be encoded
+    """
+    try:
+        return BINARY_HEADER + marshal.dumps(config.entries())
+    except ValueError:
+        raise SerializationError('unsupported value type') from None
+
+
+def loads(data: bytes) -> Section:
+    """Decode a configuration encoded by ``dumps()``.
+
+    As with ``marshal``, only decode data coming from a trusted source.
+
+    Args:
+        data: The encoded configuration
+
+    Returns:
+        The decoded configuration
+
+    Raises:
+        ConfigError: If the data was not encoded by ``dumps()`` for this Python version
+    """
+    if not data.startswith(BINARY_HEADER):
+        raise ConfigError('invalid binary configuration')
+
+    return config_from_entries(marshal.loads(memoryview(data)[len(BINARY_HEADER) :]))  # noqa: S302
+
+
+def restore(data: bytes, attributes: ConfigDict, cls: type[Section] = Section) -> Section:
+    """Decode a pickled configuration encoded by ``dumps()``.
+
+    Args:
+        data: The encoded configuration
+        attributes: The ``filename`` and ``source_map`` of the root section, if set
+        cls: Type of the root section, a frozen section being frozen with its descendants
+
+    Returns:
+        The decoded configuration
+    """
+    config = loads(data)
+    config.__dict__.update(attributes)
+
+    if issubclass(cls, FrozenSection):
+        return config.freeze()
+
+    config.__class__ = cls
+
+    return config
+
+
+def rebuild(
+    parameters: ConfigDict, sections: dict[str, Section], attributes: ConfigDict, cls: type[Section] = Section
+) -> Section:
+    """Rebuild a pickled or copied section from its parameters and its sub-sections.
+
+    Args:
+        parameters: The parameters
+        sections: The sub-sections
+        attributes: The ``filename``, ``source_map`` and ``source`` of the section, if set
+        cls: Type of the section
+
+    Returns:
+        The section
+    """
+    section = Section()
+    dict.update(section, parameters)
+    dict.update(section.sections, sections)
+    section.__dict__.update(attributes)
+
+    if issubclass(cls, FrozenSection):
+        # The sub-sections of a frozen section are frozen too
+        section.sections.__class__ = FrozenSections
+
+    section.__class__ = cls
+
+    return section
+
+
+# Structural Diff
+# ===============
+
+
+class Diff:
+    """Structural differences between two configurations.
+
+    The parameters and sections are identified by their path, the tuple of the
+    names of their ancestor sections followed by their own name.
+
+    Attributes:
+        added: The new parameters values and sections, by path
+        removed: The old parameters values and sections, by path
+        changed: The ``(old value, new value)`` of the modified parameters, by path
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty diff."""
+        self.added: dict[AncestorNames, Any] = {}
+        self.removed: dict[AncestorNames, Any] = {}
+        self.changed: dict[AncestorNames, tuple[Any, Any]] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+    def __repr__(self) -> str:
+        return '<Diff added={} removed={} changed={}>'.format(list(self.added), list(self.removed), list(self.changed))
+
+
+def diff(old: Section, new: Section) -> Diff:
+    """Compute the structural differences between two configurations.
+
+    A section added or removed is reported as a whole, not its content. The
+    identical subtrees are skipped by comparing their fingerprints, computed once
+    then kept until modified: diffing a configuration against a slightly modified
+    version of it only visits the modified paths.
+
+    Args:
+        old: The old configuration
+        new: The new configuration
+
+    Returns:
+        The differences
+    """
+    d = Diff()
+    if old.fingerprint() == new.fingerprint():
+        return d
+
+    stack: list[tuple[AncestorNames, Section, Section]] = [((), old, new)]
+    while stack:
+        path, old_section, new_section = stack.pop()
+
+        for name, value in old_section.items():
+            if name not in new_section:
+                d.removed[path + (name,)] = value
+            elif new_section[name] != value:
+                d.changed[path + (name,)] = (value, new_section[name])
+
+        for name, value in new_section.items():
+            if name not in old_section:
+                d.added[path + (name,)] = value
+
+        for name, section in old_section.sections.items():
+            if name in new_section.sections:
+                new_subsection = new_section.sections[name]
+                # The fingerprints were computed by the root sections ``fingerprint()``
+                if section._hash != new_subsection._hash:
+                    stack.append((path + (name,), section, new_subsection))
+            else:
+                d.removed[path + (name,)] = section
+
+        for name, section in new_section.sections.items():
+            if name not in old_section.sections:
+                d.added[path + (name,)] = section
+
+    return d
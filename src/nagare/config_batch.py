@@ -0,0 +1,137 @@
+# --
+# Copyright (c) 2014-2026 Net-ng.
+# All rights reserved.
+#
+# This software is licensed under the BSD License, as described in
+# the file LICENSE.txt, which you should have received as part of
+# this distribution.
+# --
+
+"""Batch validation of configurations against a shared specification.
+
+``validate_many()`` completes many configurations, like the configurations of the
+tenants of an application, with the defaults of the same specification and
+validates them in a pool of worker processes.
+
+The specification is encoded once, then decoded once by each worker, whose
+validator keeps the compiled specification expressions for all the
+configurations it validates. The configurations are sent and received in their
+binary encoding. The results are yielded as soon as each configuration is
+validated, so in the order of completion, with all the errors of the
+configuration collected.
+
+Example:
+    configs = {tenant: config_from_file(path) for tenant, path in tenants.items()}
+
+    for result in validate_many(configs, spec, workers=8):
+        if result.errors:
+            print(AggregatedError(result.errors))
+"""
+
+import os
+import multiprocessing
+from typing import Any, Iterable, Iterator, Optional, NamedTuple
+from collections.abc import Mapping
+
+from .config import Section, ConfigError, dumps, loads
+from .validate import Validator
+
+
+class Validated(NamedTuple):
+    """Result of the validation of a configuration.
+
+    Attributes:
+        name: Name of the configuration
+        config: The configuration, completed with the defaults and validated
+        errors: The errors, empty if the configuration is valid
+    """
+
+    name: Any
+    config: Section
+    errors: list[ConfigError]
+
+
+# Specification and validator of the current worker process
+_worker: Optional[tuple[Section, Validator]] = None
+
+
+def init_worker(spec: bytes) -> None:
+    """Decode the specification of the worker process.
+
+    Args:
+        spec: The specification, encoded by ``dumps()``
+    """
+    global _worker
+
+    _worker = (loads(spec), Validator())
+
+
+def validate(name: Any, config: Section, spec: Section, validator: Validator) -> Validated:
+    """Complete a configuration with the defaults of a specification and validate it.
+
+    Args:
+        name: Name of the configuration
+        config: The configuration, modified in place
+        spec: The specification
+        validator: Validator instance to use
+
+    Returns:
+        The result
+    """
+    errors: list[ConfigError] = []
+    config.merge_defaults(spec, validator, errors=errors).validate(spec, validator, errors=errors)
+
+    return Validated(name, config, errors)
+
+
+def validate_encoded(task: tuple[Any, bytes]) -> Validated:
+    """Validate a configuration in a worker process.
+
+    Args:
+        task: The name of the configuration and the configuration, encoded by ``dumps()``
+
+    Returns:
+        The result
+    """
+    name, config = task
+
+    return validate(name, loads(config), *_worker)  # type: ignore[misc]
+
+
+def validate_many(
+    configs: Mapping[Any, Section] | Iterable[tuple[Any, Section]],
+    spec: Section,
+    workers: Optional[int] = None,
+    chunksize: int = 1,
+) -> Iterator[Validated]:
+    """Complete configurations with the defaults of a specification and validate them, in parallel.
+
+    Args:
+        configs: The configurations, by name, or the ``(name, configuration)`` pairs
+        spec: The specification
+        workers: Number of worker processes, the number of CPUs by default. With ``0``, the
+          configurations are validated in place in the current process
+        chunksize: Number of configurations sent at once to a worker
+
+    Yields:
+        The result of each configuration, in the order of completion. Without worker, the
+        configuration of a result is the one given, else a copy
+
+    Example:
+        for name, config, errors in validate_many(configs, spec):
+            ...
+    """
+    if isinstance(configs, Mapping):
+        configs = configs.items()
+
+    if workers == 0:
+        validator = Validator()
+        for name, config in configs:
+            yield validate(name, config, spec, validator)
+
+        return
+
+    tasks = ((name, dumps(config)) for name, config in configs)
+
+    with multiprocessing.Pool(workers or os.cpu_count(), init_worker, (dumps(spec),)) as pool:
+        yield from pool.imap_unordered(validate_encoded, tasks, chunksize)
@@ -0,0 +1,346 @@
+# --
+# Copyright (c) 2014-2026 Net-ng.
+# All rights reserved.
+#
+# This software is licensed under the BSD License, as described in
+# the file LICENSE.txt, which you should have received as part of
+# this distribution.
+# --
+
+"""Precompilation of configurations into Python modules.
+
+A configuration file is loaded (parsed, interpolated, completed with the
+defaults of its specification and validated) then written as a Python module of
+literal constants. Importing this module, served from the Python bytecode cache,
+is much faster than loading the configuration again.
+
+The module records a fingerprint of the configuration and specification files
+contents, of the modification times of the fragments they include and of the
+files of their ``${file::path/to/variable}`` references, and of the global
+configuration: ``load_compiled()`` compiles the module again when this
+fingerprint doesn't match anymore.
+
+Example:
+    python -m nagare.config_compile app.cfg --spec app_spec.cfg -o app_cfg.py
+
+    config = load_compiled('app.cfg', 'app_cfg.py', 'app_spec.cfg')
+"""
+
+import io
+import os
+import sys
+import json
+import hashlib
+import argparse
+import tempfile
+import py_compile
+import importlib.util
+from typing import Any, Iterable, Optional
+
+from .config import Entry, Config, Section, ConfigDict, SerializationError, config_from_entries
+from .config_include import Inclusion
+
+# Version of the generated modules format, part of the fingerprint
+FORMAT = 2
+
+HEADER = '# Generated from {} by nagare.config_compile: do not edit\n'
+
+
+def read_sources(filename: str, spec_filename: Optional[str] = None) -> tuple[bytes, bytes]:
+    """Read the raw contents of the configuration and specification files.
+
+    Args:
+        filename: Path of the configuration file
+        spec_filename: Optional path of the specification file
+
+    Returns:
+        Tuple of (configuration, specification) contents
+    """
+    with open(filename, 'rb') as f:
+        config = f.read()
+
+    spec = b''
+    if spec_filename:
+        with open(spec_filename, 'rb') as f:
+            spec = f.read()
+
+    return config, spec
+
+
+def modification_times(paths: Iterable[str]) -> Optional[dict[str, int]]:
+    """Read the current modification times of files.
+
+    Args:
+        paths: Paths of the files
+
+    Returns:
+        The modification times, by path, or ``None`` if a file doesn't exist anymore
+    """
+    try:
+        return {path: os.stat(path).st_mtime_ns for path in paths}
+    except OSError:
+        return None
+
+
+def fingerprint(
+    config: bytes,
+    spec: bytes = b'',
+    global_config: Optional[ConfigDict] = None,
+    dependencies: Optional[dict[str, int]] = None,
+) -> str:
+    """Compute the fingerprint of the sources of a compiled configuration.
+
+    Args:
+        config: Content of the configuration file
+        spec: Content of the specification file
+        global_config: Global configuration dictionary for interpolation
+        dependencies: Modification times of the other files the configuration was loaded from, by path
+
+    Returns:
+        Hexadecimal digest of the sources
+    """
+    h = hashlib.sha256(b'%d\0' % FORMAT)
+    for data in (
+        config,
+        spec,
+        json.dumps(global_config or {}, sort_keys=True, default=repr).encode('utf-8'),
+        json.dumps(sorted((dependencies or {}).items())).encode('utf-8'),
+    ):
+        h.update(b'%d\0' % len(data))
+        h.update(data)
+
+    return h.hexdigest()
+
+
+def load(
+    config: bytes,
+    spec: bytes = b'',
+    global_config: Optional[ConfigDict] = None,
+    encoding: str = 'utf-8',
+    filename: Optional[str] = None,
+    spec_filename: Optional[str] = None,
+    dependencies: Optional[dict[str, int]] = None,
+) -> Section:
+    """Run the loading pipeline on the contents of the configuration and specification files.
+
+    Args:
+        config: Content of the configuration file
+        spec: Content of the specification file
+        global_config: Global configuration dictionary for interpolation
+        encoding: Files encoding
+        filename: Path of the configuration file, the included fragments being relative to its directory
+        spec_filename: Path of the specification file, the included fragments being relative to its directory
+        dependencies: Optional dictionary receiving the modification times of the included fragments and of
+          the referenced files, by path. The fragments included by the referenced files are not tracked
+
+    Returns:
+        The parsed, interpolated and validated configuration
+    """
+    inclusion = Inclusion.of(filename, encoding)
+    spec_inclusion = Inclusion.of(spec_filename, encoding)
+
+    # Iterate over the lines like ``config_from_file()`` does
+    section = Config().from_iter(
+        io.StringIO(config.decode(encoding), newline=None), global_config, filename=filename, inclusion=inclusion
+    )
+    # A reference back to the configuration file uses this configuration
+    path = os.path.abspath(filename) if filename else None
+    files = {path: section} if path else {}
+
+    if spec:
+        specification = Config().from_iter(
+            io.StringIO(spec.decode(encoding), newline=None), filename=spec_filename, inclusion=spec_inclusion
+        )
+        section.complete(specification, global_config, files=files)
+    else:
+        section.interpolate(global_config, files=files)
+
+    if dependencies is not None:
+        dependencies.update(inclusion.dependencies)
+        dependencies.update(spec_inclusion.dependencies)
+        dependencies.update({referenced: os.stat(referenced).st_mtime_ns for referenced in files if referenced != path})
+
+    return section
+
+
+def is_literal(value: Any) -> bool:
+    """Check that the ``repr()`` of a value is a Python literal evaluating to the same value.
+
+    Args:
+        value: The value to check
+
+    The subclasses of the literal types, as enumerations, are rejected: their
+    ``repr()`` isn't a literal or evaluates to an instance of the base type.
+
+    Returns:
+        True if the value can be written in a compiled module
+    """
+    if type(value) in (list, tuple):
+        return all(is_literal(v) for v in value)
+
+    if type(value) is float:
+        return value - value == 0  # Not infinite nor NaN
+
+    return (value is None) or (type(value) in (str, int, bool))
+
+
+def generate(section: Section, digest: str, source: str = '', dependencies: Iterable[str] = ()) -> str:
+    """Generate the source of the Python module holding a loaded configuration.
+
+    Args:
+        section: The loaded configuration
+        digest: Fingerprint of the configuration sources
+        source: Path of the configuration file, for the module header
+        dependencies: Paths of the other files the configuration was loaded from
+
+    Returns:
+        The source of the module
+
+    Raises:
+        SerializationError: If a value isn't a literal
+    """
+    entries = section.entries()
+    names: list[tuple[str, ...]] = []
+
+    out = io.StringIO()
+    out.write(HEADER.format(source or 'a configuration'))
+    out.write('\nFINGERPRINT = {!r}\n\nDEPENDENCIES = {!r}\n'.format(digest, sorted(dependencies)))
+    out.write('\nENTRIES = [\n')
+
+    for parent, name, parameters in entries:
+        names.append((names[parent] + (name,)) if parent >= 0 else ())
+
+        for k, v in parameters.items():
+            if not is_literal(v):
+                raise SerializationError('value {} is not a literal'.format(repr(v)), sections=names[-1], name=k)
+
+        out.write('    {!r},\n'.format((parent, name, parameters)))
+
+    out.write(']\n')
+
+    return out.getvalue()
+
+
+def compile_config(
+    filename: str,
+    output: str,
+    spec_filename: Optional[str] = None,
+    global_config: Optional[ConfigDict] = None,
+    encoding: str = 'utf-8',
+) -> Section:
+    """Load a configuration file and write it as a Python module.
+
+    The module is atomically replaced and its bytecode cache written.
+
+    Args:
+        filename: Path of the configuration file
+        output: Path of the Python module to write
+        spec_filename: Optional path of the specification file
+        global_config: Global configuration dictionary for interpolation
+        encoding: Files encoding
+
+    Returns:
+        The loaded configuration
+    """
+    config, spec = read_sources(filename, spec_filename)
+    dependencies: dict[str, int] = {}
+    section = load(config, spec, global_config, encoding, filename, spec_filename, dependencies)
+
+    source = generate(section, fingerprint(config, spec, global_config, dependencies), filename, dependencies)
+
+    # A temporary file per compilation, in the same directory to be atomically renamed
+    fd, tmp = tempfile.mkstemp(suffix='.py', dir=os.path.dirname(output) or None)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(source)
+        os.replace(tmp, output)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+    # The bytecode cache is only checked against the module mtime and size, which can be unchanged
+    py_compile.compile(output, doraise=True)
+
+    return section
+
+
+def import_compiled(output: str) -> Optional[tuple[str, list[Entry], list[str]]]:
+    """Import a compiled configuration module.
+
+    Args:
+        output: Path of the Python module
+
+    Returns:
+        Tuple of (fingerprint, entries, dependencies) or ``None`` if the module doesn't exist or is corrupted
+    """
+    if not os.path.exists(output):
+        return None
+
+    spec = importlib.util.spec_from_file_location('_nagare_compiled_config', output)
+    if (spec is None) or (spec.loader is None):
+        return None
+
+    module = importlib.util.module_from_spec(spec)
+    try:
+        spec.loader.exec_module(module)
+
+        # The modules of a previous format don't have dependencies and have another fingerprint
+        return module.FINGERPRINT, module.ENTRIES, getattr(module, 'DEPENDENCIES', [])
+    except (SyntaxError, AttributeError):
+        # Truncated or edited module, to compile again
+        return None
+
+
+def load_compiled(
+    filename: str,
+    output: str,
+    spec_filename: Optional[str] = None,
+    global_config: Optional[ConfigDict] = None,
+    encoding: str = 'utf-8',
+) -> Section:
+    """Load a configuration from its compiled module, compiling it again if it's stale.
+
+    Args:
+        filename: Path of the configuration file
+        output: Path of the compiled Python module
+        spec_filename: Optional path of the specification file
+        global_config: Global configuration dictionary for interpolation
+        encoding: Files encoding
+
+    Returns:
+        The loaded configuration
+    """
+    compiled = import_compiled(output)
+    if compiled is not None:
+        config, spec = read_sources(filename, spec_filename)
+        dependencies = modification_times(compiled[2])
+        if (dependencies is not None) and (compiled[0] == fingerprint(config, spec, global_config, dependencies)):
+            return config_from_entries(compiled[1])
+
+    return compile_config(filename, output, spec_filename, global_config, encoding)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m nagare.config_compile', description='Compile a configuration into a Python module'
+    )
+    parser.add_argument('filename', help='configuration file')
+    parser.add_argument('-s', '--spec', help='specification file')
+    parser.add_argument(
+        '-o', '--output', help='Python module to write (default: the configuration file with a .py suffix)'
+    )
+    parser.add_argument('-e', '--encoding', default='utf-8', help='files encoding (default: utf-8)')
+    args = parser.parse_args(argv)
+
+    output = args.output or (os.path.splitext(args.filename)[0] + '.py')
+    try:
+        compile_config(args.filename, output, args.spec, encoding=args.encoding)
+    except (OSError, ValueError) as e:
+        print('{}: {}'.format(args.filename, e), file=sys.stderr)
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
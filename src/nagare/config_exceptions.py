@@ -54,6 +54,9 @@ class ConfigError(ValueError):
         super().__init__(error)
         self.error = error
         self.line = line
+        # Set from a source map, when the configuration was parsed with one
+        self.column: int | None = None
+        self.filename: str | None = None
 
     @property
     def context(self) -> str:
@@ -68,7 +71,13 @@ class ConfigError(ValueError):
             >>> error.context
             ' line #42'
         """
-        return f' line #{self.line}' if self.line else ''
+        context = f' line #{self.line}' if self.line else ''
+        if self.column:
+            context += f', column #{self.column}'
+        if self.filename:
+            context += f' of {self.filename!r}'
+
+        return context
 
     def __str__(self) -> str:
         """Return a human-readable string representation of the error.
@@ -326,3 +335,93 @@ class DirectiveError(ContextualParseError):
             with the full hierarchical context
         """
         return super().context + f' in section{self.sections}'
+
+
+class SerializationError(ContextualParseError):
+    """Exception raised when a configuration can't be written back in the configuration syntax.
+
+    The configuration syntax has no escape sequences, so some names or values
+    (like a value with a newline in a list) can't be written in a way they would
+    be read back identically.
+
+    Example:
+        >>> error = SerializationError(
+        ...     "value with both quote characters",
+        ...     sections=("app",),
+        ...     name="title"
+        ... )
+        >>> str(error)
+        'Error in section [app] > title: value with both quote characters'
+    """
+
+    @property
+    def context(self) -> str:
+        """Get serialization-specific context information.
+
+        Returns:
+            A formatted string indicating this is a serialization error
+            with the full hierarchical context
+        """
+        return super().context + f' in section{self.sections}'
+
+
+class AggregatedError(ConfigError):
+    """Exception aggregating all the errors found in a configuration.
+
+    Raised when the errors are collected instead of stopping on the first one
+    (see ``collecting_errors()``). The errors are ordered by position: first the
+    errors with a line number, by file, line and column, then the others by
+    section path and name.
+
+    Args:
+        errors: The errors collected
+
+    Attributes:
+        errors (list[ConfigError]): The errors, ordered by position
+
+    Example:
+        >>> error = AggregatedError([
+        ...     ParameterError("required", sections=("app",), name="port"),
+        ...     ParseError("invalid line 'x'", line=3),
+        ... ])
+        >>> print(error)
+        2 errors:
+          Error line #3: invalid line 'x'
+          Error for specification [app] > port for parameter [app] > port: required
+    """
+
+    def __init__(self, errors: list[ConfigError]) -> None:
+        """Initialize an AggregatedError instance.
+
+        Args:
+            errors: The errors collected
+        """
+        super().__init__('{} error{}'.format(len(errors), 's' if len(errors) > 1 else ''))
+        self.errors = sorted(errors, key=self.position)
+
+    @staticmethod
+    def position(error: ConfigError) -> tuple[bool, str, int, int, tuple[str, ...], str]:
+        """Sort key of an error.
+
+        Args:
+            error: The error
+
+        Returns:
+            The sort key, the errors without line number being the last ones
+        """
+        return (
+            error.line is None,
+            error.filename or '',
+            error.line or 0,
+            error.column or 0,
+            getattr(error, '_sections', ()),
+            getattr(error, 'name', None) or '',
+        )
+
+    def __str__(self) -> str:
+        """Return all the errors, one per line.
+
+        Returns:
+            The number of errors followed by the errors
+        """
+        return '\n  '.join(['{}:'.format(self.error)] + [str(error) for error in self.errors])
@@ -0,0 +1,113 @@
+# --
+# Copyright (c) 2014-2026 Net-ng.
+# All rights reserved.
+#
+# This software is licensed under the BSD License, as described in
+# the file LICENSE.txt, which you should have received as part of
+# this distribution.
+# --
+
+"""Atomic publication of configurations to concurrent readers.
+
+A ``ConfigHandle`` follows the read-copy-update pattern: the readers never lock
+and always see a complete, read-only configuration, while a reload builds a new
+configuration off to the side then publishes it with a single attribute
+assignment.
+
+Example:
+    handle = ConfigHandle(config_from_file('app.cfg'))
+
+    # Reader
+    with handle.read() as config:
+        connect(config['database']['host'], config['database']['port'])
+
+    # Writer
+    handle.reload(lambda: config_from_file('app.cfg'))
+"""
+
+import threading
+from typing import Callable, Iterator, Optional, NamedTuple
+from contextlib import contextmanager
+
+from .config import Section, FrozenSection
+
+
+class Snapshot(NamedTuple):
+    """A published configuration.
+
+    Attributes:
+        config: The read-only configuration
+        generation: Number of the publication, starting at 0
+    """
+
+    config: FrozenSection
+    generation: int
+
+
+class ConfigHandle:
+    """Holder of the current configuration snapshot.
+
+    Attributes:
+        snapshot: The current snapshot, replaced as a whole at each publication
+    """
+
+    def __init__(self, config: Optional[Section] = None) -> None:
+        """Initialize the handle.
+
+        Args:
+            config: The initial configuration, frozen in place (empty by default)
+        """
+        self.snapshot = Snapshot((config or Section()).freeze(), 0)
+        # Serialize the writers only
+        self._lock = threading.Lock()
+
+    @property
+    def config(self) -> FrozenSection:
+        """The current configuration."""
+        return self.snapshot.config
+
+    @property
+    def generation(self) -> int:
+        """The current generation."""
+        return self.snapshot.generation
+
+    @contextmanager
+    def read(self) -> Iterator[FrozenSection]:
+        """Read a consistent configuration across several accesses.
+
+        The configuration received stays the same during the whole block, even if a
+        new one is published meanwhile.
+
+        Yields:
+            The current configuration
+        """
+        yield self.snapshot.config
+
+    def publish(self, config: Section) -> Snapshot:
+        """Freeze a configuration in place and make it the current one.
+
+        Args:
+            config: The new configuration, not to be modified anymore by the caller
+
+        Returns:
+            The new snapshot
+        """
+        frozen = config.freeze()
+
+        with self._lock:
+            self.snapshot = snapshot = Snapshot(frozen, self.snapshot.generation + 1)
+
+        return snapshot
+
+    def reload(self, loader: Callable[[], Section]) -> Snapshot:
+        """Load a new configuration and publish it.
+
+        If the loader raises an exception, the current configuration stays in place.
+
+        Args:
+            loader: Function loading the configuration (parsing, interpolation, validation ...)
+
+        Returns:
+            The new snapshot
+        """
+        return self.publish(loader())
@@ -0,0 +1,264 @@
+# --
+# Copyright (c) 2014-2026 Net-ng.
+# All rights reserved.
+#
+# This software is licensed under the BSD License, as described in
+# the file LICENSE.txt, which you should have received as part of
+# this distribution.
+# --
+
+"""Inclusion of configuration fragments.
+
+A ``[$(include path)]`` section line includes the parameters and the sections of
+another file, the fragment, into the parent of a section of this level: at the
+first level, into the root. The parent section then becomes the current one. The
+fragment sections are nested relatively to this parent, so the same fragment can
+be included at any level. As with a textual inclusion, the names of the fragment
+can't already be used by the including section.
+
+A relative path is resolved from the directory of the including file, or from the
+current directory when the configuration is not read from a file.
+
+The fragments are read with the encoding of the including file and parsed once
+per process, by path and encoding: they are kept in ``INCLUDES`` in their binary
+encoding, with the modification times of the fragment and of all the
+fragments it includes, and parsed again only when one of them changed.
+
+Example:
+    # tenant.cfg
+    name = tenant1
+
+    [$(include common/logging.cfg)]
+
+    [database]
+    [[$(include common/pool.cfg)]]
+    host = db1
+"""
+
+import os
+from typing import Optional, NamedTuple
+
+from .config import Section, ConfigError, SectionError, DirectiveError, ParameterError, dumps, loads
+from .config_source import SourceMap
+
+
+class Inclusion:
+    """Files being included, from the outermost one.
+
+    Attributes:
+        files: Absolute paths of the files being parsed, the last one being the current one
+        dependencies: Modification times of the files the current one depends on, by path
+        encoding: Encoding of the fragments
+    """
+
+    __slots__ = ('files', 'dependencies', 'encoding')
+
+    def __init__(
+        self, files: tuple[str, ...] = (), dependencies: Optional[dict[str, int]] = None, encoding: str = 'utf-8'
+    ) -> None:
+        self.files = files
+        self.dependencies = dependencies or {}
+        self.encoding = encoding
+
+    @classmethod
+    def of(cls, filename: Optional[str], encoding: str = 'utf-8') -> 'Inclusion':
+        return cls((os.path.abspath(filename),) if filename else (), encoding=encoding)
+
+    def resolve(self, path: str) -> str:
+        """Absolute path of a fragment included by the current file.
+
+        Args:
+            path: Path of the fragment, relative to the directory of the current file
+
+        Returns:
+            The absolute path
+        """
+        directory = os.path.dirname(self.files[-1]) if self.files else os.getcwd()
+
+        return os.path.normpath(os.path.join(directory, os.path.expanduser(path)))
+
+
+class Fragment(NamedTuple):
+    """A parsed fragment.
+
+    Attributes:
+        data: The configuration, encoded by ``dumps()``
+        source_map: Positions of the sections and parameters of the configuration
+        dependencies: Modification times of the fragment and of the fragments it includes, by path
+    """
+
+    data: bytes
+    source_map: SourceMap
+    dependencies: dict[str, int]
+
+
+class IncludeCache:
+    """Parsed fragments, by path and encoding.
+
+    Two threads including the same fragment at the same time can both parse it,
+    the last one being kept.
+
+    Attributes:
+        hits: Number of fragments found in the cache
+        misses: Number of fragments parsed
+    """
+
+    def __init__(self) -> None:
+        self.fragments: dict[tuple[str, str], Fragment] = {}
+        self.hits = self.misses = 0
+
+    def clear(self) -> None:
+        self.fragments.clear()
+        self.hits = self.misses = 0
+
+    def get(self, path: str, encoding: str = 'utf-8') -> Optional[Fragment]:
+        """Retrieve a fragment, if none of the files it depends on was modified since its parsing.
+
+        Args:
+            path: Absolute path of the fragment
+            encoding: Encoding the fragment was read with
+
+        Returns:
+            The fragment or ``None``
+        """
+        fragment = self.fragments.get((path, encoding))
+        try:
+            valid = (fragment is not None) and all(
+                mtime == os.stat(dependency).st_mtime_ns for dependency, mtime in fragment.dependencies.items()
+            )
+        except OSError:
+            valid = False
+
+        if not valid:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return fragment
+
+    def parse(self, path: str, inclusion: Inclusion, errors: Optional[list[ConfigError]] = None) -> Fragment:
+        """Parse a fragment and cache it if valid.
+
+        Args:
+            path: Absolute path of the fragment
+            inclusion: Files being included, down to the fragment, receiving its dependencies and
+              giving its encoding
+            errors: Optional list collecting the parsing errors of the fragment, which is then not cached
+
+        Returns:
+            The fragment
+
+        Raises:
+            ConfigError: If the fragment is invalid, the error having the fragment as filename
+            OSError: If the fragment can't be read
+        """
+        source_map = SourceMap()
+        fragment_errors: list[ConfigError] = []
+
+        with open(path, encoding=inclusion.encoding) as f:
+            inclusion.dependencies[path] = os.fstat(f.fileno()).st_mtime_ns
+            try:
+                config = Section().from_iter(
+                    f,
+                    source_map=source_map,
+                    filename=path,
+                    errors=None if errors is None else fragment_errors,
+                    inclusion=inclusion,
+                )
+            except ConfigError as e:
+                e.filename = e.filename or path
+                raise
+
+        fragment = Fragment(dumps(config), source_map, inclusion.dependencies)
+        if fragment_errors:
+            errors.extend(fragment_errors)  # type: ignore[union-attr]
+        else:
+            self.fragments[path, inclusion.encoding] = fragment
+
+        return fragment
+
+
+# Fragments parsed by the process
+INCLUDES = IncludeCache()
+
+
+def include(
+    target: Section,
+    names: list[str],
+    path: str,
+    nb_lines: int,
+    inclusion: Inclusion,
+    errors: Optional[list[ConfigError]] = None,
+    source_map: Optional[SourceMap] = None,
+    row: int = 0,
+    counts: Optional[list[int]] = None,
+) -> None:
+    """Include a fragment into a section.
+
+    Args:
+        target: The section
+        names: Names of the section and its ancestors, below the root
+        path: Path of the fragment, as written in the directive
+        nb_lines: Line number of the directive
+        inclusion: Files being included, down to the file of the directive, with the encoding of the fragments
+        errors: Optional list collecting the errors instead of raising them. The names already
+          used by the section are then skipped
+        source_map: Optional map receiving the positions of the fragment sections and parameters
+        row: Row of the section in the source map
+        counts: Optional numbers of sections and parameters, incremented with the included ones
+
+    Raises:
+        ConfigError: If the fragment is invalid, the error having the fragment as filename
+        DirectiveError: If the fragment can't be read or is part of an include cycle
+        SectionError: If a section name of the fragment is already used by the section
+        ParameterError: If a parameter name of the fragment is already used by the section
+    """
+    path = inclusion.resolve(Section.strip_quotes(path.strip()))
+
+    fragment = INCLUDES.get(path, inclusion.encoding)
+    dependencies = fragment.dependencies if fragment is not None else {path: 0}
+
+    # Files being included, from the first one included by the fragment
+    cycle = [i for i, filename in enumerate(inclusion.files) if filename in dependencies]
+    if cycle:
+        files = inclusion.files[cycle[0] :] + (path, inclusion.files[cycle[0]])
+        error = 'include cycle {}'.format(' -> '.join(map(repr, files[: -1 if path in inclusion.files else None])))
+        Section._failed(errors, DirectiveError(error, nb_lines, tuple(names), 'include'))
+        return
+
+    if fragment is None:
+        try:
+            fragment = INCLUDES.parse(path, Inclusion(inclusion.files + (path,), encoding=inclusion.encoding), errors)
+        except OSError as e:
+            error = 'cannot include {!r}: {}'.format(path, e.strerror)
+            Section._failed(errors, DirectiveError(error, nb_lines, tuple(names), 'include'))
+            return
+
+    inclusion.dependencies.update(fragment.dependencies)
+    config = loads(fragment.data)
+
+    # As for a textual inclusion, the names of the fragment can't be already used.
+    # The keys of the section are directly read, not to resolve a mapped section
+    duplicates = (set(config) | set(config.sections)) & (set(dict.keys(target)) | set(target.sections))
+    for name in sorted(duplicates):
+        if name in config:
+            Section._failed(errors, ParameterError('duplicate parameter name', nb_lines, tuple(names), name))
+        else:
+            Section._failed(errors, SectionError('duplicate section name', nb_lines, tuple(names), name))
+
+    parameters = {name: value for name, value in config.items() if name not in duplicates}
+    dict.update(target, parameters)
+    for name, section in config.sections.items():
+        if name not in duplicates:
+            target.sections[name] = section
+
+            if counts is not None:
+                counters = section._counters()
+                counts[0] += counters['sections'] + 1
+                counts[1] += counters['parameters']
+
+    if counts is not None:
+        counts[1] += len(parameters)
+
+    if source_map is not None:
+        source_map.graft(fragment.source_map, row)
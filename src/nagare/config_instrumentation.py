@@ -0,0 +1,122 @@
+# --
+# Copyright (c) 2014-2026 Net-ng.
+# All rights reserved.
+#
+# This software is licensed under the BSD License, as described in
+# the file LICENSE.txt, which you should have received as part of
+# this distribution.
+# --
+
+"""Configuration Instrumentation Module.
+
+This module defines the instrumentation interface used to observe the loading
+phases of a configuration: parsing (``parse``), variable interpolation
+(``interpolate``), default values merging (``merge_defaults``) and validation
+(``validate``).
+
+An instrumentation receives a ``start`` and an ``end`` event for each phase and
+for each top-level section processed by the phase. The ``end`` events carry the
+elapsed time and the counters collected during the phase.
+
+Example:
+    from nagare.config import Timings, config_from_file
+
+    timings = Timings()
+    config = config_from_file('app.cfg', instrumentation=timings)
+    config.interpolate(instrumentation=timings)
+
+    for phase, section, elapsed, counters in timings.records:
+        print(phase, section or '', f'{elapsed * 1000:.3f}ms', counters)
+"""
+
+import time
+from typing import Callable, Iterator, Optional
+from contextlib import contextmanager
+
+Counters = dict[str, int]
+Record = tuple[str, Optional[str], float, Counters]
+
+
+class Instrumentation:
+    """Default instrumentation, which ignores all the events.
+
+    Subclass it and override ``start()`` and ``end()`` to collect the events.
+    """
+
+    def start(self, phase: str, section: Optional[str] = None) -> None:
+        """Called when a phase, or a top-level section of a phase, begins.
+
+        Args:
+            phase: Name of the phase (``parse``, ``interpolate``, ``merge_defaults`` or ``validate``)
+            section: Name of the top-level section or ``None`` for the whole phase
+        """
+
+    def end(self, phase: str, section: Optional[str] = None, elapsed: float = 0.0, **counters: int) -> None:
+        """Called when a phase, or a top-level section of a phase, is done.
+
+        Args:
+            phase: Name of the phase (``parse``, ``interpolate``, ``merge_defaults`` or ``validate``)
+            section: Name of the top-level section or ``None`` for the whole phase
+            elapsed: Duration, in seconds
+            **counters: ``sections``, ``parameters``, ``interpolations`` and ``cache_hits`` counts,
+              plus ``lines`` for the ``parse`` phase
+        """
+
+    @contextmanager
+    def track(self, phase: str, section: Optional[str], counters: Callable[[bool], Counters]) -> Iterator[None]:
+        """Context manager sending the ``start`` and ``end`` events around a block.
+
+        Args:
+            phase: Name of the phase
+            section: Name of the top-level section or ``None`` for the whole phase
+            counters: Function returning a snapshot of the ``sections``, ``parameters``,
+              ``references`` (variables to interpolate) and ``cache_hits`` counts. Called
+              with ``True`` before the block, only the ``references`` and ``cache_hits``
+              being then read, and with ``False`` after, the ``references`` being ignored
+        """
+        before = counters(True)
+
+        self.start(phase, section)
+        t0 = time.perf_counter()
+        yield
+        elapsed = time.perf_counter() - t0
+
+        after = counters(False)
+        self.end(
+            phase,
+            section,
+            elapsed,
+            sections=after['sections'],
+            parameters=after['parameters'],
+            interpolations=before['references'],
+            cache_hits=after['cache_hits'] - before['cache_hits'],
+        )
+
+
+class Timings(Instrumentation):
+    """Instrumentation recording the duration and the counters of every event.
+
+    Attributes:
+        records: List of ``(phase, section, elapsed, counters)`` tuples, in completion order
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty recording."""
+        self.records: list[Record] = []
+
+    def end(self, phase: str, section: Optional[str] = None, elapsed: float = 0.0, **counters: int) -> None:
+        """Record an ``end`` event."""
+        self.records.append((phase, section, elapsed, counters))
+
+    def phases(self) -> dict[str, float]:
+        """Return the total duration of each phase.
+
+        Returns:
+            Dictionary of the durations, in seconds, keyed by phase name
+        """
+        durations: dict[str, float] = {}
+        for phase, section, elapsed, _ in self.records:
+            if section is None:
+                durations[phase] = durations.get(phase, 0.0) + elapsed
+
+        return durations
@@ -0,0 +1,376 @@
+# --
+# Copyright (c) 2014-2026 Net-ng.
+# All rights reserved.
+#
+# This software is licensed under the BSD License, as described in
+# the file LICENSE.txt, which you should have received as part of
+# this distribution.
+# --
+
+"""Configurations shared between processes.
+
+A ``SharedConfigPublisher`` encodes a configuration into a read-only
+``multiprocessing.shared_memory`` segment, attached by the ``SharedConfigReader``
+of each worker process. A reader never decodes the whole configuration: a lookup
+is a binary search through the sorted names of a section, directly in the shared
+memory, and only the value found is decoded. So the workers share a single copy
+of the configuration, whatever the number of processes and even if they were
+forked before the configuration was loaded.
+
+Each publication creates a new segment, named after the publisher name and a
+generation number. The current generation is recorded in a small control
+segment: a reader maps the new segment as soon as the generation changed.
+
+Encoding of a data segment, with all the integers as unsigned 32 bits little
+endian and all the offsets from the start of the segment:
+
+- ``SHARED_HEADER`` then the offset of the root section
+- the names, encoded in UTF-8, and the parameter values, encoded with ``marshal``
+- for each section, after its subsections: its number of parameters and of
+  subsections followed by a ``(name offset, name length, value offset, value length)``
+  entry for each parameter then for each subsection, the value of a subsection
+  being its own offset. The parameters and the subsections are sorted by names.
+
+Example:
+    # Master process
+    publisher = SharedConfigPublisher('app')
+    publisher.publish(config_from_file('app.cfg').validate(spec))
+
+    # Worker processes
+    reader = SharedConfigReader('app')
+    workers = reader.config['server']['workers']
+"""
+
+import sys
+import struct
+import marshal
+from typing import Any, Iterator, Optional
+from operator import itemgetter
+from collections.abc import Mapping
+from multiprocessing import shared_memory
+
+from .config import Section, ConfigDict, ConfigError, SerializationError
+
+# Header of the data segments: magic, format version and ``marshal`` version
+SHARED_HEADER = b'NCS\x01' + bytes([marshal.version])
+
+ROOT = struct.Struct('<I')
+NODE = struct.Struct('<II')
+ENTRY = struct.Struct('<IIII')
+# Generation of the current data segment
+CONTROL = struct.Struct('<Q')
+
+
+def segment_name(name: str, generation: int) -> str:
+    return '{}.{}'.format(name, generation)
+
+
+def buffer(shm: shared_memory.SharedMemory) -> memoryview:
+    """Memory of a segment, only ``None`` once the segment is closed."""
+    return shm.buf  # type: ignore[return-value]
+
+
+def attach(name: str) -> shared_memory.SharedMemory:
+    """Attach an existing shared memory segment.
+
+    Before Python 3.13, an attached segment is registered to the resource tracker,
+    which destroys it when the tracker exits. The readers must then share the
+    tracker of the publisher, which is the case of all its child processes.
+
+    Args:
+        name: Name of the segment
+
+    Returns:
+        The segment
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name, track=False)
+
+    return shared_memory.SharedMemory(name)
+
+
+def encode(config: Section) -> bytearray:
+    """Encode a configuration into the shared format.
+
+    Args:
+        config: The configuration to encode
+
+    Returns:
+        The encoded configuration
+
+    Raises:
+        SerializationError: If a parameter value can't be encoded with ``marshal``
+    """
+    data = bytearray(SHARED_HEADER + ROOT.pack(0))
+    offsets: dict[int, int] = {}
+
+    # Reversed depth first order: the subsections are encoded before their parent
+    for names, section in reversed(list(config.walk())):
+        entries = []
+
+        for name, value in sorted(
+            ((name.encode('utf-8'), value) for name, value in section.items()), key=itemgetter(0)
+        ):
+            try:
+                value = marshal.dumps(value)
+            except ValueError:
+                raise SerializationError('unsupported value type', sections=names, name=name.decode('utf-8')) from None
+
+            entries.append((len(data), len(name), len(data) + len(name), len(value)))
+            data += name
+            data += value
+
+        for name, offset in sorted((name.encode('utf-8'), offsets[id(sub)]) for name, sub in section.sections.items()):
+            entries.append((len(data), len(name), offset, 0))
+            data += name
+
+        offsets[id(section)] = len(data)
+        data += NODE.pack(len(section), len(section.sections))
+        for entry in entries:
+            data += ENTRY.pack(*entry)
+
+    ROOT.pack_into(data, len(SHARED_HEADER), offsets[id(config)])
+
+    return data
+
+
+class SharedSection(Mapping[str, Any]):
+    """Read-only view of a section in a shared memory segment.
+
+    As a mapping, it contains the parameters of the section, sorted by names. As
+    for a ``Section``, a subsection can also be retrieved by its name.
+    """
+
+    __slots__ = ('shm', 'buf', 'offset', 'nb_parameters', 'nb_sections')
+
+    def __init__(self, shm: shared_memory.SharedMemory, offset: int) -> None:
+        """Initialize the view.
+
+        Args:
+            shm: The segment, kept mapped as long as the view exists
+            offset: Offset of the section in the segment
+        """
+        self.shm = shm
+        self.buf = buffer(shm)
+        self.offset = offset
+        self.nb_parameters, self.nb_sections = NODE.unpack_from(self.buf, offset)
+
+    def entry(self, i: int) -> tuple[int, int, int, int]:
+        return ENTRY.unpack_from(self.buf, self.offset + NODE.size + i * ENTRY.size)
+
+    def name(self, i: int) -> str:
+        name_offset, name_length, _, _ = self.entry(i)
+        return str(self.buf[name_offset : name_offset + name_length], 'utf-8')
+
+    def find(self, name: str, start: int, end: int) -> Optional[tuple[int, int]]:
+        """Binary search of a name among the entries of the section.
+
+        Args:
+            name: The name
+            start: Index of the first entry
+            end: Index after the last entry
+
+        Returns:
+            The ``(value offset, value length)`` of the entry found or ``None``
+        """
+        key = name.encode('utf-8')
+
+        while start < end:
+            middle = (start + end) // 2
+            name_offset, name_length, value_offset, value_length = self.entry(middle)
+            entry_name = bytes(self.buf[name_offset : name_offset + name_length])
+            if entry_name == key:
+                return value_offset, value_length
+
+            if entry_name < key:
+                start = middle + 1
+            else:
+                end = middle
+
+        return None
+
+    def __getitem__(self, name: str) -> Any:
+        value = self.find(name, 0, self.nb_parameters)
+        if value is not None:
+            value_offset, value_length = value
+            return marshal.loads(self.buf[value_offset : value_offset + value_length])  # noqa: S302
+
+        section = self.section(name)
+        if section is None:
+            raise KeyError(name)
+
+        return section
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and (self.find(name, 0, self.nb_parameters) is not None)
+
+    def __iter__(self) -> Iterator[str]:
+        return (self.name(i) for i in range(self.nb_parameters))
+
+    def __len__(self) -> int:
+        return self.nb_parameters
+
+    def section(self, name: str) -> Optional['SharedSection']:
+        """Retrieve a subsection.
+
+        Args:
+            name: Name of the subsection
+
+        Returns:
+            The subsection or ``None``
+        """
+        value = self.find(name, self.nb_parameters, self.nb_parameters + self.nb_sections)
+        return None if value is None else SharedSection(self.shm, value[0])
+
+    @property
+    def sections(self) -> dict[str, 'SharedSection']:
+        """The subsections, sorted by names."""
+        n = self.nb_parameters
+        return {self.name(i): SharedSection(self.shm, self.entry(i)[2]) for i in range(n, n + self.nb_sections)}
+
+    def dict(self) -> ConfigDict:
+        """Decode the section and all its subsections into nested dictionaries."""
+        d = dict(self.items())
+        d.update({name: section.dict() for name, section in self.sections.items()})
+
+        return d
+
+    def __repr__(self) -> str:
+        return '<SharedSection {} parameters, {} sections>'.format(self.nb_parameters, self.nb_sections)
+
+
+class SharedConfigPublisher:
+    """Publication of configurations into shared memory.
+
+    Attributes:
+        name: Name of the control segment, to be given to the readers
+        generation: Generation of the last configuration published, 0 if none
+    """
+
+    def __init__(self, name: Optional[str] = None) -> None:
+        """Create the control segment.
+
+        Args:
+            name: Name of the control segment, generated if not given
+
+        Raises:
+            FileExistsError: If a segment with this name already exists
+        """
+        self.control = shared_memory.SharedMemory(name, create=True, size=CONTROL.size)
+        CONTROL.pack_into(buffer(self.control), 0, 0)
+
+        self.name = self.control.name
+        self.generation = 0
+        self.data: Optional[shared_memory.SharedMemory] = None
+
+    def publish(self, config: Section) -> int:
+        """Encode a configuration into a new segment and make it the current one.
+
+        The segment of the previous configuration is destroyed, but stays mapped
+        in the readers still using it.
+
+        Args:
+            config: The configuration
+
+        Returns:
+            The generation of the configuration
+        """
+        payload = encode(config)
+        generation = self.generation + 1
+
+        data = shared_memory.SharedMemory(segment_name(self.name, generation), create=True, size=len(payload))
+        buffer(data)[: len(payload)] = payload
+        CONTROL.pack_into(buffer(self.control), 0, generation)
+
+        self.close_data()
+        self.data = data
+        self.generation = generation
+
+        return generation
+
+    def close_data(self) -> None:
+        if self.data is not None:
+            self.data.close()
+            self.data.unlink()
+            self.data = None
+
+    def close(self) -> None:
+        """Destroy the control and the current data segments."""
+        self.close_data()
+        self.control.close()
+        self.control.unlink()
+
+
+class SharedConfigReader:
+    """Access to the configurations published into shared memory.
+
+    Attributes:
+        name: Name of the control segment
+        generation: Generation of the configuration currently mapped, 0 if none
+    """
+
+    def __init__(self, name: str) -> None:
+        """Attach the control segment.
+
+        Args:
+            name: Name of the control segment
+
+        Raises:
+            FileNotFoundError: If the control segment doesn't exist
+        """
+        self.name = name
+        self.control = attach(name)
+        self.generation = 0
+        self._config: Optional[SharedSection] = None
+
+    @property
+    def published_generation(self) -> int:
+        """Generation of the last configuration published."""
+        return CONTROL.unpack_from(buffer(self.control))[0]
+
+    @property
+    def config(self) -> SharedSection:
+        """The last configuration published, mapped again if a new one was published.
+
+        Raises:
+            ConfigError: If no configuration is published
+        """
+        if (self._config is None) or (self.published_generation != self.generation):
+            self.remap()
+
+        return self._config  # type: ignore[return-value]
+
+    def remap(self) -> None:
+        """Map the last configuration published.
+
+        The previous segment stays mapped as long as views on it exist.
+
+        Raises:
+            ConfigError: If no configuration is published or the data is not in the shared format
+        """
+        generation = None
+        while generation != self.published_generation:
+            generation = self.published_generation
+            if not generation:
+                raise ConfigError('no configuration published')
+
+            try:
+                data = attach(segment_name(self.name, generation))
+            except FileNotFoundError:
+                # Destroyed by a newer publication meanwhile
+                continue
+
+            if bytes(buffer(data)[: len(SHARED_HEADER)]) != SHARED_HEADER:
+                data.close()
+                raise ConfigError('invalid shared configuration')
+
+            self._config = SharedSection(data, ROOT.unpack_from(buffer(data), len(SHARED_HEADER))[0])
+            self.generation = generation
+            return
+
+        raise ConfigError('no configuration published')
+
+    def close(self) -> None:
+        """Detach the control segment."""
+        self._config = None
+        self.control.close()
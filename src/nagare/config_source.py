@@ -0,0 +1,191 @@
+# --
+# Copyright (c) 2014-2026 Net-ng.
+# All rights reserved.
+#
+# This software is licensed under the BSD License, as described in
+# the file LICENSE.txt, which you should have received as part of
+# this distribution.
+# --
+
+"""Source positions of the parsed sections and parameters.
+
+A ``SourceMap`` records the file, line and column where each section and each
+parameter was defined. It's filled by the parsers, then used to locate the
+validation and interpolation errors raised afterwards.
+
+The positions are stored as parallel ``array('I')`` columns, plus a list of
+references to the names already used as keys by the sections: about 24 bytes by
+position on a 64 bits platform.
+
+Example:
+    from nagare.config import SourceMap, config_from_file
+
+    config = config_from_file('app.cfg', source_map=SourceMap())
+    config.validate(spec)  # Error line #12, column #5 of 'app.cfg' for parameter [database] > port: ...
+
+    print(config.source_map.find(('database',), 'port'))
+"""
+
+import sys
+from array import array
+from typing import Optional, NamedTuple
+
+from .config_exceptions import ContextualParseError
+
+
+class Position(NamedTuple):
+    """Position of a section or a parameter.
+
+    Attributes:
+        filename: The file, ``None`` if not parsed from a file
+        line: The line, starting at 1
+        column: The column of the name, starting at 1
+    """
+
+    filename: Optional[str]
+    line: int
+    column: int
+
+
+class SourceMap:
+    """Positions of the sections and parameters of a configuration.
+
+    Each position is a row, the first one being the root section. A row records the
+    row of its parent section, its name, the index of its file, its line and its
+    column.
+
+    Attributes:
+        filenames: The files, by index
+    """
+
+    def __init__(self) -> None:
+        """Initialize a map with the root section only."""
+        self.filenames: list[Optional[str]] = []
+
+        self.parents = array('I', [0])
+        self.names: list[str] = ['']
+        self.files = array('I', [0])
+        self.lines = array('I', [0])
+        self.columns = array('I', [0])
+
+        # Row of each ``(parent row, name)``, only built when a position is looked up
+        self._index: dict[tuple[int, str], int] = {}
+        self._indexed = 1
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def add_file(self, filename: Optional[str]) -> int:
+        """Register a parsed file.
+
+        Args:
+            filename: The file, ``None`` if not parsed from a file
+
+        Returns:
+            The index of the file
+        """
+        self.filenames.append(filename)
+        return len(self.filenames) - 1
+
+    def add(self, parent: int, name: str, file: int, line: int, column: int) -> int:
+        """Record the position of a section or a parameter.
+
+        Args:
+            parent: Row of the parent section
+            name: Name of the section or parameter
+            file: Index of the file
+            line: The line
+            column: The column
+
+        Returns:
+            The row
+        """
+        self.parents.append(parent)
+        self.names.append(name)
+        self.files.append(file)
+        self.lines.append(line)
+        self.columns.append(column)
+
+        return len(self.names) - 1
+
+    def graft(self, source_map: 'SourceMap', row: int) -> None:
+        """Add the positions of another map below a row.
+
+        Args:
+            source_map: The other map
+            row: Row receiving the root of the other map
+        """
+        nb_rows = len(self.names) - 1
+        nb_files = len(self.filenames)
+
+        self.filenames.extend(source_map.filenames)
+        self.parents.extend(parent + nb_rows if parent else row for parent in source_map.parents[1:])
+        self.names.extend(source_map.names[1:])
+        self.files.extend(file + nb_files for file in source_map.files[1:])
+        self.lines.extend(source_map.lines[1:])
+        self.columns.extend(source_map.columns[1:])
+
+    def row(self, path: tuple[str, ...], create: bool = False) -> Optional[int]:
+        """Row of a section or a parameter.
+
+        Args:
+            path: Names of the section or parameter and its ancestors, below the root
+            create: Record the missing sections, without position
+
+        Returns:
+            The row, ``None`` if not recorded
+        """
+        index = self._index
+        # The first position of a name wins, like the first definition of a duplicated section
+        for i in range(self._indexed, len(self.names)):
+            index.setdefault((self.parents[i], self.names[i]), i)
+        self._indexed = len(self.names)
+
+        row = 0
+        for name in path:
+            child = index.get((row, name))
+            if child is None:
+                if not create:
+                    return None
+
+                child = index[row, name] = self.add(row, name, 0, 0, 0)
+
+            row = child
+
+        return row
+
+    def find(self, path: tuple[str, ...], name: Optional[str] = None) -> Optional[Position]:
+        """Position of a section or a parameter.
+
+        Args:
+            path: Names of the section and its ancestors, below the root
+            name: Name of a parameter of the section
+
+        Returns:
+            The position, ``None`` if not recorded
+        """
+        row = self.row(path + ((name,) if name is not None else ()))
+        if not row or not self.lines[row]:
+            return None
+
+        return Position(self.filenames[self.files[row]], self.lines[row], self.columns[row])
+
+    def locate(self, error: ContextualParseError) -> None:
+        """Set the position of an error raised for a section or a parameter.
+
+        The position of the section is used when the parameter has no position, like a
+        missing parameter.
+
+        Args:
+            error: The error, with its ``line``, ``column`` and ``filename`` set if found
+        """
+        position = self.find(error._sections, error.name) or self.find(error._sections)
+        if position is not None:
+            error.filename, error.line, error.column = position
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the map, without the names shared with the configuration."""
+        columns = (self.parents, self.files, self.lines, self.columns)
+
+        return sum(sys.getsizeof(column) for column in columns) + sys.getsizeof(self.names)
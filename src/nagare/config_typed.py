@@ -0,0 +1,276 @@
+# --
+# Copyright (c) 2014-2026 Net-ng.
+# All rights reserved.
+#
+# This software is licensed under the BSD License, as described in
+# the file LICENSE.txt, which you should have received as part of
+# this distribution.
+# --
+
+"""Typed accessors of validated configurations.
+
+A validated configuration can be converted into a tree of read-only dataclasses
+with slots, generated from its specification: the parameters are then read as
+plain attribute loads, without the lookups of ``Section.__getitem__()``.
+
+The classes are generated once per specification content. Their attributes are
+annotated with the types returned by the validation functions. The ``__many__``
+sections of the specification become a ``__many__`` attribute, a dictionary of
+the sections by name, and the ``___many___`` parameters a ``___many___``
+dictionary of the parameters by name.
+
+Example:
+    spec = config_from_file('app_spec.cfg')
+    config = config_from_file('app.cfg').interpolate().merge_defaults(spec).validate(spec)
+
+    cfg = typed(config, spec)
+    cfg.database.port  # 5432
+    cfg.apps.__many__['shop'].url
+"""
+
+import re
+import keyword
+import dataclasses
+from typing import Any, Optional
+
+from .config import Section, AncestorNames, ParameterError, SpecificationError
+
+# Type of the values returned by each validation function
+TYPES: dict[str, Any] = {
+    'integer': int,
+    'float': float,
+    'boolean': bool,
+    'string': str,
+    'option': str,
+    'list': list[str],
+    'string_list': list[str],
+    'int_list': list[int],
+    'float_list': list[float],
+    'bool_list': list[bool],
+    'tuple': tuple[str, ...],
+}
+
+# Name of the validation function of a specification expression
+FUNCTION = re.compile(r'\s*(\w+)')
+
+# Specification name of the dynamic parameters and sections
+MANY_PARAMETERS = '___many___'
+MANY_SECTIONS = '__many__'
+
+
+class Accessor:
+    """Base class of the generated accessors.
+
+    Attributes:
+        _parameters: ``(attribute, parameter name)`` of the parameters
+        _sections: ``(attribute, section name, accessor class)`` of the sub-sections
+        _many_parameters: Whether the section has dynamic parameters
+        _many_sections: Accessor class of the dynamic sub-sections, if any
+    """
+
+    __slots__ = ()
+
+    _parameters: tuple[tuple[str, str], ...] = ()
+    _sections: tuple[tuple[str, str, type['Accessor']], ...] = ()
+    _many_parameters = False
+    _many_sections: Optional[type['Accessor']] = None
+
+    @classmethod
+    def of(cls, section: Section, ancestors_names: AncestorNames = ()) -> 'Accessor':
+        """Create the accessor of a validated section.
+
+        Args:
+            section: The section, completed with the defaults of the specification
+            ancestors_names: Names of the section and its ancestors, for error reporting
+
+        Returns:
+            The accessor
+
+        Raises:
+            ParameterError: If a parameter of the specification is missing
+        """
+        attributes = {}
+
+        for attribute, name in cls._parameters:
+            if name not in section:
+                raise ParameterError('required', sections=ancestors_names, name=name)
+
+            attributes[attribute] = section[name]
+
+        for attribute, name, accessor in cls._sections:
+            attributes[attribute] = accessor.of(section.sections.get(name, Section()), ancestors_names + (name,))
+
+        known = {name for _, name in cls._parameters}
+        if cls._many_parameters:
+            attributes[MANY_PARAMETERS] = {name: value for name, value in section.items() if name not in known}
+
+        many = cls._many_sections
+        if many is not None:
+            known = {name for _, name, _ in cls._sections}
+            attributes[MANY_SECTIONS] = {
+                name: many.of(sub, ancestors_names + (name,))
+                for name, sub in section.sections.items()
+                if name not in known
+            }
+
+        return cls(**attributes)
+
+
+# Generated accessor classes, by specification fingerprint and class name
+ACCESSORS: dict[tuple[str, str], type[Accessor]] = {}
+
+
+def attribute_name(name: str) -> str:
+    """Python identifier of a section or parameter name.
+
+    Args:
+        name: The name
+
+    Returns:
+        The name with its invalid characters replaced by ``_``, suffixed with ``_`` if a keyword
+    """
+    name = re.sub(r'\W', '_', name)
+    if not name or name[0].isdigit():
+        name = '_' + name
+
+    return name + '_' if keyword.iskeyword(name) else name
+
+
+def class_name(name: str) -> str:
+    return ''.join(part.capitalize() for part in re.split(r'\W|_', name)) or 'Section'
+
+
+def value_type(expr: Any) -> Any:
+    """Type of the values validated by a specification expression.
+
+    Args:
+        expr: The specification expression
+
+    Returns:
+        The type, ``Any`` if unknown
+    """
+    function = FUNCTION.match(expr) if isinstance(expr, str) else None
+
+    return TYPES.get(function.group(1), Any) if function else Any
+
+
+def check_attribute(attribute: str, name: str, names: dict[str, str], ancestors_names: AncestorNames) -> None:
+    """Check that the attribute of a section or parameter name is free.
+
+    Args:
+        attribute: The attribute
+        name: The section or parameter name
+        names: Section and parameter names of the attributes already generated, updated
+        ancestors_names: Names of the section and its ancestors, for error reporting
+
+    Raises:
+        SpecificationError: If the attribute is already used by another name or by ``Accessor``
+    """
+    if attribute in names:
+        error = 'names {!r} and {!r} have the same attribute {!r}'.format(names[attribute], name, attribute)
+        raise SpecificationError(error, sections=ancestors_names, name=name)
+
+    if hasattr(Accessor, attribute) or (attribute in (MANY_PARAMETERS, MANY_SECTIONS)):
+        error = 'reserved attribute {!r}'.format(attribute)
+        raise SpecificationError(error, sections=ancestors_names, name=name)
+
+    names[attribute] = name
+
+
+def generate(
+    spec: Section, name: str = 'Config', qualname: str = '', ancestors_names: AncestorNames = ()
+) -> type[Accessor]:
+    """Generate the accessor classes of a specification.
+
+    Args:
+        spec: The specification
+        name: Name of the class
+        qualname: Qualified name of the class, for nested sections
+        ancestors_names: Names of the section and its ancestors, for error reporting
+
+    Returns:
+        The accessor class
+
+    Raises:
+        SpecificationError: If two names have the same attribute or if an attribute is used by ``Accessor``
+    """
+    fields: list[tuple[str, Any]] = []
+    parameters = []
+    sections = []
+    names: dict[str, str] = {}
+
+    for parameter, expr in spec.items():
+        if parameter != MANY_PARAMETERS:
+            check_attribute(attribute_name(parameter), parameter, names, ancestors_names)
+            parameters.append((attribute_name(parameter), parameter))
+            fields.append((parameters[-1][0], value_type(expr)))
+
+    for section, sub_spec in spec.sections.items():
+        if section != MANY_SECTIONS:
+            check_attribute(attribute_name(section), section, names, ancestors_names)
+            qualified = (qualname or name) + '.' + class_name(section)
+            accessor = generate(sub_spec, class_name(section), qualified, ancestors_names + (section,))
+            sections.append((attribute_name(section), section, accessor))
+            fields.append((sections[-1][0], accessor))
+
+    many_parameters = spec.get(MANY_PARAMETERS)
+    if many_parameters is not None:
+        fields.append((MANY_PARAMETERS, dict[str, value_type(many_parameters)]))  # type: ignore[misc]
+
+    many_sections = None
+    if MANY_SECTIONS in spec.sections:
+        many_sections = generate(
+            spec.sections[MANY_SECTIONS], 'Many', (qualname or name) + '.Many', ancestors_names + (MANY_SECTIONS,)
+        )
+        fields.append((MANY_SECTIONS, dict[str, many_sections]))  # type: ignore[valid-type]
+
+    namespace = {
+        '__module__': __name__,
+        '__qualname__': qualname or name,
+        '_parameters': tuple(parameters),
+        '_sections': tuple(sections),
+        '_many_parameters': many_parameters is not None,
+        '_many_sections': many_sections,
+    }
+
+    return dataclasses.make_dataclass(name, fields, bases=(Accessor,), namespace=namespace, frozen=True, slots=True)
+
+
+def accessor_class(spec: Section, name: str = 'Config') -> type[Accessor]:
+    """Accessor class of a specification, generated on its first use.
+
+    Args:
+        spec: The specification
+        name: Name of the root class
+
+    Returns:
+        The accessor class
+
+    Raises:
+        SpecificationError: If two names have the same attribute or if an attribute is used by ``Accessor``
+    """
+    key = (spec.fingerprint(), name)
+
+    cls = ACCESSORS.get(key)
+    if cls is None:
+        cls = ACCESSORS[key] = generate(spec, name)
+
+    return cls
+
+
+def typed(config: Section, spec: Section, name: str = 'Config') -> Any:
+    """Create the typed accessor of a validated configuration.
+
+    Args:
+        config: The configuration, completed with the defaults of the specification and validated
+        spec: The specification
+        name: Name of the root class
+
+    Returns:
+        The accessor, an instance of the class generated from the specification
+
+    Raises:
+        SpecificationError: If the accessor class can't be generated from the specification
+        ParameterError: If a parameter of the specification is missing
+    """
+    return accessor_class(spec, name).of(config)
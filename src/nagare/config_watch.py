@@ -0,0 +1,487 @@
+# --
+# Copyright (c) 2014-2026 Net-ng.
+# All rights reserved.
+#
+# This software is licensed under the BSD License, as described in
+# the file LICENSE.txt, which you should have received as part of
+# this distribution.
+# --
+
+"""Hot reload of configuration files.
+
+A ``ConfigWatcher`` polls the configuration files and, when their content
+changed, loads the configuration again and notifies its subscribers with the
+structural diff between the old and the new configurations.
+
+The files watched are the given ones and the dependencies of the loaded
+configuration: its included fragments and its referenced files (see
+``Section.dependencies``). They are compared by their stat signature (mtime,
+size and inode) then, if it changed, by the SHA-256 of their content. A burst of writes is only reloaded
+once the files stayed unchanged for the ``debounce`` delay. On Linux, inotify
+wakes the watcher up as soon as a watched directory changes instead of waiting
+for the end of the polling interval.
+
+If the new configuration can't be loaded, the current one stays in place and the
+error is reported, as the errors raised by the subscribers.
+
+Example:
+    watcher = ConfigWatcher(lambda: config_from_file('app.cfg').validate(spec), ['app.cfg'])
+
+    @watcher.subscribe
+    def reload(diff, config):
+        ...
+
+    watcher.start()
+"""
+
+import os
+import time
+import ctypes
+import select
+import hashlib
+import threading
+import contextlib
+import ctypes.util
+from typing import Callable, Iterable, Iterator, Optional, Sequence
+
+from .config import Diff, Section, AncestorNames, diff
+from .config_handle import ConfigHandle
+
+Signature = Optional[tuple[int, int, int]]
+Subscriber = Callable[[Diff, Section], None]
+
+# Pattern components matching any name
+WILDCARDS = ('*', '__many__')
+
+# inotify events: modify, attrib, close_write, moved_from, moved_to, create, delete
+INOTIFY_MASK = 0x2 | 0x4 | 0x8 | 0x40 | 0x80 | 0x100 | 0x200
+
+
+class Inotify:
+    """Minimal inotify binding, watching directories for any change."""
+
+    def __init__(self, directories: Iterable[str]) -> None:
+        """Initialize the inotify instance.
+
+        Args:
+            directories: The directories to watch
+
+        Raises:
+            OSError: If inotify is not available
+        """
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        if not hasattr(libc, 'inotify_init1'):
+            raise OSError('inotify not available')
+
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1')
+
+        for directory in directories:
+            if libc.inotify_add_watch(self.fd, os.fsencode(directory), INOTIFY_MASK) < 0:
+                os.close(self.fd)
+                raise OSError(ctypes.get_errno(), 'inotify_add_watch', directory)
+
+    def wait(self, timeout: float) -> None:
+        """Wait for a change or the end of the timeout.
+
+        Args:
+            timeout: Maximum waiting time, in seconds
+        """
+        if select.select([self.fd], [], [], timeout)[0]:
+            with contextlib.suppress(BlockingIOError):
+                while os.read(self.fd, 65536):
+                    pass
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class PatternNode:
+    """Node of the trie of the subscribed path patterns.
+
+    Attributes:
+        children: The nodes of the next pattern components, the wildcards being under ``*``
+        subscribers: The subscribers to the pattern ending at this node
+        nb_subscribers: Number of subscribers to the patterns ending at this node or below
+    """
+
+    __slots__ = ('children', 'subscribers', 'nb_subscribers')
+
+    def __init__(self) -> None:
+        self.children: dict[str, PatternNode] = {}
+        self.subscribers: list[Subscriber] = []
+        self.nb_subscribers = 0
+
+    def all_subscribers(self) -> Iterator[Subscriber]:
+        """Iterate over the subscribers to the patterns ending at this node or below."""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield from node.subscribers
+            stack.extend(child for child in node.children.values() if child.nb_subscribers)
+
+
+class PathSubscriptions:
+    """Subscribers to path patterns, indexed by a trie of the patterns components.
+
+    A pattern is a ``/`` separated path of sections and parameter names, where ``*``
+    or ``__many__`` matches any name. A pattern intersects a changed path if one is
+    a prefix of the other: ``database`` intersects ``database/host`` and ``database/*``
+    intersects ``database`` when the whole section is added or removed.
+
+    Dispatching a change only visits the trie nodes along its path, whatever the
+    total number of subscribers.
+    """
+
+    def __init__(self) -> None:
+        self.root = PatternNode()
+
+    @staticmethod
+    def split(pattern: str) -> list[str]:
+        return ['*' if name in WILDCARDS else name for name in pattern.split('/') if name]
+
+    def subscribe(self, pattern: str, subscriber: Subscriber) -> None:
+        """Register a function called when the changes intersect a path pattern.
+
+        Args:
+            pattern: The path pattern
+            subscriber: The function, called with the diff of the intersecting changes only
+        """
+        node = self.root
+        node.nb_subscribers += 1
+
+        for name in self.split(pattern):
+            node = node.children.setdefault(name, PatternNode())
+            node.nb_subscribers += 1
+
+        node.subscribers.append(subscriber)
+
+    def unsubscribe(self, pattern: str, subscriber: Subscriber) -> None:
+        """Unregister a function.
+
+        Args:
+            pattern: The path pattern the function was registered to
+            subscriber: The function
+
+        Raises:
+            ValueError: If the function is not registered to the pattern
+        """
+        nodes = [self.root]
+        for name in self.split(pattern):
+            node = nodes[-1].children.get(name)
+            if node is None:
+                raise ValueError('{!r} not subscribed to {!r}'.format(subscriber, pattern))
+
+            nodes.append(node)
+
+        nodes[-1].subscribers.remove(subscriber)
+
+        for node in nodes:
+            node.nb_subscribers -= 1
+
+    def match(self, path: AncestorNames) -> Iterator[Subscriber]:
+        """Iterate over the subscribers whose pattern intersects a path.
+
+        Args:
+            path: The path
+
+        Yields:
+            The subscribers, once for each intersecting pattern they are registered to
+        """
+        nodes = [self.root]
+        yield from self.root.subscribers
+
+        for name in path:
+            nodes = [
+                child
+                for node in nodes
+                for child in (node.children.get(name), node.children.get('*'))
+                if (child is not None) and child.nb_subscribers
+            ]
+            for node in nodes:
+                yield from node.subscribers
+
+        # Path shorter than the patterns
+        for node in nodes:
+            for child in node.children.values():
+                if child.nb_subscribers:
+                    yield from child.all_subscribers()
+
+    def dispatch(self, changes: Diff, config: Section, on_error: Optional[Callable[[Exception], None]] = None) -> None:
+        """Call the subscribers whose patterns intersect the changes.
+
+        Args:
+            changes: The changes
+            config: The new configuration
+            on_error: Function called with the exception raised by a subscriber, the next
+              subscribers being still called. The exception is propagated if not given
+        """
+        if not self.root.nb_subscribers:
+            return
+
+        diffs: dict[Subscriber, Diff] = {}
+        for kind in ('added', 'removed', 'changed'):
+            for path, value in getattr(changes, kind).items():
+                for subscriber in self.match(path):
+                    d = diffs.get(subscriber)
+                    if d is None:
+                        d = diffs[subscriber] = Diff()
+
+                    getattr(d, kind)[path] = value
+
+        for subscriber, d in diffs.items():
+            notify(subscriber, d, config, on_error)
+
+
+def notify(
+    subscriber: Subscriber, changes: Diff, config: Section, on_error: Optional[Callable[[Exception], None]]
+) -> None:
+    """Call a subscriber, reporting its exception if a function is given.
+
+    Args:
+        subscriber: The subscriber
+        changes: The changes
+        config: The new configuration
+        on_error: Function called with the exception raised by the subscriber
+    """
+    if on_error is None:
+        subscriber(changes, config)
+        return
+
+    try:
+        subscriber(changes, config)
+    except Exception as e:
+        on_error(e)
+
+
+class ConfigWatcher:
+    """Reload a configuration when its files change.
+
+    Attributes:
+        config: The current configuration
+        filenames: Absolute paths of the files watched, the given ones then the dependencies of the configuration
+        error: The error of the last failed reload or of the last failing subscriber, ``None`` after a
+          successful reload
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], Section],
+        filenames: Sequence[str],
+        interval: float = 1.0,
+        debounce: float = 0.2,
+        on_error: Optional[Callable[[Exception], None]] = None,
+        inotify: bool = True,
+        handle: Optional[ConfigHandle] = None,
+    ) -> None:
+        """Initialize the watcher and load the configuration.
+
+        Args:
+            loader: Function loading the configuration (parsing, interpolation, validation ...)
+            filenames: The files the configuration is loaded from, its dependencies being added
+            interval: Polling interval, in seconds
+            debounce: Time, in seconds, the files must stay unchanged before being reloaded
+            on_error: Function called with the exception of a failed reload
+            inotify: Use inotify, when available, to be woken up on changes
+            handle: Handle the loaded configurations are published to
+
+        Raises:
+            Exception: Any error raised by the first load of the configuration
+        """
+        self.loader = loader
+        self.sources = [os.path.abspath(filename) for filename in filenames]
+        self.filenames = list(self.sources)
+        self.interval = interval
+        self.debounce = debounce
+        self.on_error = on_error
+        self.use_inotify = inotify
+        self.handle = handle
+
+        self.subscribers: list[Subscriber] = []
+        self.paths = PathSubscriptions()
+        self.error: Optional[Exception] = None
+
+        self._signatures = self.signatures()
+        self._hashes = self.hashes()
+        self._changed_at: Optional[float] = None
+
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+        self.config = loader()
+        self.watch(self.config)
+        if handle is not None:
+            handle.publish(self.config)
+
+    def subscribe(self, subscriber: Subscriber, path: Optional[str] = None) -> Subscriber:
+        """Register a function called with the diff and the new configuration after each reload.
+
+        Args:
+            subscriber: The function to register
+            path: Only call the function, with the intersecting changes only, when this
+              path pattern (like ``database/*`` or ``apps/__many__/workers``) intersects the diff
+
+        Returns:
+            The function, so this method can be used as a decorator
+        """
+        if path is None:
+            self.subscribers.append(subscriber)
+        else:
+            self.paths.subscribe(path, subscriber)
+
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber, path: Optional[str] = None) -> None:
+        if path is None:
+            self.subscribers.remove(subscriber)
+        else:
+            self.paths.unsubscribe(path, subscriber)
+
+    def watch(self, config: Section) -> None:
+        """Watch the given files and the dependencies of a loaded configuration.
+
+        Args:
+            config: The configuration
+        """
+        filenames = self.sources + sorted(config.dependencies.difference(self.sources))
+        if filenames != self.filenames:
+            self.filenames = filenames
+            self._signatures = self.signatures()
+            self._hashes = self.hashes()
+
+    def signatures(self) -> list[Signature]:
+        """Stat signatures of the files.
+
+        Returns:
+            The ``(mtime, size, inode)`` of each file, ``None`` for a missing file
+        """
+        signatures: list[Signature] = []
+        for filename in self.filenames:
+            try:
+                stat = os.stat(filename)
+            except OSError:
+                signatures.append(None)
+            else:
+                signatures.append((stat.st_mtime_ns, stat.st_size, stat.st_ino))
+
+        return signatures
+
+    def hashes(self) -> list[Optional[bytes]]:
+        """Content hashes of the files.
+
+        Returns:
+            The SHA-256 digest of each file, ``None`` for a missing file
+        """
+        hashes: list[Optional[bytes]] = []
+        for filename in self.filenames:
+            try:
+                with open(filename, 'rb') as f:
+                    hashes.append(hashlib.sha256(f.read()).digest())
+            except OSError:
+                hashes.append(None)
+
+        return hashes
+
+    def check(self, now: Optional[float] = None) -> Optional[Diff]:
+        """Reload the configuration if its files changed and stayed unchanged for the debounce delay.
+
+        Args:
+            now: Current monotonic time, in seconds
+
+        Returns:
+            The diff of the reloaded configuration, ``None`` if it was not reloaded
+        """
+        now = time.monotonic() if now is None else now
+
+        signatures = self.signatures()
+        if signatures != self._signatures:
+            self._signatures = signatures
+            self._changed_at = now
+            return None
+
+        if (self._changed_at is None) or (now - self._changed_at < self.debounce):
+            return None
+
+        self._changed_at = None
+
+        hashes = self.hashes()
+        if hashes == self._hashes:
+            return None
+
+        # A failing content is not reloaded again until it changes
+        self._hashes = hashes
+
+        try:
+            config = self.loader()
+        except Exception as e:
+            self.report(e)
+            return None
+
+        self.error = None
+        changes = diff(self.config, config)
+        self.config = config
+        self.watch(config)
+
+        if changes:
+            if self.handle is not None:
+                self.handle.publish(config)
+
+            for subscriber in self.subscribers:
+                notify(subscriber, changes, config, self.report)
+
+            self.paths.dispatch(changes, config, self.report)
+
+        return changes
+
+    def report(self, error: Exception) -> None:
+        self.error = error
+        if self.on_error is not None:
+            self.on_error(error)
+
+    def run(self) -> None:
+        """Watch the files until ``stop()`` is called."""
+        inotify = None
+        directories: set[str] = set()
+
+        try:
+            while not self._stop.is_set():
+                # The directories of the dependencies change with the reloaded configuration
+                if self.use_inotify and ({os.path.dirname(filename) for filename in self.filenames} != directories):
+                    directories = {os.path.dirname(filename) for filename in self.filenames}
+                    if inotify is not None:
+                        inotify.close()
+                        inotify = None
+
+                    with contextlib.suppress(OSError):
+                        inotify = Inotify(directories)
+
+                timeout = self.interval if self._changed_at is None else min(self.interval, self.debounce)
+                if inotify is None:
+                    self._stop.wait(timeout)
+                else:
+                    inotify.wait(timeout)
+
+                self.check()
+        finally:
+            if inotify is not None:
+                inotify.close()
+
+    def start(self) -> 'ConfigWatcher':
+        """Watch the files in a background thread.
+
+        Returns:
+            The watcher
+        """
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run, name='ConfigWatcher', daemon=True)
+        self._thread.start()
+
+        return self
+
+    def stop(self) -> None:
+        """Stop the background thread, waiting at most a polling interval."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
@@ -33,6 +33,7 @@ Example:
     port = port_validator('10')  # Raises ParameterError: Error for parameter: the value '10' is too small
 """
 
+from types import CodeType
 from typing import Any, List, Tuple, TypeVar, Callable, Optional, overload
 from functools import partial
 
@@ -62,8 +63,19 @@ class Validator:
     The validator uses a functional programming approach where validation
     methods return partial functions that can be applied to actual values.
     This allows for flexible composition of validation rules.
+
+    The specification expressions are compiled once per validator instance and
+    kept in a cache.
+
+    Attributes:
+        cache_hits: Number of times a compiled specification was found in the cache
     """
 
+    def __init__(self) -> None:
+        """Initialize a validator with an empty specification cache."""
+        self._specs: dict[str, CodeType] = {}
+        self.cache_hits = 0
+
     def __getitem__(self, name: str) -> Any:
         """Enable dictionary-style access to validator methods and special values.
 
@@ -767,9 +779,15 @@ class Validator:
             # Returns 50 (converted to int)
         """
         try:
+            code = self._specs.get(expr)
+            if code is None:
+                code = self._specs[expr] = compile(expr, '<specification>', 'eval')
+            else:
+                self.cache_hits += 1
+
             # Evaluate the specification expression in a controlled environment
             # The validator instance is provided as the global context
-            validation = eval(expr, {}, self)  # type: ignore # noqa: S307
+            validation = eval(code, {}, self)  # type: ignore # noqa: S307
 
             # If the result is not a partial function, call it to get the validator
             if not isinstance(validation, partial):
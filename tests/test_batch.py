@@ -0,0 +1,43 @@
+# --
+# Copyright (c) 2014-2026 Net-ng.
+# All rights reserved.
+#
+# This software is licensed under the BSD License, as described in
+# the file LICENSE.txt, which you should have received as part of
+# this distribution.
+# --
+
+from nagare.config import ParameterError, SpecificationError, config_from_string
+from nagare.config_batch import validate_many
+
+SPEC = """
+name = string
+[database]
+port = integer(default=5432)
+[apps]
+[[__many__]]
+workers = integer(default=1)
+"""
+
+
+def test_validate_many():
+    spec = config_from_string(SPEC)
+    configs = {
+        'tenant{}'.format(i): config_from_string('name = t{}\n[database]\nport = {}\n[apps]\n[[shop]]\n'.format(i, i))
+        for i in range(10)
+    }
+    configs['invalid'] = config_from_string('[database]\nport = x\n')
+
+    for workers in (0, 2):
+        results = {name: (config, errors) for name, config, errors in validate_many(dict(configs), spec, workers)}
+        assert set(results) == set(configs)
+
+        config, errors = results['tenant3']
+        assert config.dict() == {'name': 't3', 'database': {'port': 3}, 'apps': {'shop': {'workers': 1}}}
+        assert not errors
+
+        config, errors = results['invalid']
+        assert [(type(e), e.name) for e in errors] == [(ParameterError, 'name'), (SpecificationError, 'port')]
+
+    # Validated in place without worker
+    assert configs['tenant3']['database']['port'] == 3
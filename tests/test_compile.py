@@ -0,0 +1,177 @@
+# --
+# Copyright (c) 2014-2026 Net-ng.
+# All rights reserved.
+#
+# This software is licensed under the BSD License, as described in
+# the file LICENSE.txt, which you should have received as part of
+# this distribution.
+# --
+
+import os
+import enum
+
+import pytest
+
+from nagare.config import InterpolationError, SerializationError, config_from_file
+from nagare.config_compile import main, is_literal, load_compiled, import_compiled
+
+CONFIG = """
+a = 1
+b = $a
+c = $here
+
+[section1]
+x = "${a}0"
+[[sub]]
+y = 2, 3
+"""
+
+SPEC = """
+a = integer
+b = string
+c = string
+[section1]
+x = integer
+[[sub]]
+y = int_list
+w = float(default=4.5)
+z = boolean(default=True)
+"""
+
+
+def test_compile(tmp_path):
+    filename = tmp_path / 'app.cfg'
+    filename.write_text(CONFIG)
+    spec = tmp_path / 'spec.cfg'
+    spec.write_text(SPEC)
+    output = str(tmp_path / 'app_cfg.py')
+
+    c = load_compiled(str(filename), output, str(spec), {'here': '/tmp'})
+    assert c.dict() == {
+        'a': 1,
+        'b': '1',
+        'c': '/tmp',
+        'section1': {'x': 10, 'sub': {'y': [2, 3], 'w': 4.5, 'z': True}},
+    }
+    fingerprint = import_compiled(output)[0]
+
+    # Loaded from the module
+    assert load_compiled(str(filename), output, str(spec), {'here': '/tmp'}).dict() == c.dict()
+    assert import_compiled(output)[0] == fingerprint
+
+    # Stale module
+    c = load_compiled(str(filename), output, str(spec), {'here': '/var'})
+    assert c['c'] == '/var'
+    assert import_compiled(output)[0] != fingerprint
+
+    filename.write_text(CONFIG.replace('a = 1', 'a = 2'))
+    assert load_compiled(str(filename), output, str(spec), {'here': '/var'})['section1']['x'] == 20
+
+    assert main([str(filename), '-o', output, '--spec', str(spec)]) == 1  # Undefined `here` variable
+
+    filename.write_text(CONFIG.replace('$here', '$$here'))
+    assert main([str(filename), '-o', output, '--spec', str(spec)]) == 0
+    assert import_compiled(output)[1][0][2]['c'] == '$here'
+
+
+def test_compile_include(tmp_path, monkeypatch):
+    directory = tmp_path / 'conf'
+    (directory / 'common').mkdir(parents=True)
+    fragment = directory / 'common' / 'pool.cfg'
+    fragment.write_text('size = 10\n')
+    filename = directory / 'app.cfg'
+    filename.write_text('[database]\n[[$(include common/pool.cfg)]]\n')
+    spec = directory / 'spec.cfg'
+    spec.write_text('[database]\nsize = integer\n')
+    output = str(tmp_path / 'app_cfg.py')
+
+    # The fragments are relative to the configuration file, not to the current directory
+    monkeypatch.chdir(tmp_path)
+    assert load_compiled(str(filename), output, str(spec))['database']['size'] == 10
+    assert import_compiled(output)[2] == [str(fragment)]
+    fingerprint = import_compiled(output)[0]
+
+    assert load_compiled(str(filename), output, str(spec))['database']['size'] == 10
+    assert import_compiled(output)[0] == fingerprint
+
+    # The modification of a fragment makes the module stale
+    fragment.write_text('size = 20\n')
+    os.utime(fragment, ns=(10**9, 10**9))
+    assert load_compiled(str(filename), output, str(spec))['database']['size'] == 20
+    assert import_compiled(output)[0] != fingerprint
+
+
+def test_compile_reference(tmp_path, monkeypatch):
+    directory = tmp_path / 'conf'
+    directory.mkdir()
+    shared = directory / 'shared.cfg'
+    shared.write_text('[database]\nport = 5432\n')
+    filename = directory / 'app.cfg'
+    filename.write_text('a = 1\nport = ${shared.cfg::database/port}\nb = ${app.cfg::a}\n')
+    spec = directory / 'spec.cfg'
+    spec.write_text('a = integer\nport = integer\nb = integer\n')
+    output = str(tmp_path / 'app_cfg.py')
+
+    # The referenced files are relative to the configuration file, not to the current directory
+    monkeypatch.chdir(tmp_path)
+    assert load_compiled(str(filename), output)['port'] == '5432'
+    assert load_compiled(str(filename), output, str(spec)).dict() == {'a': 1, 'port': 5432, 'b': 1}
+    assert import_compiled(output)[2] == [str(shared)]
+
+    # The modification of a referenced file makes the module stale
+    shared.write_text('[database]\nport = 5433\n')
+    os.utime(shared, ns=(10**9, 10**9))
+    assert load_compiled(str(filename), output, str(spec))['port'] == 5433
+
+    shared.unlink()
+    with pytest.raises(InterpolationError, match='cannot load'):
+        load_compiled(str(filename), output, str(spec))
+
+
+def test_not_literal(tmp_path):
+    filename = tmp_path / 'app.cfg'
+    filename.write_text('[section]\nx = inf\n')
+    spec = tmp_path / 'spec.cfg'
+    spec.write_text('[section]\nx = float(default=0.0)\n')
+
+    assert config_from_file(str(filename)).validate(config_from_file(str(spec)))['section']['x'] == float('inf')
+
+    with pytest.raises(SerializationError, match=r'\[section\] > x'):
+        load_compiled(str(filename), str(tmp_path / 'app_cfg.py'), str(spec))
+
+
+def test_corrupted(tmp_path):
+    filename = tmp_path / 'app.cfg'
+    filename.write_text(CONFIG)
+    spec = tmp_path / 'spec.cfg'
+    spec.write_text(SPEC)
+    output = tmp_path / 'app_cfg.py'
+
+    c = load_compiled(str(filename), str(output), str(spec), {'here': '/tmp'})
+    assert sorted(os.listdir(tmp_path)) == [
+        '__pycache__',
+        'app.cfg',
+        'app_cfg.py',
+        'spec.cfg',
+    ]  # No temporary file left
+
+    output.write_text(output.read_text()[:50])
+    assert import_compiled(str(output)) is None
+    assert load_compiled(str(filename), str(output), str(spec), {'here': '/tmp'}).dict() == c.dict()
+
+    output.write_text('FINGERPRINT = ""\n')
+    assert import_compiled(str(output)) is None
+    assert load_compiled(str(filename), str(output), str(spec), {'here': '/tmp'}).dict() == c.dict()
+
+
+def test_is_literal():
+    class Level(enum.IntEnum):
+        DEBUG = 10
+
+    class Name(str):
+        pass
+
+    assert is_literal([1, 2.5, True, None, ('a', 'b')])
+    assert not is_literal(Level.DEBUG)
+    assert not is_literal(Name('a'))
+    assert not is_literal([1, Level.DEBUG])
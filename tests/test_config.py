@@ -7,9 +7,27 @@
 # this distribution.
 # --
 
+import sys
+import subprocess
+
 import pytest
 
-from nagare.config import ParseError, SectionError, config_from_string
+from nagare.config import (
+    Section,
+    SourceMap,
+    ParseError,
+    SectionError,
+    MappedSection,
+    ParameterError,
+    AggregatedError,
+    InterpolationError,
+    SpecificationError,
+    config_load,
+    check_encoding,
+    config_from_file,
+    collecting_errors,
+    config_from_string,
+)
 
 
 def test_parse1():
@@ -151,3 +169,436 @@ def test_parse6():
     """
     with pytest.raises(SectionError, match='duplicate section name'):
         c = config_from_string(c)
+
+
+def test_parse7():
+    c = '\n'.join('[section{}]\na = {}'.format(i, i) for i in range(5000))
+    c = config_from_string(c)
+    assert len(c.sections) == 5000
+    assert c['section4999']['a'] == '4999'
+
+
+def test_max_depth(tmp_path):
+    filename = tmp_path / 'app.cfg'
+    filename.write_text(
+        'a = 1\n[section1]\nb = 2\n[[section2]]\nc = 3\nd = """[x]\n"""\n[[[section3]]]\ne = 4\n'
+        '[[section4]]\nf = 5\n[section5]\ng = 6\n'
+    )
+
+    for mapped in (False, True):
+        c = config_from_file(str(filename), max_depth=3, mapped=mapped)
+        assert c.dict() == {
+            'a': '1',
+            'section1': {'b': '2', 'section2': {'c': '3', 'd': '[x]\n'}, 'section4': {'f': '5'}},
+            'section5': {'g': '6'},
+        }
+        c = config_from_file(str(filename), max_depth=2, mapped=mapped)
+        assert c.dict() == {'a': '1', 'section1': {'b': '2'}, 'section5': {'g': '6'}}
+        c = config_from_file(str(filename), max_depth=1, mapped=mapped)
+        assert c.dict() == {'a': '1'}
+
+
+def test_interpolation_order():
+    for c in ('a = $$x\nb = $a', 'b = $a\na = $$x'):
+        assert config_from_string(c).interpolate().dict() == {'a': '$x', 'b': '$x'}
+
+
+def test_memory_report():
+    c = """
+    a = 1
+    b = "x", "y"
+    [section]
+    c = 2
+    """
+    c = config_from_string(c)
+    report = c.memory_report()
+
+    assert set(report) == {'sections', 'keys', 'values', 'lists', 'shared', 'total'}
+    assert report['lists'] == sys.getsizeof(c['b'])
+    assert report['total'] == sum(size for category, size in report.items() if category != 'total')
+
+    name = 'parameter name'
+    c['section'][name] = c[name] = 'value'
+    assert c.memory_report()['shared'] >= report['shared'] + sys.getsizeof(name)
+
+
+def test_lazy_import():
+    code = """
+import sys
+import subprocess
+import nagare.config
+
+assert 'nagare.validate' not in sys.modules
+assert 'match' not in vars(nagare.config.LINE)
+for name in ('json', 'bisect', 'hashlib', 'nagare.config_source'):
+    assert name not in sys.modules, name
+
+config = nagare.config.config_from_string('a = 1')
+assert 'match' in vars(nagare.config.LINE)
+assert nagare.config.Validator is sys.modules['nagare.validate'].Validator
+assert 'nagare.config_source' not in sys.modules
+
+config.fingerprint()
+assert 'hashlib' in sys.modules
+assert nagare.config.SourceMap is sys.modules['nagare.config_source'].SourceMap
+"""
+    subprocess.run([sys.executable, '-c', code], check=True)  # noqa: S603
+
+
+def test_fingerprint():
+    c1 = config_from_string('a = 1\nb = "x", "y"\n[s1]\nc = 2\n[[s11]]\n[s2]\nd = 3\n')
+    c2 = config_from_string('b = "x", "y"\na = 1\n[s2]\nd = 3\n[s1]\nc = 2\n[[s11]]\n')
+    fingerprint = c1.fingerprint()
+    assert c2.fingerprint() == fingerprint
+    assert c1.sections['s2'].fingerprint() == config_from_string('d = 3').fingerprint()
+
+    # Stable across processes
+    code = 'from nagare.config import config_from_string as c; print(c({!r}).fingerprint())'.format(c1.to_string())
+    for seed in ('1', '2'):
+        process = subprocess.run(  # noqa: S603
+            [sys.executable, '-c', code], capture_output=True, text=True, check=True, env={'PYTHONHASHSEED': seed}
+        )
+        assert process.stdout.strip() == fingerprint
+
+    c1['s1']['s11']['e'] = 4
+    assert c1.fingerprint() != fingerprint
+    c1['s1']['s11']['e'] = '4'
+    assert c1.fingerprint() != c2.fingerprint()
+    del c1['s1']['s11']['e']
+    assert c1.fingerprint() == fingerprint
+
+    c1.sections['s1'].sections['s11'] = c1.sections['s2']
+    assert c1.fingerprint() != fingerprint
+
+
+def test_mapped(tmp_path):
+    filename = tmp_path / 'app.cfg'
+    filename.write_bytes(
+        'a = 1\r\nb = "x", \'y\' # c\r\n[s1] # s1\r\nc = """abc\r\ndef\r\n  ghi"""  # d\r\n'
+        "d = '''é'''\n"
+        'e = x, y\n'
+        'f =\n'
+        "h = '''  # Not in the value\n"
+        "'''\n"
+        '[[s11]]\n'
+        'g = "q"\n'.encode('utf-8')
+    )
+    c = config_from_file(str(filename))
+
+    m = config_from_file(str(filename), mapped=True)
+    assert type(m) is MappedSection
+    assert dict.__getitem__(m, 'b') != ['x', 'y']
+    assert m['b'] == ['x', 'y']
+    assert dict.__getitem__(m, 'b') == ['x', 'y']
+    assert m['s1']['d'] == 'é'
+    assert m.get('s1').get('c') == 'abc\ndef\n  ghi'
+    assert m['s1']['h'] == '\n'
+
+    assert m == c
+    assert type(m) is Section
+    assert m.dict() == c.dict()
+    assert m.fingerprint() == c.fingerprint()
+
+    m = config_from_file(str(filename), mapped=True)
+    m['s1']['s11'].freeze()
+    assert m['s1']['s11'] == {'g': 'q'}
+    m['s1']['f'] = 'z'
+    assert m['s1']['e'] == 'x, y'
+    assert type(m['s1']) is Section
+
+    filename.write_text('a = 1\n[s]\n[[[s]]]\n')
+    with pytest.raises(SectionError, match='line #3'):
+        config_from_file(str(filename), mapped=True)
+
+    filename.write_text('')
+    assert config_from_file(str(filename), mapped=True) == {}
+
+    # The values are decoded from a copy of the file, modified in place or truncated
+    filename.write_text('a = hello world\n[s]\nb = 2\n')
+    m = config_from_file(str(filename), mapped=True)
+    with open(filename, 'r+') as f:
+        f.write('a = HELLO WORLD\n')
+    assert m['a'] == 'hello world'
+    filename.write_text('')
+    assert m['s']['b'] == '2'
+
+    filename.write_bytes('a = 1\nb = caf\xe9\n'.encode('latin-1'))
+    with pytest.raises(UnicodeDecodeError, match='position 13'):
+        config_from_file(str(filename), mapped=True)
+
+    with pytest.raises(UnicodeDecodeError, match='position 6'):
+        check_encoding('a = \xe9\xe9'.encode('utf-8')[:-1], 'utf-8', 5)
+    check_encoding('a = \xe9\xe9'.encode('utf-8'), 'utf-8', 5)
+
+
+def test_multilines(tmp_path):
+    blob = '\n' + ''.join('line {} "quoted" # not a comment\n'.format(i) for i in range(100000))
+    filename = tmp_path / 'app.cfg'
+    filename.write_text('[s]\nblob = """{}"""\na = 1\n'.format(blob))
+
+    for mapped in (False, True):
+        c = config_from_file(str(filename), mapped=mapped)
+        assert c['s']['blob'] == blob
+        assert c['s']['a'] == '1'
+
+    assert config_from_string('a = """\n"""')['a'] == '\n'
+    assert config_from_string('a = """x\ny""" # comment\nb = 1') == {'a': 'x\ny', 'b': '1'}
+
+    filename.write_text('a = """x\ny\n')
+    for mapped in (False, True):
+        with pytest.raises(ParseError, match='line #1'):
+            config_from_file(str(filename), mapped=mapped)
+
+
+def test_source_map(tmp_path):
+    filename = tmp_path / 'app.cfg'
+    filename.write_text('a = 1\n[database]\n  port = x\n  [[pool]]\n    size = """\n10\n"""\n    name = $missing\n')
+    spec = config_from_string('a = integer\n[database]\nport = integer\n[[pool]]\nsize = integer\nmin = integer\n')
+
+    for mapped in (False, True):
+        source_map = SourceMap()
+        c = config_from_file(str(filename), mapped=mapped, source_map=source_map)
+        assert c.source_map is source_map
+        assert source_map.find(()) is None
+        assert source_map.find((), 'a') == (str(filename), 1, 1)
+        assert source_map.find(('database',)) == (str(filename), 2, 1)
+        assert source_map.find(('database', 'pool')) == (str(filename), 4, 3)
+        assert source_map.find(('database', 'pool'), 'size') == (str(filename), 5, 5)
+        assert source_map.find(('database', 'pool'), 'name') == (str(filename), 8, 5)
+        assert source_map.find(('database',), 'missing') is None
+
+        with pytest.raises(InterpolationError) as error:
+            c.interpolate()
+        assert error.value.line == 8
+        assert str(error.value).startswith("Error line #8, column #5 of '{}' in section".format(filename))
+
+        del c['database']['pool']['name']
+        with pytest.raises(SpecificationError, match='line #3, column #3 of .* > port'):
+            c.validate(spec)
+
+        c['database']['port'] = '5432'
+        with pytest.raises(ParameterError, match='line #4, column #3 .* > min: required'):
+            c.merge_defaults(spec)
+
+    source_map = SourceMap()
+    config_from_string('a = 1\n[s]\nb = 2', source_map=source_map)
+    config_from_file(str(filename), source_map=source_map)
+    assert source_map.find(('s',), 'b') == (None, 3, 1)
+    assert source_map.find(('database',), 'port') == (str(filename), 3, 3)
+    assert source_map.filenames == [None, str(filename)]
+
+    source_map = SourceMap()
+    config_from_string(''.join('p{} = {}\n'.format(i, i) for i in range(10000)), source_map=source_map)
+    assert len(source_map) == 10001
+    assert source_map.nbytes / len(source_map) < 32
+
+
+def test_collect_errors(tmp_path):
+    filename = tmp_path / 'app.cfg'
+    filename.write_text(
+        'a = 1\n'
+        'invalid\n'
+        'a = 2\n'
+        '[s1]\n'
+        'b = $missing\n'
+        '[[s11]]]\n'
+        'c = 3\n'
+        '[s1]\n'
+        'd = 4\n'
+        '[[[s111]]]\n'
+        '[s2]\n'
+        'b = x\n'
+        'c = """\n'
+        'abc\n'
+    )
+    spec = config_from_string('a = integer\n[s1]\n[s2]\nb = integer\nd = integer\n')
+
+    for mapped in (False, True):
+        with pytest.raises(AggregatedError) as error:
+            with collecting_errors() as errors:
+                c = config_from_file(str(filename), mapped=mapped, source_map=SourceMap(), errors=errors)
+                c.interpolate(errors=errors).merge_defaults(spec, errors=errors).validate(spec, errors=errors)
+
+        assert c.dict() == {'a': 1, 's1': {'b': '$missing'}, 's2': {'b': 'x'}}
+        assert [(type(e), e.line) for e in error.value.errors] == [
+            (ParseError, 2),
+            (ParameterError, 3),
+            (InterpolationError, 5),
+            (SectionError, 6),
+            (SectionError, 8),
+            (SectionError, 10),
+            # Missing parameter, located at its section
+            (ParameterError, 11),
+            (SpecificationError, 12),
+            (ParseError, 13),
+        ]
+        assert error.value.errors[6].name == 'd'
+        assert str(error.value).startswith("9 errors:\n  Error line #2 of '{}': invalid line".format(filename))
+
+    # Without source map, the validation errors are ordered by section path
+    errors = []
+    spec = config_from_string('a = integer\n[__many__]\nb = integer\n')
+    config_from_string('[s2]\nb = x\n[s1]\nb = y', errors=errors).validate(spec, errors=errors)
+    assert [e._sections for e in AggregatedError(errors).errors] == [('s1',), ('s2',)]
+
+    with collecting_errors() as errors:
+        config_from_string('a = 1', errors=errors).validate(spec, errors=errors)
+
+
+def test_file_references(tmp_path, monkeypatch):
+    (tmp_path / 'shared').mkdir()
+    (tmp_path / 'shared' / 'db.cfg').write_text(
+        'port = 5432\n[database]\nhost = db1\nurl = postgres://$host:$port\nloop = ${../app.cfg::/loop}\n'
+    )
+    filename = tmp_path / 'app.cfg'
+    filename.write_text(
+        'loop = ${shared/db.cfg::database/loop}\n'
+        '[database]\n'
+        'host = ${shared/db.cfg::database/host}\n'
+        'url = ${shared/db.cfg::/database/url}\n'
+        'user = ${shared/db.cfg::database/user:admin}\n'
+    )
+
+    c = config_from_file(str(filename))
+    del c['loop']
+    c.interpolate()
+    assert c['database'] == {'host': 'db1', 'url': 'postgres://db1:5432', 'user': 'admin'}
+
+    c = config_from_file(str(filename))
+    with pytest.raises(InterpolationError, match=r"loop 'shared/db.cfg::database/loop' -> '\.\./app.cfg::/loop'"):
+        c.interpolate()
+
+    with pytest.raises(InterpolationError, match="cannot load 'missing.cfg': No such file"):
+        config_from_string('a = ${missing.cfg::a}').interpolate()
+
+    # Relative to the current directory when not parsed from a file
+    monkeypatch.chdir(tmp_path / 'shared')
+    assert config_from_string('a = ${db.cfg::port}').interpolate()['a'] == '5432'
+
+
+def test_only(tmp_path):
+    filename = tmp_path / 'app.cfg'
+    filename.write_text(
+        'name = app\n'
+        '[database]\n'
+        'invalid\n'
+        'script = """\n'
+        '[logging]\n'
+        '"""\n'
+        '[[pool]]\n'
+        'size = 10\n'
+        '[logging]\n'
+        'level = info\n'
+        '[[handlers]]\n'
+        "format = '''\n"
+        'short\n'
+        "'''\n"
+        '[server]\n'
+        'port = 8080\n'
+        '[metrics]\n'
+        'port = 9090, x\n'
+    )
+
+    for mapped in (False, True):
+        source_map = SourceMap()
+        c = config_from_file(str(filename), mapped=mapped, source_map=source_map, only=['logging', 'metrics'])
+        assert c.dict() == {
+            'name': 'app',
+            'logging': {'level': 'info', 'handlers': {'format': '\nshort\n'}},
+            'metrics': {'port': '9090, x'},
+        }
+        assert source_map.find(('logging',), 'level').line == 10
+        assert source_map.find(('metrics',), 'port').line == 18
+
+    assert config_from_string('[a]\nb = 1\n', only=()).dict() == {}
+
+    with pytest.raises(ParseError, match='line #4: no multiline value end found'):
+        config_from_string('[a]\n[b]\nc = 1\nd = """\n', only=['a'])
+
+
+def test_lookup():
+    c = config_from_string(
+        'a = 1\n[apps]\n[[shop]]\n[[[db]]]\nhost = h\n[[[[pool]]]]\nsize = 10\n[[shopping]]\nb = 2\n'
+    )
+
+    assert c.lookup('apps/shop/db/pool/size') == '10'
+    assert c.lookup('/apps/shop/db/') is c['apps']['shop']['db']
+    assert c.lookup('apps/shop/missing', 0) == 0
+    assert c.get_parameter(['apps', 'missing', 'db', 'host']) == ((c,), None, None)
+
+    assert [path for path, _ in c.paths('apps/shop')] == [
+        'apps/shop',
+        'apps/shop/db',
+        'apps/shop/db/host',
+        'apps/shop/db/pool',
+        'apps/shop/db/pool/size',
+    ]
+    assert len(list(c.paths())) == 9
+    assert list(c.paths('missing')) == []
+
+    # Kept consistent with the modifications
+    c['apps']['shop']['db']['pool']['size'] = 20
+    assert c.lookup('apps/shop/db/pool/size') == 20
+    del c['apps']['shop']['db']['host']
+    c['apps']['shop'].sections['cache'] = config_from_string('ttl = 60')
+    assert c.lookup('apps/shop/db/host') is None
+    assert c.lookup('apps/shop/cache/ttl') == '60'
+    assert c.sections['apps'].lookup('shopping/b') == '2'
+
+    # A parameter set is patched into the index, a section attached at two paths in both
+    c = config_from_string('[a]\nx = 1\n[b]\n')
+    c.sections['b'].sections['shared'] = c.sections['a'].sections['shared'] = config_from_string('y = 1')
+    index = c._paths_index()[0]
+    c['a']['shared']['z'] = 2
+    c['a']['x'] = 3
+    assert c._paths_index()[0] is index
+    assert (c.lookup('a/shared/z'), c.lookup('b/shared/z'), c.lookup('a/x')) == (2, 2, 3)
+    assert [path for path, _ in c.paths('b')] == ['b', 'b/shared', 'b/shared/y', 'b/shared/z']
+    c['b']['shared'].clear()
+    assert c.lookup('a/shared/z') is None
+
+    # The modification of a section shared between two trees doesn't invalidate the other trees
+    shared = config_from_string('y = 1')
+    c1, c2, c3 = config_from_string('[s]\n'), config_from_string('[s]\n'), config_from_string('[t]\nz = 1\n')
+    c1.sections['s'].sections['shared'] = c2.sections['s'].sections['shared'] = shared
+    fingerprints = [c.fingerprint() for c in (c1, c2, c3)]
+    shared['y'] = 2
+    assert [c._hash is None for c in (c1, c2, c3)] == [True, True, False]
+    assert c1.fingerprint() == c2.fingerprint() != fingerprints[0]
+
+
+def test_load(tmp_path):
+    spec = config_from_string(
+        'flag = boolean(default=False)\nmsg = string\nport = integer(default=80)\n'
+        '[server]\nurl = string\n[[ssl]]\nenabled = boolean(default=True)\n'
+        '[apps]\n[[__many__]]\nworkers = integer(default=1)\n___many___ = integer\n'
+    )
+    filename = tmp_path / 'app.cfg'
+    filename.write_text(
+        'flag = on\nmsg = $flag-$here\n[server]\nurl = http://$host:${/port:8080}\n[apps]\n[[shop]]\nx = 2\n'
+    )
+
+    for global_config in ({'here': 'h', 'host': 'localhost'}, {'here': 'h', 'host': 'localhost', 'port': 1}):
+        config = config_load(str(filename), spec, global_config)
+        expected = config_from_file(str(filename)).interpolate(global_config).merge_defaults(spec).validate(spec)
+        assert config.dict() == expected.dict()
+
+    assert config.dict() == {
+        'flag': True,
+        'msg': 'on-h',
+        'port': 80,
+        'server': {'url': 'http://localhost:8080', 'ssl': {'enabled': True}},
+        'apps': {'shop': {'workers': 1, 'x': 2}},
+    }
+
+    filename.write_text('msg = $missing\nport = x\n[apps]\n[[shop]]\nworkers = y\n')
+    with pytest.raises(AggregatedError) as error:
+        with collecting_errors() as errors:
+            config_load(str(filename), spec, source_map=SourceMap(), errors=errors)
+
+    assert [(type(e), e.line) for e in error.value.errors] == [
+        (InterpolationError, 1),
+        (SpecificationError, 2),
+        (SpecificationError, 5),
+        (ParameterError, None),
+    ]
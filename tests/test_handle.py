@@ -0,0 +1,92 @@
+# --
+# Copyright (c) 2014-2026 Net-ng.
+# All rights reserved.
+#
+# This software is licensed under the BSD License, as described in
+# the file LICENSE.txt, which you should have received as part of
+# this distribution.
+# --
+
+import threading
+
+import pytest
+
+from nagare.config import Section, config_from_string
+from nagare.config_handle import ConfigHandle
+
+
+def test_freeze():
+    c = config_from_string('a = 1\n[s1]\nb = 2\n[[s11]]\nc = 3\n')
+    fingerprint = c.fingerprint()
+    assert c.freeze() is c
+
+    s11 = c['s1']['s11']
+    for modification in (
+        lambda: s11.__setitem__('c', 4),
+        lambda: s11.update(c=4),
+        lambda: s11.pop('c'),
+        lambda: s11.clear(),
+        lambda: c['s1'].sections.pop('s11'),
+        lambda: c.sections.__setitem__('s2', Section()),
+        lambda: setattr(c, 'sections', {}),
+        lambda: c.merge(config_from_string('a = 2')),
+        lambda: c.interpolate(),
+        lambda: c.validate(config_from_string('a = integer')),
+    ):
+        with pytest.raises(TypeError, match='frozen'):
+            modification()
+
+    assert c.dict() == {'a': '1', 's1': {'b': '2', 's11': {'c': '3'}}}
+    assert c.fingerprint() == fingerprint
+
+    spec = config_from_string('a = string_list\n[s1]\nb = string_list\n')
+    c = config_from_string('a = 1,2\n[s1]\nb = 3,4\n').validate(spec)
+    c['s1']['c'] = [['x'], 'y']
+    assert dict(c.paths())['s1/b'] == ['3', '4']
+    c.freeze()
+    assert c['a'] == ('1', '2')
+    assert c['s1'].dict() == {'b': ('3', '4'), 'c': (('x',), 'y')}
+    assert dict(c.paths()) == {'a': ('1', '2'), 's1': c['s1'], 's1/b': ('3', '4'), 's1/c': (('x',), 'y')}
+
+
+def test_handle():
+    handle = ConfigHandle(config_from_string('a = 1'))
+    assert handle.generation == 0
+
+    with handle.read() as config:
+        snapshot = handle.reload(lambda: config_from_string('a = 2'))
+        assert config['a'] == '1'
+
+    assert snapshot.generation == handle.generation == 1
+    assert handle.config['a'] == '2'
+
+    with pytest.raises(ValueError):
+        handle.reload(lambda: config_from_string('['))
+
+    assert handle.snapshot is snapshot
+
+
+def test_concurrent_reads():
+    handle = ConfigHandle(config_from_string('a = 0\nb = 0'))
+    stop = threading.Event()
+    inconsistencies = []
+
+    def read():
+        while not stop.is_set():
+            with handle.read() as config:
+                if config['a'] != config['b']:
+                    inconsistencies.append(config)
+
+    readers = [threading.Thread(target=read) for _ in range(4)]
+    for reader in readers:
+        reader.start()
+
+    for i in range(1, 200):
+        handle.publish(config_from_string('a = {0}\nb = {0}'.format(i)))
+
+    stop.set()
+    for reader in readers:
+        reader.join()
+
+    assert not inconsistencies
+    assert handle.generation == 199
@@ -0,0 +1,132 @@
+# --
+# Copyright (c) 2014-2026 Net-ng.
+# All rights reserved.
+#
+# This software is licensed under the BSD License, as described in
+# the file LICENSE.txt, which you should have received as part of
+# this distribution.
+# --
+
+import os
+
+import pytest
+
+from nagare.config import (
+    SourceMap,
+    ParseError,
+    DirectiveError,
+    ParameterError,
+    config_from_file,
+    config_from_string,
+)
+from nagare.config_include import INCLUDES
+
+
+@pytest.fixture(autouse=True)
+def includes():
+    INCLUDES.clear()
+    yield INCLUDES
+    INCLUDES.clear()
+
+
+def write(filename, content, mtime=None):
+    filename.parent.mkdir(parents=True, exist_ok=True)
+    filename.write_text(content)
+    if mtime is not None:
+        os.utime(filename, ns=(mtime, mtime))
+
+    return str(filename)
+
+
+def test_include(tmp_path, monkeypatch, includes):
+    write(tmp_path / 'common' / 'logging.cfg', 'level = info\n[handlers]\n[[console]]\nformat = short\n')
+    write(tmp_path / 'common' / 'pool.cfg', 'size = 10\n[$(include ../common/timeouts.cfg)]\n')
+    write(tmp_path / 'common' / 'timeouts.cfg', 'timeout = 30\n')
+
+    for i in range(3):
+        write(
+            tmp_path / 'tenant{}.cfg'.format(i),
+            'name = tenant{}\n[$(include common/logging.cfg)]\n[database]\n[[$(include common/pool.cfg)]]\nhost = db\n'
+            '[[replica]]\n'.format(i),
+        )
+
+    for mapped in (False, True):
+        configs = [config_from_file(str(tmp_path / 'tenant{}.cfg'.format(i)), mapped=mapped) for i in range(3)]
+        assert configs[2].dict() == {
+            'name': 'tenant2',
+            'level': 'info',
+            'handlers': {'console': {'format': 'short'}},
+            'database': {'size': '10', 'timeout': '30', 'host': 'db', 'replica': {}},
+        }
+
+    # Each fragment parsed once, each inclusion being a new copy
+    assert (includes.misses, includes.hits) == (3, 10)
+    configs[0]['handlers']['console']['format'] = 'long'
+    assert configs[1]['handlers']['console']['format'] == 'short'
+
+    # The modification of a nested fragment invalidates its parents
+    write(tmp_path / 'common' / 'timeouts.cfg', 'timeout = 60\n', 10**9)
+    assert config_from_file(str(tmp_path / 'tenant0.cfg'))['database']['timeout'] == '60'
+    assert includes.misses == 5
+
+    # Relative to the current directory when not parsed from a file
+    monkeypatch.chdir(tmp_path)
+    assert config_from_string('[$(include common/timeouts.cfg)]')['timeout'] == '60'
+
+
+def test_include_encoding(tmp_path, includes):
+    (tmp_path / 'names.cfg').write_text('name = caf\xe9\n', encoding='latin-1')
+    filename = write(tmp_path / 'app.cfg', '[$(include names.cfg)]\n')
+
+    for mapped in (False, True):
+        assert config_from_file(filename, encoding='latin-1', mapped=mapped)['name'] == 'caf\xe9'
+
+    # The fragment read with another encoding is parsed again
+    with pytest.raises(UnicodeDecodeError):
+        config_from_file(filename)
+
+    assert (includes.misses, includes.hits) == (2, 1)
+
+
+def test_include_source_map(tmp_path):
+    fragment = write(tmp_path / 'pool.cfg', 'size = 10\n[options]\n  retry = on\n')
+    filename = write(tmp_path / 'app.cfg', 'a = 1\n[database]\nhost = db\n[[$(include pool.cfg)]]\n')
+
+    source_map = SourceMap()
+    config_from_file(filename, source_map=source_map)
+    assert source_map.find(('database',), 'host') == (filename, 3, 1)
+    assert source_map.find(('database',), 'size') == (fragment, 1, 1)
+    assert source_map.find(('database', 'options'), 'retry') == (fragment, 3, 3)
+
+
+def test_include_errors(tmp_path):
+    write(tmp_path / 'a.cfg', 'a = 1\n[$(include b.cfg)]\n')
+    write(tmp_path / 'b.cfg', '[s]\n[[$(include a.cfg)]]\n')
+    write(tmp_path / 'c.cfg', 'c = 1\ninvalid\n')
+    write(tmp_path / 'h.cfg', 'c = 1\n')
+
+    with pytest.raises(DirectiveError, match=r"line #2 of '.*b\.cfg' in section \[s\] > include: include cycle"):
+        config_from_file(str(tmp_path / 'a.cfg'))
+
+    with pytest.raises(DirectiveError, match="include cycle '.*self.cfg' -> '.*self.cfg'"):
+        config_from_file(write(tmp_path / 'self.cfg', '[$(include self.cfg)]\n'))
+
+    with pytest.raises(DirectiveError, match="cannot include '.*missing.cfg': No such file"):
+        config_from_file(write(tmp_path / 'd.cfg', '[$(include missing.cfg)]\n'))
+
+    with pytest.raises(ParseError, match=r"line #2 of '.*c\.cfg': invalid line"):
+        config_from_file(write(tmp_path / 'e.cfg', '[$(include c.cfg)]\n'))
+
+    with pytest.raises(ParameterError, match='line #2 .* c: duplicate parameter name'):
+        config_from_file(write(tmp_path / 'f.cfg', 'c = 2\n[$(include h.cfg)]\n'))
+
+    with pytest.raises(DirectiveError, match='invalid directive'):
+        config_from_string('[$(exclude c.cfg)]')
+
+    errors = []
+    c = config_from_file(write(tmp_path / 'g.cfg', 'c = 2\n[$(include c.cfg)]\nd = 3\n'), errors=errors)
+    assert [(type(e), e.line, os.path.basename(e.filename)) for e in errors] == [
+        (ParseError, 2, 'c.cfg'),
+        (ParameterError, 2, 'g.cfg'),
+    ]
+    assert c.dict() == {'c': '2', 'd': '3'}
@@ -0,0 +1,119 @@
+# --
+# Copyright (c) 2014-2026 Net-ng.
+# All rights reserved.
+#
+# This software is licensed under the BSD License, as described in
+# the file LICENSE.txt, which you should have received as part of
+# this distribution.
+# --
+
+from nagare.config import Timings, Instrumentation, config_from_file, config_from_string
+
+CONFIG = """
+a = 1
+b = $a
+
+[section1]
+x = ${a}
+[[sub]]
+y = 2
+
+[section2]
+z = $$3
+"""
+
+SPEC = """
+a = integer
+[section1]
+x = integer
+[[sub]]
+y = integer
+w = integer(default=4)
+[__many__]
+z = string
+"""
+
+
+def test_events():
+    events = []
+
+    class Events(Instrumentation):
+        def start(self, phase, section=None):
+            events.append(('start', phase, section))
+
+        def end(self, phase, section=None, elapsed=0.0, **counters):
+            events.append(('end', phase, section))
+
+    instrumentation = Events()
+    c = config_from_string(CONFIG, instrumentation=instrumentation)
+    c.interpolate(instrumentation=instrumentation)
+
+    assert events == [
+        ('start', 'parse', None),
+        ('start', 'parse', 'section1'),
+        ('end', 'parse', 'section1'),
+        ('start', 'parse', 'section2'),
+        ('end', 'parse', 'section2'),
+        ('end', 'parse', None),
+        ('start', 'interpolate', None),
+        ('start', 'interpolate', 'section1'),
+        ('end', 'interpolate', 'section1'),
+        ('start', 'interpolate', 'section2'),
+        ('end', 'interpolate', 'section2'),
+        ('end', 'interpolate', None),
+    ]
+
+
+def test_counters():
+    timings = Timings()
+    spec = config_from_string(SPEC)
+
+    c = config_from_string(CONFIG, instrumentation=timings)
+    c.interpolate(instrumentation=timings)
+    c.merge_defaults(spec, instrumentation=timings)
+    c.validate(spec, instrumentation=timings)
+
+    counters = {(phase, section): counters for phase, section, _, counters in timings.records}
+
+    assert counters['parse', None] == {
+        'lines': 11,
+        'sections': 3,
+        'parameters': 5,
+        'interpolations': 0,
+        'cache_hits': 0,
+    }
+    assert counters['parse', 'section1']['lines'] == 5
+    assert counters['parse', 'section2']['lines'] == 2
+
+    assert counters['interpolate', None]['interpolations'] == 2
+    assert counters['interpolate', 'section1']['interpolations'] == 1
+    assert counters['interpolate', 'section2']['interpolations'] == 0
+
+    assert counters['merge_defaults', None]['parameters'] == 6
+    assert counters['validate', 'section1']['cache_hits'] == 2
+
+    assert set(timings.phases()) == {'parse', 'interpolate', 'merge_defaults', 'validate'}
+    assert c.dict() == {'a': 1, 'b': '1', 'section1': {'x': 1, 'sub': {'y': 2, 'w': 4}}, 'section2': {'z': '$3'}}
+
+
+def test_include_counters(tmp_path):
+    (tmp_path / 'pool.cfg').write_text('size = 10\n[options]\nretry = on\n')
+    (tmp_path / 'logging.cfg').write_text('level = info\n[handlers]\n[[console]]\n')
+    filename = tmp_path / 'app.cfg'
+    filename.write_text('a = 1\n[database]\nhost = db\n[[$(include pool.cfg)]]\n[$(include logging.cfg)]\nb = 2\n')
+
+    for mapped in (False, True):
+        timings = Timings()
+        c = config_from_file(str(filename), instrumentation=timings, mapped=mapped)
+        counters = {(phase, section): counters for phase, section, _, counters in timings.records}
+
+        assert (counters['parse', 'database']['sections'], counters['parse', 'database']['parameters']) == (1, 3)
+        assert counters['parse', 'database']['lines'] == 3
+        assert (counters['parse', None]['sections'], counters['parse', None]['parameters']) == (4, 6)
+        assert c.dict() == {
+            'a': '1',
+            'level': 'info',
+            'b': '2',
+            'database': {'host': 'db', 'size': '10', 'options': {'retry': 'on'}},
+            'handlers': {'console': {}},
+        }
@@ -0,0 +1,155 @@
+# --
+# Copyright (c) 2014-2026 Net-ng.
+# All rights reserved.
+#
+# This software is licensed under the BSD License, as described in
+# the file LICENSE.txt, which you should have received as part of
+# this distribution.
+# --
+
+import io
+import copy
+import pickle
+import datetime
+
+import pytest
+
+from nagare.config import (
+    Section,
+    SourceMap,
+    ConfigError,
+    FrozenSection,
+    MappedSection,
+    SerializationError,
+    dumps,
+    loads,
+    config_from_dict,
+    config_from_file,
+    config_from_json,
+    config_from_string,
+)
+
+
+def test_round_trip():
+    c = '''
+    a = 1
+    b = "x # y"
+    c = 'say "hello"'
+    d = "e", 'f "g"', "h, i"
+    "j = k" = ""
+    l = """first
+    second # not a comment
+    it's "quoted"
+    """
+    [section 1]
+    m = $a
+    [["sub # section"]]
+    n = '[not a section]'
+    [section 2]
+    '''
+    c = config_from_string(c)
+    for indent in (0, 4):
+        s = c.to_string(indent)
+        assert config_from_string(s).dict() == c.dict()
+
+    out = io.StringIO()
+    c.write(out, buffer_size=10)
+    assert out.getvalue() == c.to_string()
+
+
+def test_non_string_values():
+    c = config_from_dict({'a': 1, 'b': True, 'c': [1, 2], 'section': {'d': 1.5}})
+    assert config_from_string(c.to_string()).dict() == {'a': '1', 'b': 'True', 'c': ['1', '2'], 'section': {'d': '1.5'}}
+
+
+def test_errors():
+    for value in (['a'], [], ['a', 'b\nc'], '#\nx', 'a\'\'\'b"""c', 'a\rb', ['"\'', 'x']):
+        with pytest.raises(SerializationError):
+            config_from_dict({'section': {'a': value}}).to_string()
+
+    with pytest.raises(SerializationError, match=r'\[section\] > a"\''):
+        config_from_dict({'section': {'a"\'': 1}}).to_string()
+
+    for d in ({'': 1}, {'section': {'': 1}}, {'': {'a': 1}}, {'section': {'': {}}}):
+        with pytest.raises(SerializationError, match='empty name'):
+            config_from_dict(d).to_string()
+
+
+def test_binary():
+    c = config_from_dict({'a': 1, 'b': [1, 'x'], 'c': None, 's1': {'d': 'e', 's11': {'f': 1.5}}, 's2': {}})
+    data = dumps(c)
+    assert loads(data).dict() == c.dict()
+    assert list(loads(data).sections) == ['s1', 's2']
+
+    c = pickle.loads(pickle.dumps(c))  # noqa: S301
+    assert c.sections['s1'].sections['s11']['f'] == 1.5
+
+    # Deep trees are not limited by the recursion limit
+    c = config_from_string(''.join('{}x{}\n'.format('[' * i, ']' * i) for i in range(1, 2000)))
+    assert len(list(loads(dumps(c)).walk())) == 2000
+
+    with pytest.raises(SerializationError):
+        dumps(config_from_dict({'a': object()}))
+
+    with pytest.raises(ConfigError):
+        loads(b'not a configuration')
+
+
+def test_json():
+    c = config_from_json('{"a": 1, "b": [1, "x"], "s1": {"c": true, "s11": {}}}')
+    assert c.dict() == {'a': 1, 'b': [1, 'x'], 's1': {'c': True, 's11': {}}}
+    assert list(c.sections['s1'].sections) == ['s11']
+
+    with pytest.raises(ConfigError):
+        config_from_json('[1, 2]')
+
+    with pytest.raises(ConfigError, match='invalid JSON document'):
+        config_from_json('{"a": ')
+
+
+def test_copy():
+    c = config_from_dict({'a': datetime.date(2020, 1, 1), 'b': [1], 's': {'c': 1}})
+
+    for copied in (pickle.loads(pickle.dumps(c)), copy.deepcopy(c)):  # noqa: S301
+        assert copied.dict() == c.dict()
+        assert copied.sections['s'] is not c.sections['s']
+        assert copied['b'] is not c['b']
+
+    copied = copy.copy(c)
+    assert copied.dict() == c.dict()
+    assert (copied.sections['s'] is c.sections['s']) and (copied['b'] is c['b'])
+
+    c = config_from_string('a = 1\n[s]\nb = 2\n')
+    c.filename = 'app.cfg'
+    for copied in (pickle.loads(pickle.dumps(c)), copy.deepcopy(c), copy.copy(c)):  # noqa: S301
+        assert copied.filename == 'app.cfg'
+
+    source_map = SourceMap()
+    c = config_from_string('a = 1\n[s]\nb = 2\n', source_map=source_map)
+    for copied in (pickle.loads(pickle.dumps(c)), copy.deepcopy(c), copy.copy(c)):  # noqa: S301
+        assert copied.source_map.find(('s',), 'b') == source_map.find(('s',), 'b')
+        assert copied.fingerprint() == c.fingerprint()
+
+
+def test_copy_types(tmp_path):
+    for c in (config_from_string('a = 1\n[s]\nb = 2\n'), config_from_dict({'a': datetime.date(2020, 1, 1), 's': {}})):
+        c['l'] = [1, 2]
+        c.freeze()
+        for copied in (pickle.loads(pickle.dumps(c)), copy.deepcopy(c), copy.copy(c)):  # noqa: S301
+            assert type(copied) is FrozenSection
+            assert type(copied.sections['s']) is FrozenSection
+            assert copied.dict() == c.dict()
+            with pytest.raises(TypeError, match='frozen'):
+                copied['a'] = 2
+            with pytest.raises(TypeError, match='frozen'):
+                copied.sections['t'] = Section()
+
+    filename = tmp_path / 'app.cfg'
+    filename.write_text('a = 1\nb = "x, y"\n[s]\nc = 2, 3\n')
+    c = config_from_file(str(filename), mapped=True)
+    assert c['a'] == '1'
+    for copied in (pickle.loads(pickle.dumps(c)), copy.deepcopy(c), copy.copy(c)):  # noqa: S301
+        assert type(copied) is MappedSection
+        assert copied.dict() == {'a': '1', 'b': 'x, y', 's': {'c': '2, 3'}}
+
+    assert type(c) is MappedSection
@@ -0,0 +1,91 @@
+# --
+# Copyright (c) 2014-2026 Net-ng.
+# All rights reserved.
+#
+# This software is licensed under the BSD License, as described in
+# the file LICENSE.txt, which you should have received as part of
+# this distribution.
+# --
+
+import multiprocessing
+
+import pytest
+
+from nagare.config import ConfigError, SerializationError, config_from_string
+from nagare.config_shared import SharedConfigReader, SharedConfigPublisher
+
+CONFIG = """
+b = 1
+a = "x", "y"
+[server]
+workers = 4
+host = localhost
+[[ssl]]
+enabled = on
+[database]
+"""
+
+
+def read_workers(name, queue):
+    queue.put(SharedConfigReader(name).config['server']['workers'])
+
+
+@pytest.fixture
+def publisher():
+    publisher = SharedConfigPublisher()
+    yield publisher
+    publisher.close()
+
+
+def test_shared(publisher):
+    config = config_from_string(CONFIG)
+    config['c'] = None
+    config['server']['workers'] = 4
+    config['server']['ssl']['port'] = 443.5
+
+    reader = SharedConfigReader(publisher.name)
+    with pytest.raises(ConfigError, match='no configuration'):
+        reader.config
+
+    assert publisher.publish(config) == 1
+    shared = reader.config
+    assert reader.generation == 1
+    assert shared.dict() == config.dict()
+    assert list(shared) == ['a', 'b', 'c']
+    assert list(shared.sections) == ['database', 'server']
+    assert shared['server']['ssl']['port'] == 443.5
+    assert 'workers' in shared['server']
+    assert 'ssl' not in shared['server']
+    assert shared.section('missing') is None
+    with pytest.raises(KeyError):
+        shared['server']['missing']
+
+    config['server']['workers'] = 8
+    assert publisher.publish(config) == 2
+    assert reader.config['server']['workers'] == 8
+    assert reader.generation == 2
+    # The previous configuration is still mapped
+    assert shared['server']['workers'] == 4
+
+    config['server']['workers'] = object()
+    with pytest.raises(SerializationError, match=r'\[server\] > workers'):
+        publisher.publish(config)
+
+    reader.close()
+
+
+def test_workers(publisher):
+    publisher.publish(config_from_string(CONFIG))
+
+    context = multiprocessing.get_context('fork')
+    queue = context.Queue()
+    workers = [context.Process(target=read_workers, args=(publisher.name, queue)) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert [queue.get() for _ in workers] == ['4'] * 4
+
+    # Not destroyed by the exit of the workers
+    assert SharedConfigReader(publisher.name).config['server']['host'] == 'localhost'
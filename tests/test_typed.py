@@ -0,0 +1,74 @@
+# --
+# Copyright (c) 2014-2026 Net-ng.
+# All rights reserved.
+#
+# This software is licensed under the BSD License, as described in
+# the file LICENSE.txt, which you should have received as part of
+# this distribution.
+# --
+
+import dataclasses
+
+import pytest
+
+from nagare.config import ParameterError, SpecificationError, config_from_string
+from nagare.config_typed import typed, accessor_class
+
+SPEC = """
+name = string(default=app)
+[database]
+port = integer(default=5432)
+hosts = string_list(default=list())
+timeout = float(default=0.5)
+user = string
+[apps]
+[[__many__]]
+url = string
+class = string(default=x)
+[env]
+___many___ = integer
+"""
+
+
+def test_typed():
+    spec = config_from_string(SPEC)
+    config = config_from_string('[database]\nport = 1\nuser = u\n[apps]\n[[shop]]\nurl = /shop\n[env]\na = 1\n')
+    cfg = typed(config.merge_defaults(spec).validate(spec), spec)
+
+    assert (cfg.name, cfg.database.port, cfg.database.hosts, cfg.database.timeout) == ('app', 1, [], 0.5)
+    assert cfg.apps.__many__['shop'].url == '/shop'
+    assert cfg.apps.__many__['shop'].class_ == 'x'
+    assert cfg.env.___many___ == {'a': 1}
+    assert type(cfg.apps.__many__['shop']).__qualname__ == 'Config.Apps.Many'
+
+    assert {field.name: field.type for field in dataclasses.fields(cfg.database)} == {
+        'port': int,
+        'hosts': list[str],
+        'timeout': float,
+        'user': str,
+    }
+    assert not hasattr(cfg, '__dict__')
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        cfg.name = 'other'
+
+    # Generated once by specification
+    assert type(cfg) is accessor_class(config_from_string(SPEC))
+
+    with pytest.raises(ParameterError, match=r'\[database\] > user: required'):
+        typed(config_from_string('[apps]\n[env]\n').merge_defaults(spec, errors=[]), spec)
+
+
+def test_duplicate_attributes():
+    with pytest.raises(SpecificationError, match=r"\[database\] > a_b: names 'a-b' and 'a_b' have the same attribute"):
+        accessor_class(config_from_string('[database]\na-b = integer\na_b = integer\n'))
+
+    with pytest.raises(SpecificationError, match="names 'a-b' and 'a b' have the same attribute 'a_b'"):
+        accessor_class(config_from_string('a-b = integer\n[a b]\n'))
+
+
+def test_reserved_attributes():
+    with pytest.raises(SpecificationError, match=r"\[database\] > of: reserved attribute 'of'"):
+        accessor_class(config_from_string('[database]\nof = integer\n'))
+
+    with pytest.raises(SpecificationError, match="_sections: reserved attribute '_sections'"):
+        accessor_class(config_from_string('[_sections]\n'))
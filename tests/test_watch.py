@@ -0,0 +1,241 @@
+# --
+# Copyright (c) 2014-2026 Net-ng.
+# All rights reserved.
+#
+# This software is licensed under the BSD License, as described in
+# the file LICENSE.txt, which you should have received as part of
+# this distribution.
+# --
+
+import os
+import threading
+
+import pytest
+
+from nagare.config import Section, diff, loads, dumps, config_from_file, config_from_string
+from nagare.config_watch import ConfigWatcher, PathSubscriptions
+from nagare.config_handle import ConfigHandle
+
+
+def test_diff():
+    c1 = config_from_string("""
+    a = 1
+    b = 2
+    [s1]
+    c = 3
+    [[s11]]
+    d = 4
+    [s2]
+    """)
+    c2 = config_from_string("""
+    a = 1
+    b = 3
+    e = 5
+    [s1]
+    c = 3
+    [[s11]]
+    [s3]
+    """)
+
+    d = diff(c1, c2)
+    assert d.changed == {('b',): ('2', '3')}
+    assert d.added == {('e',): '5', ('s3',): c2.sections['s3']}
+    assert d.removed == {('s2',): c1.sections['s2'], ('s1', 's11', 'd'): '4'}
+
+    assert not diff(c1, config_from_string(c1.to_string()))
+
+
+def test_diff_hashes():
+    c1 = config_from_string(''.join('[s{}]\na = 1\n[[sub]]\nb = "2", "3"\n'.format(i) for i in range(100)))
+    c2 = loads(dumps(c1))
+
+    assert c1.fingerprint() == c2.fingerprint()
+    assert not diff(c1, c2)
+
+    c2['s50']['sub']['b'] = ['2', '4']
+    # Only the fingerprints along the modified path are invalidated
+    assert [names for names, section in c2.walk() if section._hash is None] == [(), ('s50',), ('s50', 'sub')]
+    assert c1.fingerprint() != c2.fingerprint()
+    assert diff(c1, c2).changed == {('s50', 'sub', 'b'): (['2', '3'], ['2', '4'])}
+
+    c2['s50']['sub']['b'] = ['2', '3']
+    assert not diff(c1, c2)
+
+    c2.sections['s10'].sections['sub2'] = Section({'c': '4'})
+    assert list(diff(c1, c2).added) == [('s10', 'sub2')]
+
+    c2.sections['s10'].sections.pop('sub2')
+    c2.sections['s20'].sections['sub'].update(c='5')
+    assert diff(c1, c2).added == {('s20', 'sub', 'c'): '5'}
+
+    del c2.sections['s20'].sections['sub']['c']
+    c2.sections['s30'].sections = {}
+    assert diff(c1, c2).removed == {('s30', 'sub'): c1.sections['s30'].sections['sub']}
+
+    # Section shared between two configurations
+    shared = c2.sections['s40']
+    c3 = Section()
+    c3.sections['s'] = shared
+    c3.fingerprint()
+    shared['a'] = '2'
+    assert diff(c1, c2).changed == {('s40', 'a'): ('1', '2')}
+
+
+def test_path_subscriptions():
+    c1 = config_from_string("""
+    [database]
+    host = localhost
+    [apps]
+    [[app1]]
+    workers = 2
+    [[app2]]
+    workers = 4
+    debug = off
+    """)
+    c2 = config_from_string("""
+    [database]
+    host = db
+    [apps]
+    [[app1]]
+    workers = 2
+    [[app2]]
+    workers = 8
+    debug = on
+    [[app3]]
+    workers = 1
+    """)
+
+    calls = {}
+    subscriptions = PathSubscriptions()
+    for pattern in ('database/*', 'database', 'apps/__many__/workers', 'apps/app1', 'logging', '/', 'apps/*/x/y'):
+        subscriptions.subscribe(pattern, lambda d, config, pattern=pattern: calls.setdefault(pattern, d))
+
+    subscriptions.dispatch(diff(c1, c2), c2)
+    # `apps/*/x/y` intersects the added `apps/app3` section
+    assert sorted(calls) == ['/', 'apps/*/x/y', 'apps/__many__/workers', 'database', 'database/*']
+    assert calls['database/*'].changed == calls['database'].changed == {('database', 'host'): ('localhost', 'db')}
+    assert calls['apps/__many__/workers'].changed == {('apps', 'app2', 'workers'): ('4', '8')}
+    assert calls['apps/__many__/workers'].added == {('apps', 'app3'): c2['apps']['app3']}
+    assert not calls['apps/__many__/workers'].removed
+    assert len(calls['/'].changed) == 3
+
+    subscriber = calls.clear
+    subscriptions.subscribe('apps/app1/workers', subscriber)
+    subscriptions.unsubscribe('apps/app1/workers', subscriber)
+    with pytest.raises(ValueError):
+        subscriptions.unsubscribe('apps/app1/workers', subscriber)
+    assert subscriptions.root.children['apps'].children['app1'].nb_subscribers == 1
+
+
+def touch(filename, content, mtime):
+    with open(filename, 'w') as f:
+        f.write(content)
+    os.utime(filename, ns=(mtime, mtime))
+
+
+def test_watcher(tmp_path):
+    filename = str(tmp_path / 'app.cfg')
+    touch(filename, 'a = 1\n[s]\nb = 1\n', 10**9)
+
+    errors = []
+    changes = []
+
+    spec = config_from_string('a = integer\n[s]\nb = integer\n')
+    handle = ConfigHandle()
+    watcher = ConfigWatcher(
+        lambda: config_from_file(filename).validate(spec), [filename], on_error=errors.append, handle=handle
+    )
+    watcher.subscribe(lambda diff, config: changes.append(diff))
+    watcher.subscribe(lambda diff, config: changes.append(list(diff.changed)), 's/b')
+    watcher.subscribe(lambda diff, config: changes.append(None), 'a')
+    assert watcher.config['s']['b'] == 1
+
+    assert watcher.check(0) is None
+
+    # Burst of writes
+    touch(filename, 'a = 1\n[s]\nb = 2\n', 2 * 10**9)
+    assert watcher.check(1) is None
+    touch(filename, 'a = 1\n[s]\nb = 3\n', 3 * 10**9)
+    assert watcher.check(1.1) is None
+    assert watcher.check(1.2) is None
+
+    d = watcher.check(1.4)
+    assert d.changed == {('s', 'b'): (1, 3)}
+    assert watcher.config['s']['b'] == 3
+    assert changes == [d, [('s', 'b')]]
+    assert handle.config is watcher.config
+    assert handle.generation == 2
+
+    # Touched, same content
+    touch(filename, 'a = 1\n[s]\nb = 3\n', 4 * 10**9)
+    assert watcher.check(2) is None
+    assert watcher.check(3) is None
+    assert len(changes) == 2
+
+    # Invalid content
+    touch(filename, 'a = 1\n[s]\nb = x\n', 5 * 10**9)
+    assert watcher.check(4) is None
+    assert watcher.check(5) is None
+    assert watcher.config['s']['b'] == 3
+    assert errors == [watcher.error]
+    assert watcher.check(6) is None
+    assert len(errors) == 1
+
+
+def test_watcher_dependencies(tmp_path):
+    filename = str(tmp_path / 'app.cfg')
+    fragment = str(tmp_path / 'conf' / 'fragment.cfg')
+    shared = str(tmp_path / 'shared.cfg')
+    os.mkdir(tmp_path / 'conf')
+    touch(fragment, 'a = 1\n', 10**9)
+    touch(shared, 'b = 2\n', 10**9)
+    touch(filename, 'c = ${shared.cfg::b}\n[$(include conf/fragment.cfg)]\n', 10**9)
+
+    errors = []
+    changes = []
+
+    def failing(diff, config):
+        raise ValueError('subscriber error')
+
+    watcher = ConfigWatcher(lambda: config_from_file(filename).interpolate(), [filename], on_error=errors.append)
+    watcher.subscribe(failing)
+    watcher.subscribe(lambda diff, config: changes.append(diff))
+    watcher.subscribe(failing, 'a')
+    watcher.subscribe(lambda diff, config: changes.append(list(diff.changed)), 'a')
+    assert watcher.filenames == [filename, fragment, shared]
+
+    # Included fragment
+    touch(fragment, 'a = 2\n', 2 * 10**9)
+    assert watcher.check(0) is None
+    d = watcher.check(1)
+    assert d.changed == {('a',): ('1', '2')}
+    assert changes == [d, [('a',)]]
+    assert [str(error) for error in errors] == ['subscriber error'] * 2
+
+    # Referenced file
+    touch(shared, 'b = 3\n', 3 * 10**9)
+    assert watcher.check(2) is None
+    assert watcher.check(3).changed == {('c',): ('2', '3')}
+
+    # The dependencies are not watched anymore
+    touch(filename, 'c = 4\n', 4 * 10**9)
+    assert watcher.check(4) is None
+    assert watcher.check(5).removed == {('a',): '2'}
+    assert watcher.filenames == [filename]
+
+
+def test_watcher_thread(tmp_path):
+    filename = str(tmp_path / 'app.cfg')
+    touch(filename, 'a = 1\n', 10**9)
+
+    reloaded = threading.Event()
+    watcher = ConfigWatcher(lambda: config_from_file(filename), [filename], interval=0.01, debounce=0.01)
+    watcher.subscribe(lambda diff, config: reloaded.set())
+
+    watcher.start()
+    try:
+        touch(filename, 'a = 2\n', 2 * 10**9)
+        assert reloaded.wait(5)
+        assert watcher.config['a'] == '2'
+    finally:
+        watcher.stop()